@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+Real-world benchmark and equivalence check of the Docapy engine.
+
+By  default  the  corpus  is  the  standard  library of the running Python
+interpreter  (its  Lib/  directory)  and  its  site-packages.  Everything is
+local : this script never uses the network.
+
+For  each  stage  (generate_doc,  detect_imports  and parse_docstr) it reports
+the  number  of  files,  lines  and HTML bytes processed per second, and the
+files that crash or time out.
+
+Run it from the Docapy directory :
+
+    python benchmarks/bench_corpus.py
+    python benchmarks/bench_corpus.py --limit 500 --timeout 2
+
+To  check  that  another  version  of  Docapy  (for example a faster engine)
+gives the same output, give the path of its docapy.py file :
+
+    git show HEAD~1:docapy.py > /tmp/docapy_old.py
+    python benchmarks/bench_corpus.py --compare /tmp/docapy_old.py
+
+Every file for which the two versions differ is listed.
+"""
+
+import argparse
+import ast
+import hashlib
+import os
+import signal
+import sysconfig
+import time
+
+from bench_parse_docstr import load_docapy
+
+STAGES = ('generate_doc', 'detect_imports', 'parse_docstr')
+
+
+class Timeout(Exception):
+    """
+    Raised when a stage takes longer than the timeout on a file
+    """
+
+
+def _raise_timeout(signum, frame):
+    raise Timeout()
+
+
+def corpus_files(roots, limit=None):
+    """
+    Returns the sorted list of the *.py files found in the roots
+    """
+    files = []
+    for root in roots:
+        for path, dirs, names in os.walk(root):
+            dirs.sort()
+            for name in sorted(names):
+                if name.endswith('.py'):
+                    files.append(os.path.join(path, name).replace('\\', '/'))
+    files = sorted(set(files))
+    return files[:limit] if limit else files
+
+
+def file_docstrings(text):
+    """
+    Returns all the docstrings of a Python source (module, classes, functions)
+    """
+    try:
+        tree = ast.parse(text)
+    except (SyntaxError, ValueError):
+        return []
+    docstrings = []
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef,
+                             ast.AsyncFunctionDef)):
+            body = node.body
+            if body and isinstance(body[0], ast.Expr) and \
+                    isinstance(body[0].value, ast.Constant) and \
+                    isinstance(body[0].value.value, str):
+                docstrings.append(body[0].value.value)
+    return docstrings
+
+
+def run_stage(module, stage, file, all_files, docstrings):
+    """
+    Runs a stage of the engine on a file and returns its output
+    """
+    if stage == 'generate_doc':
+        return module.generate_doc(file)
+    if stage == 'detect_imports':
+        return repr(module.detect_imports(file, all_files))
+    return ''.join(module.parse_docstr(d) for d in docstrings)
+
+
+def run_engine(module, files, timeout):
+    """
+    Runs all the stages on all the files.
+
+    Returns  a  dict  {stage  : {'time', 'lines', 'bytes', 'files', 'failures',
+    'outputs'}}.  failures  maps  a  file  to  the  error  it  raised  (or
+    "timeout") and outputs maps a file to the hash of its output.
+    """
+    results = {stage: {'time': 0., 'lines': 0, 'bytes': 0, 'files': 0,
+                       'failures': {}, 'outputs': {}} for stage in STAGES}
+    use_alarm = timeout and hasattr(signal, 'setitimer')
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+
+    for file in files:
+        try:
+            with open(file, 'r', encoding='utf8') as f:
+                text = f.read()
+        except (UnicodeDecodeError, OSError):
+            continue
+        n_lines = text.count('\n') + 1
+        docstrings = file_docstrings(text)
+
+        for stage in STAGES:
+            result = results[stage]
+            start = time.perf_counter()
+            try:
+                if use_alarm:
+                    signal.setitimer(signal.ITIMER_REAL, timeout)
+                try:
+                    output = run_stage(module, stage, file, files, docstrings)
+                finally:
+                    if use_alarm:
+                        signal.setitimer(signal.ITIMER_REAL, 0)
+            except Timeout:
+                result['failures'][file] = 'timeout'
+                continue
+            except RecursionError:
+                result['failures'][file] = 'RecursionError'
+                continue
+            except Exception as error:
+                result['failures'][file] = type(error).__name__ + ': ' + \
+                                           str(error)[:80]
+                continue
+            result['time'] += time.perf_counter() - start
+            result['files'] += 1
+            result['lines'] += n_lines
+            output = output.encode('utf8')
+            result['bytes'] += len(output)
+            result['outputs'][file] = hashlib.sha1(output).hexdigest()
+
+    return results
+
+
+def report(name, results):
+    """
+    Prints the throughput of every stage and the failures of an engine
+    """
+    print('\n' + name)
+    print('%-16s %7s %10s %12s %12s %9s' % ('stage', 'files', 'files/s',
+                                            'lines/s', 'HTML B/s',
+                                            'failures'))
+    for stage in STAGES:
+        r = results[stage]
+        t = r['time'] or float('inf')
+        print('%-16s %7d %10.1f %12.0f %12.0f %9d'
+              % (stage, r['files'], r['files'] / t, r['lines'] / t,
+                 r['bytes'] / t, len(r['failures'])))
+    for stage in STAGES:
+        for file, error in sorted(results[stage]['failures'].items()):
+            print('  [%s] %s : %s' % (stage, file, error))
+
+
+def diff(results, other):
+    """
+    Returns the list of (stage, file, reason) for which two engines differ
+    """
+    differences = []
+    for stage in STAGES:
+        r, o = results[stage], other[stage]
+        for file in sorted(set(r['outputs']) | set(r['failures']) |
+                           set(o['outputs']) | set(o['failures'])):
+            if file in r['failures'] or file in o['failures']:
+                if r['failures'].get(file) != o['failures'].get(file):
+                    differences.append((stage, file, 'failure differs'))
+            elif r['outputs'].get(file) != o['outputs'].get(file):
+                differences.append((stage, file, 'output differs'))
+    return differences
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('roots', nargs='*',
+                        help="directories of the corpus (default : the "
+                             "standard library and site-packages)")
+    parser.add_argument('--docapy', default=os.path.join(here, '..',
+                                                         'docapy.py'),
+                        help="docapy.py file to benchmark")
+    parser.add_argument('--compare', help="other docapy.py file to compare")
+    parser.add_argument('--limit', type=int, help="maximum number of files")
+    parser.add_argument('--timeout', type=float, default=5.,
+                        help="time limit of a stage on a file (seconds)")
+    args = parser.parse_args()
+
+    roots = args.roots or sorted({sysconfig.get_paths()['stdlib'],
+                                  sysconfig.get_paths()['purelib']})
+    files = corpus_files(roots, args.limit)
+    print('%d files in %s' % (len(files), ', '.join(roots)))
+
+    results = run_engine(load_docapy(args.docapy), files, args.timeout)
+    report('docapy (' + args.docapy + ')', results)
+
+    if args.compare:
+        other = run_engine(load_docapy(args.compare), files, args.timeout)
+        report('compare (' + args.compare + ')', other)
+        differences = diff(results, other)
+        print('\n%d differences' % len(differences))
+        for stage, file, reason in differences:
+            print('  [%s] %s : %s' % (stage, file, reason))
+        if differences:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput benchmark of parse_docstr on very long Numpydoc docstrings.
+
+Run it from the Docapy directory :
+
+    python benchmarks/bench_parse_docstr.py
+
+To  compare  with  another  version  of  Docapy  (for example the one of a
+previous commit), give the path of its docapy.py file :
+
+    git show HEAD~1:docapy.py > /tmp/docapy_old.py
+    python benchmarks/bench_parse_docstr.py --compare /tmp/docapy_old.py
+
+Both  versions  must  give  the  same  HTML,  otherwise the benchmark fails :
+the  long  docstrings  and  random  docstrings  (made  of  the tokens that
+parse_docstr  handles  :  titles,  lists, doctests, URLs, HTML entities ...)
+are compared before the benchmark.
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import time
+
+
+def load_docapy(path):
+    """
+    Loads the docapy.py file at the given path as a module
+    """
+    spec = importlib.util.spec_from_file_location(
+        "docapy_" + str(abs(hash(path))), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def long_docstring(n_params):
+    """
+    Returns a Numpydoc docstring with n_params parameters, examples, lists and
+    URLs. Its length grows linearly with n_params.
+    """
+    lines = ['', '    Description', '    -----------', '',
+             '    Computes something : see https://numpydoc.readthedocs.io',
+             '    for the "format" of <this> docstring & more.', '',
+             '    Parameters', '    ----------', '']
+    for i in range(n_params):
+        lines += ['    param_%d : int, optional' % i,
+                  '        Value of the parameter %d. It can be :' % i,
+                  '            - "a" for the first mode',
+                  '            - "b" for the second mode (default)',
+                  '        See www.python.org for details.', '']
+    lines += ['    Examples', '    --------', '']
+    for i in range(n_params // 4):
+        lines += ['    >>> foo(param_%d=1)  # <comment> & "quotes"' % i,
+                  '    %d' % i, '']
+    lines += ['    Returns', '    -------', '', '    int',
+              '        Result : always positive', '    ']
+    return '\n'.join(lines)
+
+
+# Tokens of the random docstrings, and indentations of their lines. The URLs
+# are  surrounded  by  tabs  so  that  they  never  overlap  :  the links of
+# overlapping URLs depended on the hash seed before they were sorted
+FUZZ_TOKENS = ('>>>', '&gt;&gt;&gt;', '- ', '* ', ':', ' : ', '-----', '<',
+               '>', '&', '&amp;', '"', "'", '\thttps://a.org/x?y=1&z=2\t',
+               '\twww.python.org\t', 'Parameters', 'Returns', 'word', ' ',
+               '\t')
+FUZZ_INDENTS = ('', '', ' ', '    ', '     ', '        ', '            ')
+
+
+def random_docstring(rng, max_lines=12):
+    """
+    Returns a random docstring made of FUZZ_TOKENS
+    """
+    lines = []
+    for _ in range(rng.randint(0, max_lines)):
+        lines.append(rng.choice(FUZZ_INDENTS) + ''.join(
+            rng.choice(FUZZ_TOKENS) for _ in range(rng.randint(0, 5))))
+    return '\n'.join(lines)
+
+
+def differences(module, other, docstrings):
+    """
+    Returns the docstrings for which the two modules give different HTML
+    """
+    return [docstr for docstr in docstrings
+            if module.parse_docstr(docstr) != other.parse_docstr(docstr)]
+
+
+def bench(module, docstrings, repeat):
+    """
+    Returns the best time (in seconds) to parse all the docstrings
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for docstr in docstrings:
+            module.parse_docstr(docstr)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--docapy', default=os.path.join(here, '..',
+                                                         'docapy.py'),
+                        help="docapy.py file to benchmark")
+    parser.add_argument('--compare', help="other docapy.py file to compare")
+    parser.add_argument('--params', type=int, default=2000,
+                        help="number of parameters of the longest docstring")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--fuzz', type=int, default=5000,
+                        help="number of random docstrings compared with "
+                             "--compare")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="seed of the random docstrings")
+    args = parser.parse_args()
+
+    docstrings = [long_docstring(n) for n in (10, args.params // 10,
+                                              args.params)]
+    n_lines = sum(d.count('\n') + 1 for d in docstrings)
+    n_bytes = sum(len(d.encode('utf8')) for d in docstrings)
+
+    engines = [('docapy', load_docapy(args.docapy))]
+    if args.compare:
+        engines.append(('compare', load_docapy(args.compare)))
+        rng = random.Random(args.seed)
+        fuzz = [random_docstring(rng) for _ in range(args.fuzz)]
+        different = differences(engines[0][1], engines[1][1],
+                                docstrings + fuzz)
+        for docstr in different[:5]:
+            print("different HTML for %r" % docstr)
+        if different:
+            raise SystemExit("The two versions give different HTML for %d "
+                             "docstrings" % len(different))
+
+    print("%d docstrings, %d lines, %d bytes" % (len(docstrings), n_lines,
+                                                 n_bytes))
+    times = []
+    for name, module in engines:
+        elapsed = bench(module, docstrings, args.repeat)
+        times.append(elapsed)
+        print("%-8s %8.1f ms %12.0f lines/s %8.2f MB/s"
+              % (name, elapsed * 1e3, n_lines / elapsed,
+                 n_bytes / elapsed / 1e6))
+    if len(times) == 2:
+        print("speedup : x%.2f" % (times[1] / times[0]))
+
+
+if __name__ == "__main__":
+    main()
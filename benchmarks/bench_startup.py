@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Cold start benchmark : time from the start of the interpreter to the first file
+processed by Docapy.
+
+Each  run  starts  a  new  interpreter  that  imports  docapy,  finds the files
+of  the  project  (git ls-files) and extracts the documentation of the first
+one, like the command line does before writing its first page. The median
+wall  time  of  the  runs  is  reported,  with  the  slowest  imports given by
+"python -X importtime".
+
+Run it from the Docapy directory :
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py path/to/project --runs 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+CHILD = """
+import sys
+sys.path.insert(0, sys.argv[1])
+import docapy
+files = docapy.find_python_files()
+docapy.extract_file(files[0], None)
+"""
+
+
+def run(docapy_dir, project, importtime=False, child=CHILD):
+    """
+    Runs the child interpreter in project and returns its wall time and stderr
+    """
+    command = [sys.executable] + (['-X', 'importtime'] if importtime else []) \
+        + ['-c', child, docapy_dir]
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)  # Measures with the .pyc file
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=project, env=env, check=True,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            text=True)
+    return time.perf_counter() - start, result.stderr
+
+
+def slowest_imports(stderr, count):
+    """
+    Returns the (cumulative microseconds, module) of the slowest top-level
+    imports from the output of "python -X importtime"
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[12:].split('|')
+        if not name.startswith('  '):  # Top-level imports only
+            imports.append((int(cumulative), name.strip()))
+    return sorted(imports, reverse=True)[:count]
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('project', nargs='?', default=os.path.join(here, '..'),
+                        help="directory of the project (default : Docapy)")
+    parser.add_argument('--docapy', default=os.path.join(here, '..'),
+                        help="directory of the docapy.py file to benchmark")
+    parser.add_argument('--runs', type=int, default=10,
+                        help="number of runs (default 10)")
+    args = parser.parse_args()
+    docapy_dir = os.path.abspath(args.docapy)
+
+    run(docapy_dir, args.project)  # Writes the bytecode cache
+    empty = [run(docapy_dir, args.project, child='pass')[0]
+             for _ in range(args.runs)]
+    times = [run(docapy_dir, args.project)[0] for _ in range(args.runs)]
+    print('empty interpreter    : %6.1f ms'
+          % (statistics.median(empty) * 1000))
+    print('first file processed : %6.1f ms (median of %d runs)'
+          % (statistics.median(times) * 1000, args.runs))
+
+    _, stderr = run(docapy_dir, args.project, importtime=True)
+    print('\nslowest imports (cumulative) :')
+    for cumulative, name in slowest_imports(stderr, 8):
+        print('  %8.1f ms  %s' % (cumulative / 1000, name))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Compact HTML check : the compact HTML of docstrings must look like the normal
+one.
+
+Each  docstring  is  rendered  by  parse_docstr with and without compact. Both
+HTML  are  reduced  to  the  lines  a  browser  would display, with their left
+margin  (in  indentation levels, see INDENT_DIVS) and their text (whitespaces
+collapsed). The docstrings whose layouts differ are listed.
+
+The  docstrings  are  the ones of the standard library of the running Python
+interpreter and random ones (see bench_parse_docstr).
+
+Run it from the Docapy directory :
+
+    python benchmarks/check_compact.py
+    python benchmarks/check_compact.py --limit 200 --fuzz 20000
+"""
+
+import argparse
+import html.parser
+import os
+import random
+import sysconfig
+
+from bench_corpus import corpus_files, file_docstrings
+from bench_parse_docstr import load_docapy, random_docstring
+
+# Elements that start a new line
+BLOCKS = frozenset(['div', 'pre', 'ul', 'li', 'h3'])
+
+
+class Layout(html.parser.HTMLParser):
+    """
+    Lines  (left  margin,  text)  of  a  docstring HTML. Like in a browser, an
+    end tag closes the blocks opened after its element, and is ignored if its
+    element is not open
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.blocks = []  # (tag, left margin) of each open block
+        self.text = []
+        self.lines = []
+        self.pre = 0
+
+    def flush(self, force=False):
+        text = ' '.join(''.join(self.text).split())
+        if text or force:
+            self.lines.append((sum(x[1] for x in self.blocks), text))
+        self.text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'br':
+            self.flush(True)
+        elif tag in BLOCKS:
+            self.flush()
+            classes = (dict(attrs).get('class') or '').split()
+            levels = [int(x[6:] or 1) for x in classes
+                      if x.startswith('indent')]
+            self.blocks.append((tag, sum(levels)))
+            self.pre += tag == 'pre'
+
+    def handle_endtag(self, tag):
+        if tag in BLOCKS and any(x[0] == tag for x in self.blocks):
+            self.flush()
+            while self.blocks.pop()[0] != tag:
+                pass
+            self.pre = sum(x[0] == 'pre' for x in self.blocks)
+
+    def handle_data(self, data):
+        if self.pre:
+            *lines, data = data.split('\n')
+            for line in lines:
+                self.text.append(line)
+                self.flush(True)
+        self.text.append(data)
+
+
+def layout(html):
+    """
+    Returns the list of the (left margin, text) lines of the HTML
+    """
+    parser = Layout()
+    parser.feed(html)
+    parser.close()
+    parser.flush()
+    return parser.lines
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--docapy', default=os.path.join(here, '..',
+                                                         'docapy.py'),
+                        help="docapy.py file to check")
+    parser.add_argument('--limit', type=int,
+                        help="maximum number of files of the standard "
+                             "library")
+    parser.add_argument('--fuzz', type=int, default=5000,
+                        help="number of random docstrings")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="seed of the random docstrings")
+    args = parser.parse_args()
+    docapy = load_docapy(args.docapy)
+
+    docstrings = []
+    for file in corpus_files([sysconfig.get_paths()['stdlib']], args.limit):
+        try:
+            with open(file, 'r', encoding='utf8') as f:
+                docstrings += file_docstrings(f.read())
+        except (UnicodeDecodeError, OSError):
+            continue
+    rng = random.Random(args.seed)
+    docstrings += [random_docstring(rng) for _ in range(args.fuzz)]
+
+    different = [d for d in docstrings
+                 if layout(docapy.parse_docstr(d)) !=
+                 layout(docapy.parse_docstr(d, compact=True))]
+    saved = sum(len(docapy.parse_docstr(d)) -
+                len(docapy.parse_docstr(d, compact=True))
+                for d in docstrings)
+    print('%d docstrings, %d different layouts, %d characters saved'
+          % (len(docstrings), len(different), saved))
+    for docstr in different[:5]:
+        print('different layout for %r' % docstr)
+    if different:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
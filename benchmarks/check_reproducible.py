@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Reproducibility check : builds the documentation of a project twice and checks
+that both builds are byte-identical.
+
+Each  build  runs  in  a  new  interpreter  with  a different hash seed, on its
+own  copy  of  the project (without its docapy directory). The manifests of the
+two  builds  (see  OutputWriter)  are  compared  and the files that differ are
+listed.
+
+Run it from the Docapy directory :
+
+    python benchmarks/check_reproducible.py path/to/project
+    python benchmarks/check_reproducible.py path/to/project --compact
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from bench_parse_docstr import load_docapy
+
+
+def build(docapy, project, seed, options):
+    """
+    Builds a copy of project in a new interpreter with the given hash seed and
+    returns the manifest of the build
+    """
+    env = dict(os.environ, PYTHONHASHSEED=str(seed))
+    subprocess.run([sys.executable, os.path.abspath(__file__), project,
+                    '--docapy', docapy, '--build', json.dumps(options)],
+                   env=env, check=True, stdout=subprocess.DEVNULL)
+    with open(os.path.join(project, 'docapy', 'manifest.json'), 'r',
+              encoding='utf8') as f:
+        return json.load(f)['files']
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('project', help="directory of the project")
+    parser.add_argument('--docapy', default=os.path.join(here, '..',
+                                                         'docapy.py'),
+                        help="docapy.py file to check")
+    parser.add_argument('--compact', action='store_true',
+                        help="generate compact HTML")
+    parser.add_argument('--lazy-threshold', type=int,
+                        help="split the pages bigger than this size")
+    parser.add_argument('--build', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    docapy = os.path.abspath(args.docapy)
+
+    if args.build is not None:
+        load_docapy(docapy).html_for_project(args.project, 'Project',
+                                             'https://github.com/x/project',
+                                             **json.loads(args.build))
+        return
+
+    options = {'compact': args.compact,
+               'lazy_threshold': args.lazy_threshold}
+    manifests = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for seed in (1, 2):
+            copy = os.path.join(tmp, str(seed))
+            shutil.copytree(args.project, copy, symlinks=True,
+                            ignore=shutil.ignore_patterns('docapy'))
+            manifests.append(build(docapy, copy, seed, options))
+
+    first, second = manifests
+    differences = sorted(x for x in set(first) | set(second)
+                         if first.get(x) != second.get(x))
+    print('%d files, %d differences' % (len(first), len(differences)))
+    for file in differences:
+        print('  ' + file)
+    if differences:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,19 +3,102 @@
 This  is  the  Docapy Core file. It contains all the functions to generate the
 documentation from a Python project.
 
-This  file should not be run. To run Docapy, edit and run 'edit_and_run_me.py'
-instead.     For     more    details,    refer    to    the    documentation :
-https://teskann.github.io/docapy/
+Run  it  on  a  project  with  "python  docapy.py path/to/project --name Name
+--github  https://github.com/you/project"  (see main, or "--help"). For more
+details, refer to the documentation : https://teskann.github.io/docapy/
 """
 
 import re
 import os
-import shutil
-import git
+import json
+import hashlib
+import time
 from fnmatch import fnmatch
 
 
-def parse_docstr(docstr):
+# Docstring parsing __________________________________________________________
+
+class LazyRegex:
+    """
+    Description
+    -----------
+    
+    Regular  expression  compiled  the first time one of its attributes (like
+    search  or  findall)  is  used,  so  that  importing  Docapy  does not pay
+    for the compilation of the big regular expressions it may never use.
+    
+    Parameters
+    ----------
+    
+    pattern : str
+        Pattern of the regular expression
+    
+    flags : int, optional
+        Flags of the regular expression
+        The default is 0.
+    """
+
+    def __init__(self, pattern, flags=0):
+        self.pattern = pattern
+        self.flags = flags
+
+    def __getattr__(self, name):
+        # Only called for the attributes that are not set yet : the bound
+        # methods are stored on the instance so that the next calls are
+        # as fast as on the compiled regular expression
+        value = getattr(re.compile(self.pattern, self.flags), name)
+        setattr(self, name, value)
+        return value
+
+
+# Every  URL  matched  by  URL_REGEX contains a match of URL_HINT. It is much
+# faster and avoids running URL_REGEX on most of the lines
+URL_HINT = re.compile(r"(?i)https?:|[a-z0-9.\-]\.[a-z]{2}")
+
+# Regular expression matching the URLs in the docstrings
+URL_REGEX = LazyRegex(
+    r"""(?i)\b((?:https?:(?:/{1,3}|[a-z0-9%])|[a-z0-9.\-]+[.](?:com|net|org|edu|gov|mil|aero|asia|biz|cat|coop|info|int|jobs|mobi|museum|name|post|pro|tel|travel|xxx|ac|ad|ae|af|ag|ai|al|am|an|ao|aq|ar|as|at|au|aw|ax|az|ba|bb|bd|be|bf|bg|bh|bi|bj|bm|bn|bo|br|bs|bt|bv|bw|by|bz|ca|cc|cd|cf|cg|ch|ci|ck|cl|cm|cn|co|cr|cs|cu|cv|cx|cy|cz|dd|de|dj|dk|dm|do|dz|ec|ee|eg|eh|er|es|et|eu|fi|fj|fk|fm|fo|fr|ga|gb|gd|ge|gf|gg|gh|gi|gl|gm|gn|gp|gq|gr|gs|gt|gu|gw|gy|hk|hm|hn|hr|ht|hu|id|ie|il|im|in|io|iq|ir|is|it|je|jm|jo|jp|ke|kg|kh|ki|km|kn|kp|kr|kw|ky|kz|la|lb|lc|li|lk|lr|ls|lt|lu|lv|ly|ma|mc|md|me|mg|mh|mk|ml|mm|mn|mo|mp|mq|mr|ms|mt|mu|mv|mw|mx|my|mz|na|nc|ne|nf|ng|ni|nl|no|np|nr|nu|nz|om|pa|pe|pf|pg|ph|pk|pl|pm|pn|pr|ps|pt|pw|py|qa|re|ro|rs|ru|rw|sa|sb|sc|sd|se|sg|sh|si|sj|Ja|sk|sl|sm|sn|so|sr|ss|st|su|sv|sx|sy|sz|tc|td|tf|tg|th|tj|tk|tl|tm|tn|to|tp|tr|tt|tv|tw|tz|ua|ug|uk|us|uy|uz|va|vc|ve|vg|vi|vn|vu|wf|ws|ye|yt|yu|za|zm|zw)/)(?:[^\s()<>{}\[\]]+|\([^\s()]*?\([^\s()]+\)[^\s()]*?\)|\([^\s]+?\))+(?:\([^\s()]*?\([^\s()]+\)[^\s()]*?\)|\([^\s]+?\)|[^\s`!()\[\]{};:'".,<>?«»“”‘’])|(?:(?<!@)[a-z0-9]+(?:[.\-][a-z0-9]+)*[.](?:com|net|org|edu|gov|mil|aero|asia|biz|cat|coop|info|int|jobs|mobi|museum|name|post|pro|tel|travel|xxx|ac|ad|ae|af|ag|ai|al|am|an|ao|aq|ar|as|at|au|aw|ax|az|ba|bb|bd|be|bf|bg|bh|bi|bj|bm|bn|bo|br|bs|bt|bv|bw|by|bz|ca|cc|cd|cf|cg|ch|ci|ck|cl|cm|cn|co|cr|cs|cu|cv|cx|cy|cz|dd|de|dj|dk|dm|do|dz|ec|ee|eg|eh|er|es|et|eu|fi|fj|fk|fm|fo|fr|ga|gb|gd|ge|gf|gg|gh|gi|gl|gm|gn|gp|gq|gr|gs|gt|gu|gw|gy|hk|hm|hn|hr|ht|hu|id|ie|il|im|in|io|iq|ir|is|it|je|jm|jo|jp|ke|kg|kh|ki|km|kn|kp|kr|kw|ky|kz|la|lb|lc|li|lk|lr|ls|lt|lu|lv|ly|ma|mc|md|me|mg|mh|mk|ml|mm|mn|mo|mp|mq|mr|ms|mt|mu|mv|mw|mx|my|mz|na|nc|ne|nf|ng|ni|nl|no|np|nr|nu|nz|om|pa|pe|pf|pg|ph|pk|pl|pm|pn|pr|ps|pt|pw|qa|re|ro|rs|ru|rw|sa|sb|sc|sd|se|sg|sh|si|sj|Ja|sk|sl|sm|sn|so|sr|ss|st|su|sv|sx|sy|sz|tc|td|tf|tg|th|tj|tk|tl|tm|tn|to|tp|tr|tt|tv|tw|tz|ua|ug|uk|us|uy|uz|va|vc|ve|vg|vi|vn|vu|wf|ws|ye|yt|yu|za|zm|zw)\b/?(?!@)))""")
+
+
+def escape_html(text, amp=True):
+    """
+    Description
+    -----------
+
+    Escapes  the  characters  of  text  that  have  a meaning in HTML (<, >,
+    quotes and, if amp is True, &).
+
+    Parameters
+    ----------
+
+    text : str
+        Text to escape
+
+    amp : bool, optional
+        Escapes '&' if True (default). It must be the first escaped character
+
+    Returns
+    -------
+
+    str
+        Escaped text
+
+    """
+
+    if amp:
+        text = text.replace('&', '&amp;')
+    text = text.replace('<', '&lt;').replace('>', '&gt;')
+    return text.replace("'", '&apos;').replace('"', "&quot;")
+
+
+# Wrappers  of  the  indentations of a docstring. In compact HTML, a step of n
+# levels  is  a single <div class="indent<n>"> (see style.css) instead of n
+# nested <div class="indent">
+INDENT_DIVS = ('', '<div class="indent">', '<div class="indent2">',
+               '<div class="indent3">', '<div class="indent4">')
+
+
+def parse_docstr(docstr, compact=False):
     """
     Description
     -----------
@@ -27,12 +110,22 @@ def parse_docstr(docstr):
         - Indentations : <div class="indent"> elements
         - Code parts : <div class="code"> elements
     
+    The  lines  are  classified  once  (indentation, escaped text, underline,
+    list  and  code  flags).  Sections  are then found from the underlines and
+    rendered by a state machine walking the classified lines.
+    
     Parameters
     ----------
     
     docstr : str
         Docstring to parse. Must follow the NumpyDoc format
     
+    compact : bool, optional
+        If  True,  code  parts  are  <pre class="code"> elements (one text line
+        per code line) instead of <div class="code"> elements with <br> and
+        &nbsp;,  and  an  indentation  of  several  levels  is  a  single div
+        (see INDENT_DIVS). Default is False
+    
     Returns
     -------
     
@@ -41,90 +134,105 @@ def parse_docstr(docstr):
     
     """
 
-    # Indentation level ......................................................
-
-    def indentation(line):
-        """
-        Returns the index of the first non-space character
+    # Case with empty string .................................................
 
-        Parameters
-        ----------
-        line : str
-            String to find the indentation level from
+    if docstr is None or docstr.strip() == '':
+        return "No documentation found for this section"
 
-        Returns
-        -------
-        Index of the first non-space character or None if there is no char
+    # Classifying lines ......................................................
 
-        """
+    # Escaping is done once for the whole docstring. It does not change the
+    # whitespaces so indentation and stripping are not affected
+    raw_lines = docstr.split('\n')
+    esc_lines = escape_html(docstr, amp=False).split('\n')
+    code_lines = None  # Escaped lines (with '&') for the code parts
 
-        strip = len(line.lstrip())
+    n_lines = len(raw_lines)
+    indents = [None] * n_lines  # Raw indentation level (None if blank)
+    texts = [''] * n_lines  # Stripped and escaped text
+    doctests = [False] * n_lines  # True if the raw line starts with '>>>'
+    underlines = []  # Index of the lines that can underline a title
+    min_ = -1
 
-        if strip:
-            return (len(line) - strip) // 4
-        else:
-            return None
+    for i_l, esc in enumerate(esc_lines):
+        lstrip = esc.lstrip()
+        if lstrip:
+            ind = (len(esc) - len(lstrip)) // 4
+            text = lstrip.rstrip()
+            indents[i_l] = ind
+            texts[i_l] = text
+            doctests[i_l] = raw_lines[i_l].lstrip()[:3] == '>>>'
+            if min_ == -1 or ind < min_:
+                min_ = ind
+            if i_l and not text.strip('-'):
+                underlines.append(i_l)
+
+    # Indentation relative to the least indented line
+    if min_:
+        indents = [x if x is None else x - min_ for x in indents]
 
-    # Case with empty string .................................................
+    # Parsing sections .......................................................
 
-    if docstr is None or docstr.strip() == '':
-        return "No documentation found for this section"
+    # A line made of '-' underlines the previous line if they have the same
+    # indentation  and  it  is  not  longer  than  the  title. The last line
+    # of the docstring is never part of a section
+    titles = [i_l for i_l in underlines
+              if indents[i_l] == indents[i_l - 1]
+              and len(texts[i_l]) <= len(raw_lines[i_l - 1].strip())]
 
-    html = ''
+    all_sections = []  # (name, first line, last line + 1)
+    if titles:
+        last_content = titles[0] - 1
+    else:
+        last_content = n_lines - 1
 
-    # Split Lines ............................................................
+    # If Description section is not explicit
+    if last_content > 1 and \
+            any(indents[i_l] is not None for i_l in range(last_content)):
+        all_sections.append(('Description', 0, last_content))
 
-    all_lines = docstr.split('\n')
+    for i_t, i_l in enumerate(titles):
+        stop = titles[i_t + 1] - 1 if i_t + 1 < len(titles) else n_lines - 1
+        all_sections.append((raw_lines[i_l - 1].strip(), i_l + 1, stop))
 
-    # Finding minimum indent level ...........................................
+    # Parsing to HTML ........................................................
 
-    min_ = -1
+    if compact:
+        code_open, code_close, code_br = '<pre class="code">', '</pre>', '\n'
+    else:
+        code_open, code_close, code_br = '<div class="code">', '</div>', '<br>'
 
-    for line in all_lines:
-        if line.strip() != '':
-            i = indentation(line)
-            if min_ == -1:
-                min_ = i
-            elif i < min_:
-                min_ = i
+    html = []
+    add = html.append
 
-    all_lines = [x[4 * min_:] for x in all_lines]
+    wrappers = []  # Number of indentation levels of each open div
+    step = len(INDENT_DIVS) - 1 if compact else 1
 
-    # Parsing sections .......................................................
+    def open_indent(levels):
+        while levels > 0:
+            n = min(levels, step)
+            add(INDENT_DIVS[n])
+            wrappers.append(n)
+            levels -= n
 
-    all_sections = []  # List  containing  sections.  Each  section is a dict
-    # with a name fiels and a content field
-
-    i_l = len(all_lines) - 1
-    last_content = i_l
-    for line in all_lines[::-1]:
-        if i_l:
-            if all(x == '-' for x in line.strip()) and len(line.strip()) > 0:
-                if indentation(line) == indentation(all_lines[i_l - 1]):
-                    if len(line.strip()) <= len(all_lines[i_l - 1].strip()):
-                        content = '\n'.join(all_lines[i_l + 1:last_content])
-                        section = {'name': all_lines[i_l - 1].strip(),
-                                   'content': content}
-                        last_content = i_l - 1
-                        all_sections.append(section)
-        i_l -= 1
+    def close_indent(levels):
+        while levels > 0:
+            levels -= wrappers.pop() if wrappers else 1
+            add('</div>')
+        open_indent(-levels)  # A div that was closed with too many levels
 
-    # If Description section is not explicit
-    if last_content > 1 and \
-            ''.join([x.strip() for x in all_lines[:last_content]]) != '':
-        content = '\n'.join(all_lines[:last_content])
-        section = {'name': 'Description',
-                   'content': content}
-        all_sections.append(section)
+    def close_item(tags):
+        # The end of a list item also closes the divs opened in it
+        add(tags)
+        del wrappers[list_wrappers:]
 
-    # Parsing to HTML ........................................................
+    list_wrappers = 0  # Number of open divs when the list was opened
 
-    for section in all_sections[::-1]:
-        html += "<h3>" + section['name'] + "</h3>"
+    for name, first, stop in all_sections:
+        add("<h3>" + name + "</h3>")
 
         # Parsing section content  . . . . . . . . . . . . . . . . . . . . . .
 
-        sect_lines = section['content'].split('\n')
         last_indent = 0
         code = False  # True if it's a code division ">>> foo(bar)"
         list_ = False  # True if there is a list in the docstring
@@ -133,120 +241,119 @@ def parse_docstr(docstr):
         last_line_was_empty = False
         open_div = 0
 
-        for i_l, line in enumerate(sect_lines):
-            if line.strip() != '':
-                # Finding indent evolution
-                if indentation(line) > last_indent and not code:
-                    delta = indentation(line) - last_indent
-                    while delta > 0:
-                        html += '<div class="indent">'
-                        open_div += 1
-                        delta -= 1
-
-                elif indentation(line) < last_indent and not code and \
-                        not list_ or code and \
-                        indentation(
-                            line) < code_indent0 or list_ and not code:
-                    if code:
-                        html += "</div>"
-                        code = False
-                    if list_:
-                        if indentation(line) < list_indent0:
-                            html += "</li></ul>"
-                            list_indent0 = 0
-                            list_ = False
-                    for _ in range(last_indent - indentation(line)):
-                        html += '</div>'
-                        open_div -= 1
-
-                content = line
-                content = content.replace('&', '&amp;')
-
-                last_indent = indentation(line)
+        for i_l in range(first, stop):
+            ind = indents[i_l]
 
+            # Empty line
+            if ind is None:
                 if code:
-                    html += "<br>"
+                    add(code_close)
+                    code = False
+                if list_:
+                    if last_indent > list_indent0:
+                        close_indent(last_indent - list_indent0)
+                        open_div -= last_indent - list_indent0
+                    last_indent = list_indent0
+                    close_item("</li></ul>")
+                    list_ = False
+                if i_l != first:
+                    add("<br>")
+                last_line_was_empty = True
+                continue
 
-                # Code section
-                if content.strip()[:3] == '>>>' and not code:
-                    code = True
-                    code_indent0 = indentation(line)
-                    if not last_line_was_empty:
-                        html += "<br>"
-                    html += '<div class="code">'
+            # Finding indent evolution
+            if ind > last_indent and not code:
+                open_indent(ind - last_indent)
+                open_div += ind - last_indent
 
+            elif ind < last_indent and not code and not list_ or \
+                    code and ind < code_indent0 or list_ and not code:
                 if code:
-                    content = content[4 * code_indent0:]
+                    add(code_close)
+                    code = False
+                if list_ and ind < list_indent0:
+                    close_item("</li></ul>")
+                    list_indent0 = 0
+                    list_ = False
+                if last_indent > ind:
+                    close_indent(last_indent - ind)
+                    open_div -= last_indent - ind
+
+            last_indent = ind
+
+            if code:
+                add(code_br)
+
+            content = texts[i_l]
+
+            # Code section
+            if not code and doctests[i_l]:
+                code = True
+                code_indent0 = ind
+                if not last_line_was_empty:
+                    add("<br>")
+                add(code_open)
+
+            if code:
+                if code_lines is None:
+                    code_lines = escape_html(docstr).split('\n')
+                content = code_lines[i_l][4 * (min_ + code_indent0):]
+                if not compact:
                     content = content.replace(' ', '&nbsp;')
+
+            # finding URLs
+            urls = None
+            if URL_HINT.search(content):
+                if code and compact:
+                    # The URLs end where they end in the normal HTML (&nbsp;)
+                    urls = sorted(set(x.replace('&nbsp;', ' ') for x in
+                                      URL_REGEX.findall(content.replace(
+                                          ' ', '&nbsp;'))))
                 else:
-                    content = line.strip()
-                content = content.replace('<', '&lt;').replace('>', '&gt;')
-                content = content.replace("'", '&apos;')
-                content = content.replace('"', "&quot;")
-
-                # finding URLs
-                urls = set(re.findall(
-                    r"""(?i)\b((?:https?:(?:/{1,3}|[a-z0-9%])|[a-z0-9.\-]+[.](?:com|net|org|edu|gov|mil|aero|asia|biz|cat|coop|info|int|jobs|mobi|museum|name|post|pro|tel|travel|xxx|ac|ad|ae|af|ag|ai|al|am|an|ao|aq|ar|as|at|au|aw|ax|az|ba|bb|bd|be|bf|bg|bh|bi|bj|bm|bn|bo|br|bs|bt|bv|bw|by|bz|ca|cc|cd|cf|cg|ch|ci|ck|cl|cm|cn|co|cr|cs|cu|cv|cx|cy|cz|dd|de|dj|dk|dm|do|dz|ec|ee|eg|eh|er|es|et|eu|fi|fj|fk|fm|fo|fr|ga|gb|gd|ge|gf|gg|gh|gi|gl|gm|gn|gp|gq|gr|gs|gt|gu|gw|gy|hk|hm|hn|hr|ht|hu|id|ie|il|im|in|io|iq|ir|is|it|je|jm|jo|jp|ke|kg|kh|ki|km|kn|kp|kr|kw|ky|kz|la|lb|lc|li|lk|lr|ls|lt|lu|lv|ly|ma|mc|md|me|mg|mh|mk|ml|mm|mn|mo|mp|mq|mr|ms|mt|mu|mv|mw|mx|my|mz|na|nc|ne|nf|ng|ni|nl|no|np|nr|nu|nz|om|pa|pe|pf|pg|ph|pk|pl|pm|pn|pr|ps|pt|pw|py|qa|re|ro|rs|ru|rw|sa|sb|sc|sd|se|sg|sh|si|sj|Ja|sk|sl|sm|sn|so|sr|ss|st|su|sv|sx|sy|sz|tc|td|tf|tg|th|tj|tk|tl|tm|tn|to|tp|tr|tt|tv|tw|tz|ua|ug|uk|us|uy|uz|va|vc|ve|vg|vi|vn|vu|wf|ws|ye|yt|yu|za|zm|zw)/)(?:[^\s()<>{}\[\]]+|\([^\s()]*?\([^\s()]+\)[^\s()]*?\)|\([^\s]+?\))+(?:\([^\s()]*?\([^\s()]+\)[^\s()]*?\)|\([^\s]+?\)|[^\s`!()\[\]{};:'".,<>?«»“”‘’])|(?:(?<!@)[a-z0-9]+(?:[.\-][a-z0-9]+)*[.](?:com|net|org|edu|gov|mil|aero|asia|biz|cat|coop|info|int|jobs|mobi|museum|name|post|pro|tel|travel|xxx|ac|ad|ae|af|ag|ai|al|am|an|ao|aq|ar|as|at|au|aw|ax|az|ba|bb|bd|be|bf|bg|bh|bi|bj|bm|bn|bo|br|bs|bt|bv|bw|by|bz|ca|cc|cd|cf|cg|ch|ci|ck|cl|cm|cn|co|cr|cs|cu|cv|cx|cy|cz|dd|de|dj|dk|dm|do|dz|ec|ee|eg|eh|er|es|et|eu|fi|fj|fk|fm|fo|fr|ga|gb|gd|ge|gf|gg|gh|gi|gl|gm|gn|gp|gq|gr|gs|gt|gu|gw|gy|hk|hm|hn|hr|ht|hu|id|ie|il|im|in|io|iq|ir|is|it|je|jm|jo|jp|ke|kg|kh|ki|km|kn|kp|kr|kw|ky|kz|la|lb|lc|li|lk|lr|ls|lt|lu|lv|ly|ma|mc|md|me|mg|mh|mk|ml|mm|mn|mo|mp|mq|mr|ms|mt|mu|mv|mw|mx|my|mz|na|nc|ne|nf|ng|ni|nl|no|np|nr|nu|nz|om|pa|pe|pf|pg|ph|pk|pl|pm|pn|pr|ps|pt|pw|qa|re|ro|rs|ru|rw|sa|sb|sc|sd|se|sg|sh|si|sj|Ja|sk|sl|sm|sn|so|sr|ss|st|su|sv|sx|sy|sz|tc|td|tf|tg|th|tj|tk|tl|tm|tn|to|tp|tr|tt|tv|tw|tz|ua|ug|uk|us|uy|uz|va|vc|ve|vg|vi|vn|vu|wf|ws|ye|yt|yu|za|zm|zw)\b/?(?!@)))""",
-                    content))
+                    urls = sorted(set(URL_REGEX.findall(content)))
                 for url in urls:
                     rep = '<a href="' + url + '">' + url + "</a>"
                     content = content.replace(url, rep)
 
+            if not code:
                 # List section
-                if content[:2] in ['- ', '* '] and not code:
+                if content[:2] in ('- ', '* '):
                     content = content[2:]
                     if not list_:
-                        html += '<ul>'
+                        add('<ul>')
                         list_ = True
-                        list_indent0 = indentation(line)
+                        list_indent0 = ind
+                        list_wrappers = len(wrappers)
                     else:
-                        html += "</li>"
-                    html += '<li>'
+                        close_item("</li>")
+                    add('<li>')
 
                 # Bold before ':'
-                if not code and "</a>" not in content:
-                    sp = content.split(':')
-                    if len(sp) > 1:
-                        content = "<b>" + sp[0] + "</b>" + ':' + \
-                                  ':'.join(sp[1:])
+                if not urls and ':' in content:
+                    head, _, tail = content.partition(':')
+                    content = "<b>" + head + "</b>:" + tail
 
-                # Adding content
-                html += ' ' + content
-                last_line_was_empty = False
-
-            # Empty line
+            # Adding content
+            if code and compact:
+                add(content)
             else:
-                if code:
-                    html += "</div>"
-                    code = False
-                if list_:
-                    for _ in range(last_indent - list_indent0):
-                        html += "</div>"
-                        open_div -= 1
-                    last_indent = list_indent0
-                    html += "</li></ul>"
-                    list_ = False
-                if i_l != 0:
-                    html += "<br>"
-                last_line_was_empty = True
+                add(' ' + content)
+            last_line_was_empty = False
 
         # Closing section
         if code:
-            html += "</div>"
-            code = False
+            add(code_close)
         if list_:
-            html += "</li></ul>"
-            list_ = False
+            close_item("</li></ul>")
+        if open_div > 0:
+            close_indent(open_div)
 
-        while open_div > 0:
-            html += "</div>"
-            open_div -= 1
-    return html
+    return ''.join(html)
 
 
 # Generate HTML block from function __________________________________________
 
-def generate_html_from_fct(definition, docstr, type_):
+def generate_html_from_fct(definition, docstr, type_, compact=False):
     """
     Description
     -----------
@@ -272,6 +379,9 @@ def generate_html_from_fct(definition, docstr, type_):
     type_ : str
         Content type. Can be "class" for classes or "def" for functions
     
+    compact : bool, optional
+        Compact HTML for the code parts (see parse_docstr). Default is False
+    
     Returns
     -------
     
@@ -287,12 +397,111 @@ def generate_html_from_fct(definition, docstr, type_):
            '</span> <span class="blue">' + fname + '</span>' + \
            ('(' if rest != '' else '') + rest + \
            '</summary>' + \
-           parse_docstr(docstr)
+           parse_docstr(docstr, compact)
     return html
 
 
 # Detect Imports _____________________________________________________________
 
+def find_imports(text):
+    """
+    Description
+    -----------
+    
+    Finds the names of all the modules imported in the Python source text, in
+    order of appearance (with duplicates).
+    
+    Parameters
+    ----------
+    
+    text : str
+        Python source code
+    
+    Returns
+    -------
+    
+    list of str
+        Names of the imported modules
+    
+    """
+
+    names = []
+
+    docstr_smp = False
+    docstr_dbl = False
+
+    # Ignoring docstring declarations
+    for line in text.split('\n'):
+        if '"""' in line and not docstr_smp:
+            if docstr_dbl:
+                docstr_dbl = False
+                line = line.split('"""')[1]
+            else:
+                docstr_dbl = True
+        elif "'''" in line and not docstr_dbl:
+            if docstr_smp:
+                docstr_smp = False
+                line = line.split("'''")[1]
+            else:
+                docstr_smp = True
+
+        if not docstr_dbl and not docstr_smp:
+            strip = line.strip()
+            if strip[:7] == "import ":
+                imps = strip[7:].strip().split(',')
+                names += [x.split(' ')[0] for x in imps]
+            elif strip[:5] == "from ":
+                names.append(strip[5:].strip().split(' ')[0])
+
+    return names
+
+
+def classify_imports(names, all_files):
+    """
+    Description
+    -----------
+    
+    Sorts imported module names into internal and external imports
+    
+    Parameters
+    ----------
+    
+    names : list of str
+        Names of the imported modules (see find_imports)
+    
+    all_files : list of str
+        List of all the files of the project. Every element is the path to the
+        py file : "./<pathToTheFile>/file.py" where . is the project directory
+    
+    Returns
+    -------
+    
+    Dict of lists
+        {'internal' : Internal imports (from this project),
+         
+         'external' : External imports (from other)}
+        
+        Both lists are sorted and have no duplicates
+    
+    """
+
+    module_names = set(x.split('/')[-1][:-3] for x in all_files)
+
+    imports = {'internal': [],
+               'external': []}
+    for imp in names:
+        if imp in module_names:
+            imports['internal'].append(imp)
+        else:
+            imports['external'].append(imp)
+
+    # Sorted so that the pages do not depend on the hash seed
+    imports['internal'] = sorted(set(imports['internal']))
+    imports['external'] = sorted(set(imports['external']))
+
+    return imports
+
+
 def detect_imports(file_path, all_files):
     """
     Description
@@ -323,52 +532,64 @@ def detect_imports(file_path, all_files):
     with open(file_path, 'r', encoding="utf8") as f:
         file_text = f.read()
 
-        all_lines = file_text.split('\n')
-        imports = {'internal': [],
-                   'external': []}
-
-        module_names = [x.split('/')[-1][:-3] for x in all_files]
-
-        docstr_smp = False
-        docstr_dbl = False
-
-        # Ignoring docstring declarations
-        for line in all_lines:
-            if '"""' in line and not docstr_smp:
-                if docstr_dbl:
-                    docstr_dbl = False
-                    line = line.split('"""')[1]
-                else:
-                    docstr_dbl = True
-            elif "'''" in line and not docstr_dbl:
-                if docstr_smp:
-                    docstr_smp = False
-                    line = line.split("'''")[1]
-                else:
-                    docstr_smp = True
-
-            if not docstr_dbl and not docstr_smp:
-                strip = line.strip()
-                if strip[:7] == "import ":
-                    imps = strip[7:].strip().split(',')
-                    imps = [x.split(' ')[0] for x in imps]
-                    for imp in imps:
-                        if imp in module_names:
-                            imports['internal'].append(imp)
-                        else:
-                            imports['external'].append(imp)
-                elif strip[:5] == "from ":
-                    imp = strip[5:].strip().split(' ')[0]
-                    if imp in module_names:
-                        imports['internal'].append(imp)
-                    else:
-                        imports['external'].append(imp)
-        f.close()
-
-        imports['internal'] = list(set(imports['internal']))
-        imports['external'] = list(set(imports['external']))
-
-        return imports
+    return classify_imports(find_imports(file_text), all_files)
+
+
+# Modules of the standard library (linked to the official documentation)
+STDLIB = frozenset(['string', 're', 'difflib', 'textwrap', 'unicodedata',
+                    'stringprep', 'readline', 'rlcompleter', 'struct',
+                    'codecs', 'datetime', 'calendar', 'collections',
+                    'collections.abc', 'heapq', 'bisect', 'array', 'weakref',
+                    'types', 'copy', 'pprint', 'reprlib', 'enum', 'numbers',
+                    'math', 'cmath', 'decimal', 'fractions', 'random',
+                    'statistics', 'itertools', 'functools', 'operator',
+                    'pathlib', 'os.path', 'fileinput', 'stat', 'filecmp',
+                    'tempfile', 'glob', 'fnmatch', 'linecache', 'shutil',
+                    'pickle', 'copyreg', 'shelve', 'marshal', 'dbm', 'sqlite3',
+                    'zlib', 'gzip', 'bz2', 'lzma', 'zpifile', 'tarfile', 'csv',
+                    'configparser', 'netrc', 'xdrlib', 'plistlib', 'hashlib',
+                    'hmac', 'secrets', 'os', 'io', 'time', 'argparse',
+                    'getopt', 'logging', 'logging.config', 'logging.handlers',
+                    'getpass', 'curses', 'curses.textpad', 'curses.ascii',
+                    'curses.panel', 'platform', 'errno', 'ctypes', 'threading',
+                    'multiprocessing', 'multiprocessing.shared_memory',
+                    'concurrent', 'concurrent.futures', 'subprocess', 'sched',
+                    'queue', '_thread', '_dummy_thread', 'dummy_threading',
+                    'contextvars', 'asyncio', 'socket', 'ssl', 'select',
+                    'selectors', 'asyncore', 'asynchat', 'signal', 'mmap',
+                    'email', 'json', 'mailcap', 'mailbox', 'mimetypes',
+                    'base64', 'binhex', 'binascii', 'quopri', 'uu', 'html',
+                    'html.parser', 'html.entities', 'xml.etree.ElementTree',
+                    'xml.dom', 'xml.dom.minidom', 'xml.dom.pulldom', 'xml.sax',
+                    'xml.sax.handler', 'xml.sax.saxutils', 'xml.sax.xmlreader',
+                    'xml.parsers.expat', 'webbrowser', 'cgi', 'cgitb',
+                    'wsgiref', 'urllib', 'urllib.request', 'urllib.response',
+                    'urllib.parse', 'urllib.error', 'urllib.robotparser',
+                    'http', 'http.client', 'ftplib', 'poplib', 'imaplib',
+                    'nntplib', 'smtplib', 'smtpd', 'telnetlib', 'uuid',
+                    'socketserver', 'http.server', 'http.cookies',
+                    'http.cookiejar', 'xmlrpc', 'xmlrpc.client',
+                    'xmlrpc.server', 'ipaddress', 'audioop', 'aifc', 'sunau',
+                    'wave', 'chunk', 'colorsys', 'imghdr', 'sndhdr',
+                    'ossaudiodev', 'gettext', 'locale', 'turtle', 'cmd',
+                    'shlex', 'tkinter', 'tkinter.ttk', 'tkinter.tix',
+                    'tkinter.scrolledtext', 'IDLE', 'typing', 'pydoc',
+                    'doctest', 'unittest', 'unittest.mock', 'unittest.mock',
+                    '2to3', 'test', 'test.support',
+                    'test.support.script_helper', 'audit_events', 'bdb',
+                    'faulthandler', 'pdb', 'profile', 'timeit', 'trace',
+                    'tracemalloc', 'distutils', 'ensurepip', 'venv', 'zipapp',
+                    'sys', 'sysconfig', 'builtins', '__main__', 'warnings',
+                    'dataclasses', 'contextlib', 'abc', 'atexit', 'traceback',
+                    '__future__', 'gc', 'inspect', 'site', 'code', 'codeop',
+                    'zipimport', 'pkgutil', 'modulefinder', 'runpy',
+                    'importlib', 'importlib.metadata', 'parser', 'ast',
+                    'symtable', 'symbol', 'token', 'keyword', 'tokenize',
+                    'tabnanny', 'pyclbr', 'py_compile', 'compileall', 'dis',
+                    'pickletools', 'formatter', 'msilib', 'msvcrt', 'winreg',
+                    'winsound', 'posix', 'pwd', 'spwd', 'grp', 'crypt',
+                    'termios', 'tty', 'pty', 'fcntl', 'pipes', 'resource',
+                    'nis', 'syslog', 'optparse', 'imp'])
 
 
 # Imports to HTML ____________________________________________________________
@@ -426,64 +647,9 @@ def imports_to_html(files, file, imports):
         external_pip = []
         stdpgk = []
 
-        # List of standard libraries
-        stdlib = ["string", 're', 'difflib', 'textwrap', 'unicodedata',
-                  'stringprep', 'readline', 'rlcompleter', 'struct', 'codecs',
-                  'datetime', 'calendar', 'collections', 'collections.abc',
-                  'heapq', 'bisect', 'array', 'weakref', 'types', 'copy',
-                  'pprint', 'reprlib', 'enum', 'numbers', 'math', 'cmath',
-                  'decimal', 'fractions', 'random', 'statistics', 'itertools',
-                  'functools', 'operator', 'pathlib', 'os.path', 'fileinput',
-                  'stat', 'filecmp', 'tempfile', 'glob', 'fnmatch',
-                  'linecache', 'shutil', 'pickle', 'copyreg', 'shelve',
-                  'marshal', 'dbm', 'sqlite3', 'zlib', 'gzip', 'bz2', 'lzma',
-                  'zpifile', 'tarfile', 'csv', 'configparser', 'netrc',
-                  'xdrlib', 'plistlib', 'hashlib', 'hmac', 'secrets', 'os',
-                  'io', 'time', 'argparse', 'getopt', 'logging',
-                  'logging.config', 'logging.handlers', 'getpass', 'curses',
-                  'curses.textpad', 'curses.ascii', 'curses.panel',
-                  'platform', 'errno', 'ctypes', 'threading',
-                  'multiprocessing', 'multiprocessing.shared_memory',
-                  'concurrent', 'concurrent.futures', 'subprocess', 'sched',
-                  'queue', '_thread', '_dummy_thread', 'dummy_threading',
-                  'contextvars', 'asyncio', 'socket', 'ssl', 'select',
-                  'selectors', 'asyncore', 'asynchat', 'signal', 'mmap',
-                  'email', 'json', 'mailcap', 'mailbox', 'mimetypes',
-                  'base64', 'binhex', 'binascii', 'quopri', 'uu', 'html',
-                  'html.parser', 'html.entities', 'xml.etree.ElementTree',
-                  'xml.dom', 'xml.dom.minidom', 'xml.dom.pulldom', 'xml.sax',
-                  'xml.sax.handler', 'xml.sax.saxutils', 'xml.sax.xmlreader',
-                  'xml.parsers.expat', 'webbrowser', 'cgi', 'cgitb',
-                  'wsgiref', 'urllib', 'urllib.request', 'urllib.response',
-                  'urllib.parse', 'urllib.error', 'urllib.robotparser',
-                  'http', 'http.client', 'ftplib', 'poplib', 'imaplib',
-                  'nntplib', 'smtplib', 'smtpd', 'telnetlib', 'uuid',
-                  'socketserver', 'http.server', 'http.cookies',
-                  'http.cookiejar', 'xmlrpc', 'xmlrpc.client',
-                  'xmlrpc.server', 'ipaddress', 'audioop', 'aifc', 'sunau',
-                  'wave', 'chunk', 'colorsys', 'imghdr', 'sndhdr',
-                  'ossaudiodev', 'gettext', 'locale', 'turtle', 'cmd',
-                  'shlex', 'tkinter', 'tkinter.ttk', 'tkinter.tix',
-                  'tkinter.scrolledtext', 'IDLE', 'typing', 'pydoc',
-                  'doctest', 'unittest', 'unittest.mock', 'unittest.mock',
-                  '2to3', 'test', 'test.support',
-                  'test.support.script_helper', 'audit_events', 'bdb',
-                  'faulthandler', 'pdb', 'profile', 'timeit', 'trace',
-                  'tracemalloc', 'distutils', 'ensurepip', 'venv', 'zipapp',
-                  'sys', 'sysconfig', 'builtins', '__main__', 'warnings',
-                  'dataclasses', 'contextlib', 'abc', 'atexit', 'traceback',
-                  '__future__', 'gc', 'inspect', 'site', 'code', 'codeop',
-                  'zipimport', 'pkgutil', 'modulefinder', 'runpy',
-                  'importlib', 'importlib.metadata', 'parser', 'ast',
-                  'symtable', 'symbol', 'token', 'keyword', 'tokenize',
-                  'tabnanny', 'pyclbr', 'py_compile', 'compileall', 'dis',
-                  'pickletools', 'formatter', 'msilib', 'msvcrt', 'winreg',
-                  'winsound', 'posix', 'pwd', 'spwd', 'grp', 'crypt',
-                  'termios', 'tty', 'pty', 'fcntl', 'pipes', 'resource',
-                  'nis', 'syslog', 'optparse', 'imp']
 
         for imp in imports['external']:
-            if imp in stdlib:
+            if imp in STDLIB:
                 stdpgk.append(imp)
 
             else:
@@ -502,7 +668,7 @@ def imports_to_html(files, file, imports):
                 html += '</li>'
             html += "</ul>"
 
-        external_pip = list(set(external_pip))
+        external_pip = sorted(set(external_pip))
         if external_pip != []:
             html += '<h3>External Packages</h3><ul>'
             for imp in external_pip:
@@ -527,116 +693,127 @@ def imports_to_html(files, file, imports):
     return html
 
 
-# Geenerate doc from filename ________________________________________________
+# Extract definitions from source ___________________________________________
 
-def generate_doc(filename):
+def extract_definitions(text):
     """
     Description
     -----------
     
-    Generates a HTML block for every docstring in the file <filename>
-    
-    The documentation strings must follow the Numpy docstring format.
+    Detects  all  the  functions  and classes declarations of a Python source
+    and their docstrings.
     
-    This function :
-        - Opens the file "filename"
-        - Detects all the functions and classes declarations
-        - Generates HTML for every docstring
-        - Generates HTML for the docstring of the file
-
     Parameters
     ----------
-    filename : string
-        Path leading to the file you want to generate the documentation from.
-
+    
+    text : str
+        Python source code
+    
     Returns
     -------
-    string
-        HTML string containing the documentation
-
+    
+    list of dict
+        One dict per function / class, in order of appearance, containing :
+            - def :         (str)   Fct / class definition line
+            - docstring :   (str)   Docstring of the fct/class (or None)
+            - last_ind :    (int)   Lowest  indentation  level encountered
+                                    since last function / class definition
+            - ind :         (int)   Indentation level of the fct/class
+            - type :        (str)   "class" of "def"
+    
     """
 
-    # opening file ...........................................................
-
-    with open(filename, 'r', encoding="utf8") as file:
+    # Finding all the docstrings .............................................
 
-        # Finding all the docstrings .........................................
+    all_lines = text.split('\n')
 
-        text = file.read()
+    last_obj_ind = 0  # Last object indentation level
 
-        all_lines = text.split('\n')
+    i_l = 0  # Line number (index)
 
-        last_obj_ind = 0  # Last object indentation level
+    # The  following  variable  is the list of all the functions / classes
+    # that  are  defined in the file. Every element of this list is a dict
+    # containing the following fields :
+    #       - def :         (str)   Fct / class definition line
+    #       - docstring :   (str)   Docstring of the fct/class
+    #       - last_ind :    (int)   Lowest  indentation  level encountered
+    #                               since last function / class definition
+    #       - ind :         (int)   Indentation level of the fct/class
+    #       - type :        (str)   "class" of "def"
+    def_list = []
 
-        i_l = 0  # Line number (index)
+    # For all lines of the Python file
+    while i_l < len(all_lines):
 
-        # The  following  variable  is the list of all the functions / classes
-        # that  are  defined in the file. Every element of this list is a dict
-        # containing the following fields :
-        #       - def :         (str)   Fct / class definition line
-        #       - docstring :   (str)   Docstring of the fct/class
-        #       - last_ind :    (int)   Lowest  indentation  level encountered
-        #                               since last function / class definition
-        #       - ind :         (int)   Indentation level of the fct/class
-        #       - type :        (str)   "class" of "def"
-        def_list = []
+        line = all_lines[i_l]  # Current Line
+        i_c = 0  # Char of the current line index
+        i_c_is_1st_nonspace_char = True
 
-        # For all lines of the Python file
-        while i_l < len(all_lines):
+        # For each char of the line
+        indentation_level = 0
+        while i_c < len(line):
 
-            line = all_lines[i_l]  # Current Line
-            i_c = 0  # Char of the current line index
-            i_c_is_1st_nonspace_char = True
+            # Finding indentation level  . . . . . . . . . . . . . . . . . . .
 
-            # For each char of the line
-            indentation_level = 0
-            while i_c < len(line):
+            while line[i_c] == ' ':
+                indentation_level += 1
+                i_c += 1
+                while i_c == len(line):
+
+                    i_l += 1
+                    if i_l >= len(all_lines): break
+                    line = all_lines[i_l]
+                    i_c = 0
+                    indentation_level = 0
+                    i_c_is_1st_nonspace_char = True
+                if i_l >= len(all_lines):
+                    break
 
-                # Finding indentation level  . . . . . . . . . . . . . . . . .
+            if i_c == len(line):
+                break
+            if i_l >= len(all_lines):
+                break
 
-                while line[i_c] == ' ':
-                    indentation_level += 1
-                    i_c += 1
-                    while i_c == len(line):
+            if not i_c_is_1st_nonspace_char and \
+                    indentation_level < last_obj_ind:
+                last_obj_ind = indentation_level
 
-                        i_l += 1
-                        if i_l >= len(all_lines): break
-                        line = all_lines[i_l]
-                        i_c = 0
-                        indentation_level = 0
-                        i_c_is_1st_nonspace_char = True
-                    if i_l >= len(all_lines):
-                        break
+            # Checking if the line is commented  . . . . . . . . . . . . . . .
 
-                if i_c == len(line):
-                    break
-                if i_l >= len(all_lines):
-                    break
+            if line[i_c] == '#':
+                break
 
-                if not i_c_is_1st_nonspace_char and \
-                        indentation_level < last_obj_ind:
-                    last_obj_ind = indentation_level
+            # Finding functions definitions  . . . . . . . . . . . . . . . . .
 
-                # Checking if the line is commented  . . . . . . . . . . . . .
+            function_found = False
+            fun_def = ''
 
-                if line[i_c] == '#':
-                    break
+            if i_c + 4 < len(line) and line[i_c:i_c + 4] in ['def ',
+                                                             'def\\'] \
+                    and i_c_is_1st_nonspace_char:
 
-                # Finding functions definitions  . . . . . . . . . . . . . . .
+                i_c += 3
 
-                function_found = False
                 fun_def = ''
 
-                if i_c + 4 < len(line) and line[i_c:i_c + 4] in ['def ',
-                                                                 'def\\'] \
-                        and i_c_is_1st_nonspace_char:
-
-                    i_c += 3
-
-                    fun_def = ''
+                # Finding the opening parenthesis
+                while line[i_c] != '(':
+                    i_c += 1
+                    # Going to the next line if necessary
+                    if i_c == len(line):
+                        i_l += 1
+                        line = all_lines[i_l]
+                        i_c = 0
+                        i_c_is_1st_nonspace_char = True
+                    fun_def += line[i_c]
 
-                    # Finding the opening parenthesis
-                    while line[i_c] != '(':
+                # Mathcing the closing parenthesis
+                open_par = 1
+                i_c += 1
+                while open_par != 0:
+                    # Ignoring parentheses in strings
+                    if i_c > 0 and line[i_c] == '"':
+                        fun_def += line[i_c]
                         i_c += 1
                         # Going to the next line if necessary
                         if i_c == len(line):
@@ -646,34 +823,7 @@ def generate_doc(filename):
                             i_c_is_1st_nonspace_char = True
                         fun_def += line[i_c]
 
-                    # Mathcing the closing parenthesis
-                    open_par = 1
-                    i_c += 1
-                    while open_par != 0:
-                        # Ignoring parentheses in strings
-                        if i_c > 0 and line[i_c] == '"':
-                            fun_def += line[i_c]
-                            i_c += 1
-                            # Going to the next line if necessary
-                            if i_c == len(line):
-                                i_l += 1
-                                line = all_lines[i_l]
-                                i_c = 0
-                                i_c_is_1st_nonspace_char = True
-                            fun_def += line[i_c]
-
-                            while line[i_c] != '"':
-                                i_c += 1
-                                # Going to the next line if necessary
-                                if i_c == len(line):
-                                    i_l += 1
-                                    line = all_lines[i_l]
-                                    i_c = 0
-                                    i_c_is_1st_nonspace_char = True
-                                fun_def += line[i_c]
-                            fun_def = fun_def[:-1]
-                        if i_c > 0 and line[i_c] == "'":
-                            fun_def += line[i_c]
+                        while line[i_c] != '"':
                             i_c += 1
                             # Going to the next line if necessary
                             if i_c == len(line):
@@ -682,21 +832,8 @@ def generate_doc(filename):
                                 i_c = 0
                                 i_c_is_1st_nonspace_char = True
                             fun_def += line[i_c]
-                            while line[i_c] != "'":
-                                i_c += 1
-                                # Going to the next line if necessary
-                                if i_c == len(line):
-                                    i_l += 1
-                                    line = all_lines[i_l]
-                                    i_c = 0
-                                    i_c_is_1st_nonspace_char = True
-                                fun_def += line[i_c]
-                            fun_def = fun_def[:-1]
-
-                        if line[i_c] == '(':
-                            open_par += 1
-                        elif line[i_c] == ')':
-                            open_par -= 1
+                        fun_def = fun_def[:-1]
+                    if i_c > 0 and line[i_c] == "'":
                         fun_def += line[i_c]
                         i_c += 1
                         # Going to the next line if necessary
@@ -705,682 +842,5168 @@ def generate_doc(filename):
                             line = all_lines[i_l]
                             i_c = 0
                             i_c_is_1st_nonspace_char = True
+                        fun_def += line[i_c]
+                        while line[i_c] != "'":
+                            i_c += 1
+                            # Going to the next line if necessary
+                            if i_c == len(line):
+                                i_l += 1
+                                line = all_lines[i_l]
+                                i_c = 0
+                                i_c_is_1st_nonspace_char = True
+                            fun_def += line[i_c]
+                        fun_def = fun_def[:-1]
 
-                    # Until we reach ':'
-                    while line[i_c] != ':':
-                        i_c += 1
-                        if i_c == len(line):
-                            i_l += 1
-                            line = all_lines[i_l]
-                            i_c = 0
-                            i_c_is_1st_nonspace_char = True
-
-                    fun_def = fun_def.replace(" ", "").replace(',', ', ')
-
-                    function_found = True
-
-                # Finding class definitions  . . . . . . . . . . . . . . . . .
-
-                class_found = False
+                    if line[i_c] == '(':
+                        open_par += 1
+                    elif line[i_c] == ')':
+                        open_par -= 1
+                    fun_def += line[i_c]
+                    i_c += 1
+                    # Going to the next line if necessary
+                    if i_c == len(line):
+                        i_l += 1
+                        line = all_lines[i_l]
+                        i_c = 0
+                        i_c_is_1st_nonspace_char = True
 
-                if i_c + 6 < len(line) and line[i_c:i_c + 6] in ['class ',
-                                                                 'class\\'] \
-                        and i_c_is_1st_nonspace_char:
+                # Until we reach ':'
+                while line[i_c] != ':':
+                    i_c += 1
+                    if i_c == len(line):
+                        i_l += 1
+                        line = all_lines[i_l]
+                        i_c = 0
+                        i_c_is_1st_nonspace_char = True
 
-                    class_found = True
+                fun_def = fun_def.replace(" ", "").replace(',', ', ')
 
-                    i_c += 5
+                function_found = True
 
-                    fun_def = ''
+            # Finding class definitions  . . . . . . . . . . . . . . . . . . .
 
-                    # Until we reach ':'
-                    while line[i_c] != ':':
-                        fun_def += line[i_c]
-                        # Mathcing the closing parenthesis
-                        if line[i_c] == '(':
-                            open_par = 1
-                            i_c += 1
-                            while open_par != 0:
-                                if line[i_c] == '(':
-                                    open_par += 1
-                                elif line[i_c] == ')':
-                                    open_par -= 1
-                                fun_def += line[i_c]
-                                if open_par != 0:
-                                    i_c += 1
-                                # Going to the next line if necessary
-                                if i_c == len(line):
-                                    i_l += 1
-                                    line = all_lines[i_l]
-                                    i_c = 0
-                                    i_c_is_1st_nonspace_char = True
-                        i_c += 1
-                        if i_c == len(line):
-                            i_l += 1
-                            line = all_lines[i_l]
-                            i_c = 0
-                            i_c_is_1st_nonspace_char = True
+            class_found = False
 
-                    fun_def = fun_def.replace(" ", "").replace(',', ', ')
+            if i_c + 6 < len(line) and line[i_c:i_c + 6] in ['class ',
+                                                             'class\\'] \
+                    and i_c_is_1st_nonspace_char:
 
-                    function_found = True
+                class_found = True
 
-                # Finding docstring  . . . . . . . . . . . . . . . . . . . . .
+                i_c += 5
 
-                if function_found or class_found:
-
-                    # Finding docstring
-                    i_c += 1
-                    while i_c == len(line):
-                        i_l += 1
-                        line = all_lines[i_l]
-                        i_c = 0
-                        i_c_is_1st_nonspace_char = True
-                    if len(line) > 0:
-                        while line[i_c] == ' ':
-                            i_c += 1
-                            while i_c == len(line):
-                                i_l += 1
-                                line = all_lines[i_l]
-                                i_c = 0
-                                i_c_is_1st_nonspace_char = True
-
-                    if line[i_c:i_c + 3] == '"""':
-                        docstrquotes = '"'
-                    elif line[i_c:i_c + 3] == "'''":
-                        docstrquotes = "'"
-                    else:
-                        docstrquotes = ''
-
-                    if docstrquotes != '':
-                        i_c += 3
-                        lastchar = line[i_c - 1]
-                        docstr = ''
-                        match = 3 * docstrquotes
-                        while line[i_c:i_c + 3] != match or lastchar == '\\':
-                            i_c += 1
-                            while i_c >= len(line):
-                                docstr += '\n'
-                                i_l += 1
-                                line = all_lines[i_l]
-                                i_c = 0
-                                i_c_is_1st_nonspace_char = True
-                            lastchar = line[i_c - 1]
-                            docstr += line[i_c]
-                    else:
-                        docstr = None
-
-                    if docstr is not None:
-                        docstr = docstr[:-1]
-                    type_ = "class" if class_found else "def"
-                    # Adding the object to the list
-                    def_dict = {'def': fun_def,
-                                'docstring': docstr,
-                                'last_ind': last_obj_ind,
-                                'ind': indentation_level,
-                                'type': type_}
-
-                    def_list.append(def_dict)
-
-                    last_obj_ind = indentation_level
-
-                # Checking quotes to not consider strings  . . . . . . . . . .
-
-                # If the quote char is not preceded by a backslash
-                if i_c > 0 and line[i_c - 1] != '\\' or i_c == 0:
-
-                    # If we encounter a single quote
-                    if line[i_c] == "'":
-
-                        # Loop until the string closes
-                        while line[i_c] != "'" or i_c > 0 and line[i_c - 1] \
-                                == '\\':
-                            i_c += 1
+                fun_def = ''
 
+                # Until we reach ':'
+                while line[i_c] != ':':
+                    fun_def += line[i_c]
+                    # Mathcing the closing parenthesis
+                    if line[i_c] == '(':
+                        open_par = 1
+                        i_c += 1
+                        while open_par != 0:
+                            if line[i_c] == '(':
+                                open_par += 1
+                            elif line[i_c] == ')':
+                                open_par -= 1
+                            fun_def += line[i_c]
+                            if open_par != 0:
+                                i_c += 1
                             # Going to the next line if necessary
                             if i_c == len(line):
                                 i_l += 1
                                 line = all_lines[i_l]
                                 i_c = 0
                                 i_c_is_1st_nonspace_char = True
+                    i_c += 1
+                    if i_c == len(line):
+                        i_l += 1
+                        line = all_lines[i_l]
+                        i_c = 0
+                        i_c_is_1st_nonspace_char = True
 
-                    # If we encounter double quotes
-                    if line[i_c] == '"':
+                fun_def = fun_def.replace(" ", "").replace(',', ', ')
 
-                        # Loop until the string closes
-                        while line[i_c] != '"' or i_c > 0 and line[i_c - 1] \
-                                == '\\':
-                            i_c += 1
+                function_found = True
 
-                            # Going to the next line if necessary
-                            if i_c == len(line):
-                                i_l += 1
-                                line = all_lines[i_l]
-                                i_c = 0
-                                i_c_is_1st_nonspace_char = True
+            # Finding docstring  . . . . . . . . . . . . . . . . . . . . . . .
 
-                i_c_is_1st_nonspace_char = False
+            if function_found or class_found:
 
-                # Going to the next char
+                # Finding docstring
                 i_c += 1
+                while i_c == len(line):
+                    i_l += 1
+                    line = all_lines[i_l]
+                    i_c = 0
+                    i_c_is_1st_nonspace_char = True
+                if len(line) > 0:
+                    while line[i_c] == ' ':
+                        i_c += 1
+                        while i_c == len(line):
+                            i_l += 1
+                            line = all_lines[i_l]
+                            i_c = 0
+                            i_c_is_1st_nonspace_char = True
 
-            # Going to the next line
-            i_l += 1
-
-        # Generating the HTML ................................................
-
-        html = ''
-        if def_list:
-
-            html += generate_html_from_fct(def_list[0]['def'],
-                                           def_list[0]['docstring'],
-                                           def_list[0]['type'])
-            delta_indent = 0
-            i_f = 1
-            while i_f < len(def_list):
-                fct = def_list[i_f]
-                delta_indent = (fct['ind'] - fct['last_ind']) // 4
-
-                # Fct is declared in the previous fct
-                if delta_indent > 0:
-                    # It is a nested function / class
-                    if def_list[i_f - 1]['type'] == 'def':
-                        # Nested function
-                        if fct['type'] == 'def':
-                            html += '<h3>Nested Functions</h3>'
-                        # Inner class
-                        else:
-                            html += '<h3>Inner Classes</h3>'
-                    # It is an inner class or a method
-                    else:
-                        # Method
-                        if fct['type'] == 'def':
-                            html += '<h3>Methods</h3>'
-                        # Inner class
-                        else:
-                            html += '<h3>Inner Classes</h3>'
-
-                    html += generate_html_from_fct(fct['def'],
-                                                   fct['docstring'],
-                                                   fct['type'])
+                if line[i_c:i_c + 3] == '"""':
+                    docstrquotes = '"'
+                elif line[i_c:i_c + 3] == "'''":
+                    docstrquotes = "'"
                 else:
-                    while delta_indent <= 0:
-                        html += '</details>'
-                        delta_indent += 1
-                    html += generate_html_from_fct(fct['def'],
-                                                   fct['docstring'],
-                                                   fct['type'])
+                    docstrquotes = ''
 
-                i_f += 1
+                if docstrquotes != '':
+                    i_c += 3
+                    lastchar = line[i_c - 1]
+                    docstr = ''
+                    match = 3 * docstrquotes
+                    while line[i_c:i_c + 3] != match or lastchar == '\\':
+                        i_c += 1
+                        while i_c >= len(line):
+                            docstr += '\n'
+                            i_l += 1
+                            line = all_lines[i_l]
+                            i_c = 0
+                            i_c_is_1st_nonspace_char = True
+                        lastchar = line[i_c - 1]
+                        docstr += line[i_c]
+                else:
+                    docstr = None
 
-            while delta_indent >= 0:
-                html += '</details>'
-                delta_indent -= 1
-            html = "<h2>Functions & Classes</h2>" + html
+                if docstr is not None:
+                    docstr = docstr[:-1]
+                type_ = "class" if class_found else "def"
+                # Adding the object to the list
+                def_dict = {'def': fun_def,
+                            'docstring': docstr,
+                            'last_ind': last_obj_ind,
+                            'ind': indentation_level,
+                            'type': type_}
 
-        # Finding the file docstring .........................................
+                def_list.append(def_dict)
 
-        i_l = 0
-        docstr_found_dbl = False
-        docstr_found_smp = False
-        file_docstr = ""
-        for line in all_lines:
+                last_obj_ind = indentation_level
 
-            if docstr_found_dbl or docstr_found_smp:
-                file_docstr += line + '\n'
+            # Checking quotes to not consider strings  . . . . . . . . . . . .
 
-            # Ignoring empty lines
-            if line.strip() == '':
-                continue
+            # If the quote char is not preceded by a backslash
+            if i_c > 0 and line[i_c - 1] != '\\' or i_c == 0:
 
-            # Ignoring comment lines
-            if line.strip()[0] == '#':
-                continue
+                # If we encounter a single quote
+                if line[i_c] == "'":
 
-            # Docstring found
-            if line[:3] == '"""':
-                if not (docstr_found_dbl or docstr_found_smp):
-                    docstr_found_dbl = True
-                    file_docstr += file_docstr[3:] + '\n'
-                elif docstr_found_dbl:
-                    break
+                    # Loop until the string closes
+                    while line[i_c] != "'" or i_c > 0 and line[i_c - 1] \
+                            == '\\':
+                        i_c += 1
 
-            # Docstring found
-            elif line[:3] == "'''":
-                if not (docstr_found_dbl or docstr_found_smp):
-                    docstr_found_smp = True
-                    file_docstr += file_docstr[3:] + '\n'
-                elif docstr_found_smp:
-                    break
+                        # Going to the next line if necessary
+                        if i_c == len(line):
+                            i_l += 1
+                            line = all_lines[i_l]
+                            i_c = 0
+                            i_c_is_1st_nonspace_char = True
 
-            # No docstring
-            elif not (docstr_found_dbl or docstr_found_smp):
-                break
-        file_docstr = file_docstr[:-3]
+                # If we encounter double quotes
+                if line[i_c] == '"':
+
+                    # Loop until the string closes
+                    while line[i_c] != '"' or i_c > 0 and line[i_c - 1] \
+                            == '\\':
+                        i_c += 1
+
+                        # Going to the next line if necessary
+                        if i_c == len(line):
+                            i_l += 1
+                            line = all_lines[i_l]
+                            i_c = 0
+                            i_c_is_1st_nonspace_char = True
 
-        par = parse_docstr(file_docstr).replace('<h3>Description</h3>', '')
+            i_c_is_1st_nonspace_char = False
 
-        html = "<h2>File Description</h2>" + par + html
+            # Going to the next char
+            i_c += 1
 
-        # Adding content division around HTML
-        html = '<div class="content">' + html + "</div>"
-    return html
+        # Going to the next line
+        i_l += 1
 
+    return def_list
 
-# Generate Navigation Menu ___________________________________________________
 
-def side_menu(files, file_):
+# Extract file docstring _____________________________________________________
+
+def extract_file_docstring(text):
     """
     Description
     -----------
     
-    Generates  the  HTML block for the side menu for navigation between docapy
-    files. The block is a div which class is "sideMenu". Folders are <details>
-    elements. Files are hyperlinks <a> elements.
-
+    Finds the docstring at the beginning of a Python source
+    
     Parameters
     ----------
-    files : list of str
-        List of all the files of the project. Every element is the path to the
-        py file : "./<pathToTheFile>/file.py" where . is the project directory
-        List must be sorted in alphabetical order
     
-    file_ : str
-        Path of the file for which you want to generate the menu block
-
+    text : str
+        Python source code
+    
     Returns
     -------
+    
     str
-        HTML block containing the side menu
+        Docstring of the file ('' if there is none)
+    
     """
 
-    pathback = '../' * (len(file_.split('/')) - 2)
+    all_lines = text.split('\n')
 
-    # Creating HTML block
-    html = '<div class="sideMenu"><span class="browse">Browse Project ' \
-           'Files' + '</span>'
+    # Finding the file docstring .............................................
 
-    lastfile = ['.']
-    for file in files:
+    docstr_found_dbl = False
+    docstr_found_smp = False
+    file_docstr = ""
+    for line in all_lines:
 
-        sub_dirs = file.split('/')[1:]
+        if docstr_found_dbl or docstr_found_smp:
+            file_docstr += line + '\n'
 
-        open_details = len(lastfile) - 1
+        # Ignoring empty lines
+        if line.strip() == '':
+            continue
 
-        # Checking similarities with the last file
-        details_to_open = []
-        for i_s, subdir in enumerate(sub_dirs[:-1]):
-            if subdir == lastfile[i_s]:
-                open_details -= 1
-            else:
-                details_to_open += sub_dirs[i_s:-1]
+        # Ignoring comment lines
+        if line.strip()[0] == '#':
+            continue
+
+        # Docstring found
+        if line[:3] == '"""':
+            if not (docstr_found_dbl or docstr_found_smp):
+                docstr_found_dbl = True
+                file_docstr += file_docstr[3:] + '\n'
+            elif docstr_found_dbl:
                 break
 
-        for _ in range(open_details):
-            html += "</details>"
+        # Docstring found
+        elif line[:3] == "'''":
+            if not (docstr_found_dbl or docstr_found_smp):
+                docstr_found_smp = True
+                file_docstr += file_docstr[3:] + '\n'
+            elif docstr_found_smp:
+                break
 
-        for det in details_to_open:
-            html += '<details class="menuDetails"><summary class="menuSum' + \
-                    'mary">' + det + '</summary>'
+        # No docstring
+        elif not (docstr_found_dbl or docstr_found_smp):
+            break
+    file_docstr = file_docstr[:-3]
 
-        if file_ == file:
-            html += '<span class="blue">'
-        html += '<a href="' + pathback + '/'.join(sub_dirs[:-1]) + \
-                ('/' if len(sub_dirs[:-1]) else '') + sub_dirs[-1][:-3] + \
-                '.html" class="menua">' + sub_dirs[-1] + '</a>'
-        if file == file_:
-            html += "</span>"
+    return file_docstr
 
-        lastfile = sub_dirs
 
-    # Closing the remaining opened details
-    for _ in range(len(lastfile) - 1):
-        html += "</details>"
+# Generate doc from extracted definitions ____________________________________
 
-    return html + "</div>"
+# Size  (in  bytes)  of  the  signatures  and docstrings of a file above which
+# definitions_to_html renders them in parallel, by default
+PARALLEL_THRESHOLD = 4 * 2 ** 20
 
 
-# Generate the html header ___________________________________________________
+def render_definitions(def_list, compact=False):
+    """
+    Returns  the  HTML  block  of  each function / class of def_list (see
+    generate_html_from_fct). Used by the workers of definitions_to_html
+    """
+
+    return [generate_html_from_fct(fct['def'], fct['docstring'], fct['type'],
+                                   compact) for fct in def_list]
+
 
-def html_header(file, project_name, github):
+def render_definitions_parallel(def_list, compact=False, workers=None):
     """
     Description
     -----------
     
-    Generates the HTML header for the specified file and the specified project
+    Same  as  render_definitions  on  a  pool  of  worker processes. The
+    definitions  are  split  in  chunks  of  about  the  same  size  at the
+    top-level  definitions (a class stays with its methods) and the blocks
+    are  returned  in  order.  In a daemonic process (a worker of a pool),
+    which cannot have children, they are rendered by render_definitions.
     
     Parameters
     ----------
     
-    file : str
-        Path of the Python file corresponding to the HTML file
+    def_list : list of dict
+        Functions / classes of the file (see extract_definitions)
     
-    project_name : str
-        Name of your project
+    compact : bool, optional
+        Compact HTML for the code parts (see parse_docstr). Default is False
     
-    github : str
-        Github link of the project
+    workers : int, optional
+        Number of worker processes. Default is the number of CPUs
     
     Returns
     -------
     
-    str
-        HTML block containing the header
+    list of str
+        HTML block of each function / class
     
     """
 
-    filename = file.split('/')[-1]
-
-    # Metadata
-    html = '<!doctype html><html lang="en"><head><meta charset="utf-8">' + \
-           '<title>' + project_name + ' Documentation - ' + filename + \
-           '</title>'
-    html += '<meta name="author" content="' + 'Docapy' + '">'
+    import multiprocessing
 
-    # CSS Link
-    html += '<link rel="stylesheet" href="' + '../' * (
-            len(file.split('/')) - 2) + 'style.css"></head><body>'
+    workers = workers or os.cpu_count() or 1
+    sizes = [len(fct['def']) + len(fct['docstring'] or '')
+             for fct in def_list]
+    target = sum(sizes) / (4 * workers) + 1
 
-    # Navigation Bar
-    html += '<div class="navbar"><a href="' + '../' * \
-            (len(file.split('/')) - 2) + \
-            'index.html" class="titla"><span class="title"><span ' \
-            'class="blue">' + project_name + '</span>' + \
-            ' Documentation</span></a><span class="links"><a href="' + \
-            github + '">View Github</a><a href="' + \
-            'https://github.com/Teskann/Docapy">About Docapy</a></span>' \
-            '</div>'
+    chunks = [[]]
+    size = 0
+    for fct, fct_size in zip(def_list, sizes):
+        if size >= target and fct['ind'] == 0:
+            chunks.append([])
+            size = 0
+        chunks[-1].append(fct)
+        size += fct_size
 
-    return html
+    if workers == 1 or len(chunks) == 1 or \
+            multiprocessing.current_process().daemon:
+        return render_definitions(def_list, compact)
 
+    with multiprocessing.Pool(min(workers, len(chunks))) as pool:
+        results = pool.starmap(render_definitions,
+                               [(chunk, compact) for chunk in chunks])
+    return [block for blocks in results for block in blocks]
 
-# Generate HTML file for an entire project ___________________________________
 
-def html_for_project(directory, project_name, github, color='cyan'):
+def definitions_to_html(def_list, file_docstr, compact=False,
+                        parallel_threshold=PARALLEL_THRESHOLD):
     """
     Description
     -----------
     
-    Generates  many  HTML files for all the *.py files in the given directory.
-    Saves  every  HTML  file  in  a  directory  named  "docapy". The file tree
-    structure  of the project is copied in this folder. Every *py file has his
-    own HTML file containing all its documentation and references to the other
-    HTML files of the project.
-    
-    This  function  also  creates  an  index.html  file containing the project
-    overview.
-    
-    If  docapy  documentation  already  exists  for  this  project, it will be
-    overwritten.
+    Generates  the  documentation  HTML  of  a  file  from its definitions and
+    docstring
     
     Parameters
     ----------
     
-    directory : str
-        Directory of your project
+    def_list : list of dict
+        Functions / classes of the file (see extract_definitions)
     
-    project_name : str
-        Name of your project
+    file_docstr : str
+        Docstring of the file (see extract_file_docstring)
     
-    github : str
-        Github link of the project
+    compact : bool, optional
+        Compact HTML for the code parts (see parse_docstr). Default is False
     
-    color : str, optional
-        Accent color for the documentation. It can be one of these values :
-            - "blue"
-            - "cyan" (default)
-            - "red"
-            - "green"
-            - "orange"
-            - "purple"
-            - "#XXXXXX" where XXXXXX is a hexadecimal color value (custom)
+    parallel_threshold : int, optional
+        Size  (in  bytes)  of  the  signatures and docstrings above which the
+        functions / classes are rendered on a pool of worker processes (see
+        render_definitions_parallel).   Default   is   PARALLEL_THRESHOLD.
+        None never uses workers
     
     Returns
     -------
     
-    None
+    str
+        HTML string containing the documentation
     
     """
 
-    # File management ........................................................
+    # Rendering the blocks of the functions / classes ........................
 
-    # Moving to the project directory
-    abspath = os.path.abspath(directory).replace('\\', '/')
-    os.chdir(directory)
+    if parallel_threshold is not None and len(def_list) > 1 and \
+            sum(len(fct['def']) + len(fct['docstring'] or '')
+                for fct in def_list) > parallel_threshold:
+        blocks = render_definitions_parallel(def_list, compact)
+    else:
+        blocks = render_definitions(def_list, compact)
 
-    # Finding all *.py files if git  . . . . . . . . . . . . . . . . . . . . .
+    # Generating the HTML ....................................................
 
-    g = git.cmd.Git(".")
-    try:
-        files = g.ls_files().split('\n')
-        all_files = []
-        for file in files:
-            if fnmatch(file, "*.py"):
-                all_files.append("./" + file.replace('\\', '/'))
+    html = ''
+    if def_list:
+
+        parts = []  # Parts of the HTML, joined at the end
+        add = parts.append
+        add(blocks[0])
+        delta_indent = 0
+        i_f = 1
+        while i_f < len(def_list):
+            fct = def_list[i_f]
+            delta_indent = (fct['ind'] - fct['last_ind']) // 4
+
+            # Fct is declared in the previous fct
+            if delta_indent > 0:
+                # It is a nested function / class
+                if def_list[i_f - 1]['type'] == 'def':
+                    # Nested function
+                    if fct['type'] == 'def':
+                        add('<h3>Nested Functions</h3>')
+                    # Inner class
+                    else:
+                        add('<h3>Inner Classes</h3>')
+                # It is an inner class or a method
+                else:
+                    # Method
+                    if fct['type'] == 'def':
+                        add('<h3>Methods</h3>')
+                    # Inner class
+                    else:
+                        add('<h3>Inner Classes</h3>')
 
-    # Find all *.py files if no git  . . . . . . . . . . . . . . . . . . . . .
-    except git.exc.GitCommandError:
-        print("Git repository not found for the current project. "
-              "Trying to match all *.py files instead")
+                add(blocks[i_f])
+            else:
+                while delta_indent <= 0:
+                    add('</details>')
+                    delta_indent += 1
+                add(blocks[i_f])
 
-        all_files = []
-        pattern = "*.py"
-        for path, _, files in os.walk('.'):
-            for name in files:
-                if fnmatch(name, pattern):
-                    all_files.append(os.path.join(path, name)
-                                     .replace('\\', '/'))
+            i_f += 1
 
-    # Creates the docapy directory
-    if os.path.exists('docapy'):
-        shutil.rmtree('docapy')
-    os.makedirs("docapy")
+        while delta_indent >= 0:
+            add('</details>')
+            delta_indent -= 1
+        html = "<h2>Functions & Classes</h2>" + ''.join(parts)
 
-    # Writing the HTML files .................................................
+    par = parse_docstr(file_docstr, compact)
+    par = par.replace('<h3>Description</h3>', '')
 
-    external_imports = []
-    stdlib = ["string", 're', 'difflib', 'textwrap', 'unicodedata',
-              'stringprep', 'readline', 'rlcompleter', 'struct', 'codecs',
-              'datetime', 'calendar', 'collections', 'collections.abc',
-              'heapq', 'bisect', 'array', 'weakref', 'types', 'copy',
-              'pprint', 'reprlib', 'enum', 'numbers', 'math', 'cmath',
-              'decimal', 'fractions', 'random', 'statistics', 'itertools',
-              'functools', 'operator', 'pathlib', 'os.path', 'fileinput',
-              'stat', 'filecmp', 'tempfile', 'glob', 'fnmatch', 'linecache',
-              'shutil', 'pickle', 'copyreg', 'shelve', 'marshal', 'dbm',
-              'sqlite3', 'zlib', 'gzip', 'bz2', 'lzma', 'zpifile', 'tarfile',
-              'csv', 'configparser', 'netrc', 'xdrlib', 'plistlib', 'hashlib',
-              'hmac', 'secrets', 'os', 'io', 'time', 'argparse', 'getopt',
-              'logging', 'logging.config', 'logging.handlers', 'getpass',
-              'curses', 'curses.textpad', 'curses.ascii', 'curses.panel',
-              'platform', 'errno', 'ctypes', 'threading', 'multiprocessing',
-              'multiprocessing.shared_memory', 'concurrent',
-              'concurrent.futures', 'subprocess', 'sched', 'queue', '_thread',
-              '_dummy_thread', 'dummy_threading', 'contextvars', 'asyncio',
-              'socket', 'ssl', 'select', 'selectors', 'asyncore', 'asynchat',
-              'signal', 'mmap', 'email', 'json', 'mailcap', 'mailbox',
-              'mimetypes', 'base64', 'binhex', 'binascii', 'quopri', 'uu',
-              'html', 'html.parser', 'html.entities', 'xml.etree.ElementTree',
-              'xml.dom', 'xml.dom.minidom', 'xml.dom.pulldom', 'xml.sax',
-              'xml.sax.handler', 'xml.sax.saxutils', 'xml.sax.xmlreader',
-              'xml.parsers.expat', 'webbrowser', 'cgi', 'cgitb', 'wsgiref',
-              'urllib', 'urllib.request', 'urllib.response', 'urllib.parse',
-              'urllib.error', 'urllib.robotparser', 'http', 'http.client',
-              'ftplib', 'poplib', 'imaplib', 'nntplib', 'smtplib', 'smtpd',
-              'telnetlib', 'uuid', 'socketserver', 'http.server',
-              'http.cookies', 'http.cookiejar', 'xmlrpc', 'xmlrpc.client',
-              'xmlrpc.server', 'ipaddress', 'audioop', 'aifc', 'sunau',
-              'wave', 'chunk', 'colorsys', 'imghdr', 'sndhdr', 'ossaudiodev',
-              'gettext', 'locale', 'turtle', 'cmd', 'shlex', 'tkinter',
-              'tkinter.ttk', 'tkinter.tix', 'tkinter.scrolledtext', 'IDLE',
-              'typing', 'pydoc', 'doctest', 'unittest', 'unittest.mock',
-              'unittest.mock', '2to3', 'test', 'test.support',
-              'test.support.script_helper', 'audit_events', 'bdb',
-              'faulthandler', 'pdb', 'profile', 'timeit', 'trace',
-              'tracemalloc', 'distutils', 'ensurepip', 'venv', 'zipapp',
-              'sys', 'sysconfig', 'builtins', '__main__', 'warnings',
-              'dataclasses', 'contextlib', 'abc', 'atexit', 'traceback',
-              '__future__', 'gc', 'inspect', 'site', 'code', 'codeop',
-              'zipimport', 'pkgutil', 'modulefinder', 'runpy', 'importlib',
-              'importlib.metadata', 'parser', 'ast', 'symtable', 'symbol',
-              'token', 'keyword', 'tokenize', 'tabnanny', 'pyclbr',
-              'py_compile', 'compileall', 'dis', 'pickletools', 'formatter',
-              'msilib', 'msvcrt', 'winreg', 'winsound', 'posix', 'pwd',
-              'spwd', 'grp', 'crypt', 'termios', 'tty', 'pty', 'fcntl',
-              'pipes', 'resource', 'nis', 'syslog', 'optparse', 'imp']
+    html = "<h2>File Description</h2>" + par + html
 
-    for file in all_files:
-        print(file)
+    # Adding content division around HTML
+    html = '<div class="content">' + html + "</div>"
 
-        # Moving to the python file directory
-        os.chdir(abspath)
+    return html
 
-        # Generate file documentation
-        html = generate_doc(file)
 
-        # Detecting imports
-        imports = detect_imports(file, all_files)
-        imphtml = imports_to_html(all_files, file, imports)
-        for imp in imports['external']:
-            if imp not in stdlib and imp.split('.')[0] not in \
-                    external_imports:
-                external_imports.append(imp.split('.')[0])
-
-        # Adding imports in the middle of the documentation
-        ht = html.split('<h2>Functions & Classes</h2>')
-        if len(ht) > 1:
-            html = ht[0] + imphtml + '<h2>Functions & Classes</h2>' + \
-                   '<h2>Functions & Classes</h2>'.join(ht[1:])
-        else:
-            html = ht[0][:-6] + imphtml + "</div>"
+# Geenerate doc from filename ________________________________________________
 
-        # Moving to the docapy root directory
-        os.chdir(abspath + "/docapy")
+def generate_doc(filename, parallel_threshold=PARALLEL_THRESHOLD):
+    """
+    Description
+    -----------
+    
+    Generates a HTML block for every docstring in the file <filename>
+    
+    The documentation strings must follow the Numpy docstring format.
+    
+    This function :
+        - Opens the file "filename"
+        - Detects all the functions and classes declarations
+        - Generates HTML for every docstring
+        - Generates HTML for the docstring of the file
 
-        # Creating folders to the file path
-        sub_dirs = file.split('/')
-        for sub_dir in sub_dirs[:-1]:
-            if sub_dir == '.':
-                continue
-            # Creates the directory
-            if not os.path.exists(sub_dir):
-                os.makedirs(sub_dir)
-            os.chdir('./' + sub_dir)
-
-        # opening / Creating the html file
-        with open(sub_dirs[-1][:-3] + '.html', 'w', encoding="utf8") as f:
-            html_ = html_header(file, project_name, github)
-            html_ += "<h1>" + file.split('/')[-1] + "</h1>"
-            html_ += side_menu(all_files, file)
-            html = html_ + html + "</body></html>"
-            f.write(html)
-            f.close()
-
-    # Creating index html ....................................................
-
-    os.chdir(abspath + "/docapy")
-    with open('index.html', 'w', encoding="utf8") as f:
-        html = html_header('./index.py', project_name, github)
-        html += side_menu(all_files, './index.py')
-        html += "<h1>" + project_name.upper() + " DOCUMENTATION" + "</h1>"
-        html += '<div class="content"><h2>Welcome !</h2>'
-        html += '<p>Welcome to the documentation of the ' + \
-                project_name + ' project !<br><br>This website inventories ' \
-                               'all ' + \
-                'the documentation for all the Python files (*.py) of the ' \
-                'project'
-        html += '. There is one page per file. You can browse files' + \
-                ' now using the browser on the left.<br>This ' \
-                'website contains ' + \
-                'the documentation for all the functions and classes' \
-                ' of the ' + \
-                project_name + ' project.<br></p>'
-        html += '<h2>Getting Started</h2><h3>Get the Project</h3>' + \
-                '</p>First clone the git repository :<br>' \
-                '<div class="code">$ ' + \
-                '<span class="blue">git</span> <span class="def">' \
-                'clone</span> ' + \
-                '<a href="' + github + '">' + github + '</a></div>' \
-                                                       'Then move to the' + \
-                ' project folder :<br><div class="code">$ <span ' \
-                'class="blue">cd' + \
-                '</span> ./' + github.split('/')[-1] + '</div>'
-
-        # Adding imports
-        if external_imports:
-            html += '<h3>Install Modules</h3>This project uses' + \
-                    ' the following non-standard modules :<ul>'
-            external_imports = list(set(external_imports))
-            external_imports.sort(key=str.casefold)
-
-            for imp in external_imports:
-                link = 'https://pypi.org/project/' + imp.split('.')[0]
-                html += '<li>'
-                html += '<a href="' + link + '" class="import">' + imp + \
-                        '</a>'
-                html += '</li>'
-            html += '</ul>'
+    Parameters
+    ----------
+    filename : string
+        Path leading to the file you want to generate the documentation from.
+    parallel_threshold : int, optional
+        Size above which the docstrings are rendered on several processes
+        (see definitions_to_html). None never uses workers.
 
-            html += "If you don't have them, you can install these " \
-                    "packages" + \
-                    ' running <a href="https://pypi.org/project/pip/">' \
-                    'pip</a> :' + \
-                    '<br>'
+    Returns
+    -------
+    string
+        HTML string containing the documentation
 
-            for imp in external_imports:
-                html += '<div class="code">'
-                html += '$ <span class="blue">pip</span> install ' + imp + \
-                        '<br>'
-                html += '</div>'
+    """
 
-        else:
-            html += '<h3>Modules</h3>This project doesn\'t use any non ' + \
-                    'standard Python modules.'
-
-        html += '<h3>Learn More</h3><p>For more details, check out ' + \
-                'the ' + project_name + ' repository here : <a href="' + \
-                github + '">' + github + '</a>'
-
-        html += '<h2>About the Documentation</h2><p>This website has ' \
-                'been ' + \
-                'automatically generated by Docapy. Docapy is a ' \
-                'documentation ' + \
-                'generator for Python projects. Check out the official ' + \
-                'repository' + \
-                'to learn more : <a href="https://github.com/Teskann/Docapy' \
-                '">' + \
-                'https://github.com/Teskann/Docapy</a></p></div>'
-        f.write(html)
-        f.close()
+    with open(filename, 'r', encoding="utf8") as file:
+        text = file.read()
 
-    # Copying CSS and font files .............................................
+    return definitions_to_html(extract_definitions(text),
+                               extract_file_docstring(text),
+                               parallel_threshold=parallel_threshold)
 
-    from shutil import copyfile
-    fdir = os.path.dirname(os.path.abspath(__file__))
-    copyfile(fdir + '/style.css', './style.css')
-    copyfile(fdir + '/ModernSans-Light.otf', './ModernSans-Light.otf')
 
-    colors = {'blue': '#004bff',
-              'cyan': '#03c3f5',
-              'red': '#e50914',
-              'green': '#00991e',
-              'orange': '#ff5626',
-              'purple': '#ad0fc9'}
+# Parse cache ________________________________________________________________
+
+# Version of the extraction (extract_definitions, extract_file_docstring and
+# find_imports). It must be incremented when their output changes so that the
+# cache entries created by older versions are not used anymore.
+EXTRACTOR_VERSION = 1
+
+
+def cache_load(cache_dir, key):
+    """
+    Description
+    -----------
+    
+    Loads  an  entry  of the parse cache. The entry is marked as recently used
+    (its modification time is updated).
+    
+    Parameters
+    ----------
+    
+    cache_dir : str
+        Directory of the cache
+    
+    key : str
+        Key of the entry (see extract_file)
+    
+    Returns
+    -------
+    
+    dict or None
+        Cached record or None if the entry does not exist or is corrupted
+    
+    """
+
+    path = os.path.join(cache_dir, key[:2], key[2:] + '.json')
+    try:
+        with open(path, 'r', encoding='utf8') as f:
+            record = json.load(f)
+        os.utime(path)
+    except (OSError, ValueError):
+        return None
+    return record
+
+
+def cache_store(cache_dir, key, record):
+    """
+    Description
+    -----------
+    
+    Stores  an  entry  in  the  parse  cache.  The  file  is  written  in  a
+    temporary file first so that a concurrent build never reads a partial
+    entry.
+    
+    Parameters
+    ----------
+    
+    cache_dir : str
+        Directory of the cache
+    
+    key : str
+        Key of the entry (see extract_file)
+    
+    record : dict
+        Record to store. Must be serializable in JSON
+    
+    Returns
+    -------
+    
+    None
+    
+    """
+
+    directory = os.path.join(cache_dir, key[:2])
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, key[2:] + '.json')
+    tmp = path + '.' + str(os.getpid()) + '.tmp'
+    with open(tmp, 'w', encoding='utf8') as f:
+        json.dump(record, f, separators=(',', ':'))
+    os.replace(tmp, path)
+
+
+def cache_evict(cache_dir, max_size):
+    """
+    Description
+    -----------
+    
+    Removes  the  least  recently  used  entries of the parse cache until its
+    size is lower than max_size.
+    
+    Parameters
+    ----------
+    
+    cache_dir : str
+        Directory of the cache
+    
+    max_size : int
+        Maximum size of the cache (in bytes)
+    
+    Returns
+    -------
+    
+    int
+        Number of removed entries
+    
+    """
+
+    entries = []
+    total = 0
+    for path, _, names in os.walk(cache_dir):
+        for name in names:
+            if name.endswith('.json'):
+                full = os.path.join(path, name)
+                try:
+                    stat = os.stat(full)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, full))
+                total += stat.st_size
+
+    removed = 0
+    entries.sort()
+    for _, size, full in entries:
+        if total <= max_size:
+            break
+        try:
+            os.remove(full)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    return removed
+
+
+def extract_file(filename, cache_dir=None):
+    """
+    Description
+    -----------
+    
+    Extracts  everything  the documentation of a file depends on : definitions,
+    file docstring and imported modules.
+    
+    If  cache_dir  is  given,  the result is stored in a cache keyed by a hash
+    of  the  file  content  and  of  EXTRACTOR_VERSION.  Identical  files (even
+    at different paths) share the same entry.
+    
+    Parameters
+    ----------
+    
+    filename : str
+        Path of the Python file
+    
+    cache_dir : str, optional
+        Directory of the parse cache. None (default) disables the cache
+    
+    Returns
+    -------
+    
+    dict
+        {'definitions' : Functions / classes (see extract_definitions),
+         
+         'docstring' : Docstring of the file (see extract_file_docstring),
+         
+         'imports' : Names of the imported modules (see find_imports)}
+    
+    """
+
+    with open(filename, 'rb') as f:
+        return extract_data(f.read(), cache_dir)
+
+
+def extract_data(data, cache_dir=None):
+    """
+    Description
+    -----------
+    
+    Same as extract_file for the content of a file
+    
+    Parameters
+    ----------
+    
+    data : bytes
+        Content of the Python file (UTF-8)
+    
+    cache_dir : str, optional
+        Directory of the parse cache. None (default) disables the cache
+    
+    Returns
+    -------
+    
+    dict
+        Extracted documentation of the file (see extract_file)
+    
+    """
+
+    if cache_dir is not None:
+        key = hashlib.sha256(b'docapy-extractor-' +
+                             str(EXTRACTOR_VERSION).encode() + b'\n' +
+                             data).hexdigest()
+        record = cache_load(cache_dir, key)
+        if record is not None:
+            return record
+
+    # Same newline translation as open() in text mode
+    text = data.decode('utf8').replace('\r\n', '\n').replace('\r', '\n')
+
+    record = {'definitions': extract_definitions(text),
+              'docstring': extract_file_docstring(text),
+              'imports': find_imports(text)}
+
+    if cache_dir is not None:
+        cache_store(cache_dir, key, record)
+    return record
+
+
+def api_fingerprint(record):
+    """
+    Description
+    -----------
+    
+    Hash  of  everything  the  page  of  a  file depends on in its source :
+    its  docstring,  its  imports  and  the  names,  signatures, docstrings
+    and  nesting  of  its functions / classes. It does not change when only
+    the  bodies  of  the functions change (see html_for_project), nor when
+    the  imports  are  only  reordered  or  repeated  :  the  page lists them
+    sorted and once (see classify_imports).
+    
+    Parameters
+    ----------
+    
+    record : dict
+        Extracted documentation of the file (see extract_file)
+    
+    Returns
+    -------
+    
+    str
+        SHA-256 of the record
+    
+    """
+
+    record = dict(record, imports=sorted(set(record['imports'])))
+    return hashlib.sha256(json.dumps(record, sort_keys=True).encode(
+        'utf8')).hexdigest()
+
+
+# Compact HTML _______________________________________________________________
+
+# Tags  of  block  elements. The whitespaces around them are never displayed
+# (outside of <pre> elements)
+BLOCK_TAG = r'</?(?:br|div|p|ul|li|h[1-6]|details|summary|pre)\b[^>]*>'
+
+
+def minify_html(html):
+    """
+    Description
+    -----------
+    
+    Removes the parts of the HTML that do not change its rendering :
+        - Runs of whitespaces are replaced by one space and spaces around
+          block elements are removed (except in <pre> elements)
+        - <br> elements ending a line of text just before a block element
+        - &apos; and &quot; outside of the tags (only needed in attributes)
+    
+    Parameters
+    ----------
+    
+    html : str
+        HTML to minify
+    
+    Returns
+    -------
+    
+    str
+        Minified HTML
+    
+    """
+
+    parts = re.split(r'(<pre\b[^>]*>.*?</pre>)', html, flags=re.S)
+    for i_p in range(0, len(parts), 2):
+        part = re.sub(r'\s+', ' ', parts[i_p])
+        part = re.sub(' ?(' + BLOCK_TAG + ') ?', r'\1', part)
+        parts[i_p] = re.sub(r'(?<=[^>\s])<br>(?=</?(?:div|p|ul|li|h[1-6]|'
+                            r'details|pre)\b)', '', part)
+    html = ''.join(parts)
+
+    entities = {'&apos;': "'", '&quot;': '"'}
+    return re.sub(r'(<[^>]*>)|&apos;|&quot;',
+                  lambda m: m.group(1) or entities[m.group(0)], html)
+
+
+def size_report(page_sizes, page_budget=None):
+    """
+    Description
+    -----------
+    
+    Generates the summary of the sizes of the generated pages
+    
+    Parameters
+    ----------
+    
+    page_sizes : dict
+        {'<file>' : Size of its page in bytes}
+    
+    page_budget : int, optional
+        Maximum size of a page in bytes. Bigger pages are listed
+    
+    Returns
+    -------
+    
+    str
+        Summary of the page sizes
+    
+    """
+
+    if not page_sizes:
+        return "No page generated"
+
+    largest = max(page_sizes, key=page_sizes.get)
+    report = str(len(page_sizes)) + " pages, " + \
+        str(sum(page_sizes.values())) + " bytes (largest : " + largest + \
+        ", " + str(page_sizes[largest]) + " bytes)"
 
-    with open('./style.css', 'r+', encoding='utf8') as f:
+    if page_budget is not None:
+        over = sorted((x for x in page_sizes if page_sizes[x] > page_budget),
+                      key=lambda x: (-page_sizes[x], x))
+        report += "\n" + str(len(over)) + " pages over the budget of " + \
+            str(page_budget) + " bytes"
+        for file in over:
+            report += "\n    " + file + " : " + str(page_sizes[file]) + \
+                " bytes"
+    return report
+
+
+# Extraction budget __________________________________________________________
+
+# Line  regex  used  to  find  the  functions / classes of the files whose
+# extraction failed or exceeded its budget
+OUTLINE_REGEX = LazyRegex(
+    r"^( *)(def|class)[ \\]+(\w+) *(\(.*\))? *(?:->.*)?:")
+
+
+def outline_record(filename, reason):
+    """
+    Description
+    -----------
+    
+    Cheap  fallback  of  extract_file  :  functions  and  classes are found
+    with  a  line  regex (OUTLINE_REGEX) and their docstrings are ignored.
+    The file is never parsed character by character.
+    
+    Parameters
+    ----------
+    
+    filename : str
+        Path of the Python file
+    
+    reason : str
+        Why the normal extraction was not used
+    
+    Returns
+    -------
+    
+    dict
+        Same record as extract_file, with an additional 'degraded' field
+        containing reason
+    
+    """
+
+    with open(filename, 'r', encoding='utf8', errors='replace') as f:
         text = f.read()
 
-        col = color if color[0] == '#' else colors[color]
+    def_list = []
+    last_obj_ind = 0  # Lowest indentation since the last definition
+    in_string = False  # True inside a triple quoted string
+    for line in text.split('\n'):
+        strip = line.strip()
+        if not strip:
+            continue
+        ind = len(line) - len(line.lstrip(' '))
+        if not in_string and not strip.startswith('#'):
+            match = OUTLINE_REGEX.match(line)
+            if match:
+                fun_def = match.group(3) + (match.group(4) or
+                                            ('(...)' if match.group(2) ==
+                                             'def' else ''))
+                fun_def = fun_def.replace(" ", "").replace(',', ', ')
+                def_list.append({'def': fun_def,
+                                 'docstring': None,
+                                 'last_ind': last_obj_ind,
+                                 'ind': ind,
+                                 'type': match.group(2)})
+                last_obj_ind = ind
+            elif ind < last_obj_ind:
+                last_obj_ind = ind
+        if (strip.count('"""') + strip.count("\'\'\'")) % 2:
+            in_string = not in_string
+
+    return {'definitions': def_list,
+            'docstring': '',
+            'imports': find_imports(text),
+            'degraded': reason}
+
+
+def _limit_memory(memory_budget):
+    """
+    Initializer of the extraction worker process : limits its address space
+    to memory_budget bytes (only where the resource module exists)
+    """
+
+    try:
+        import resource
+    except ImportError:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        memory_budget = min(memory_budget, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (memory_budget, hard))
 
-        text = text.replace("#03c3f5", col)
 
-        f.write(text)
-        f.close()
+def _extraction_worker(connection, cache_dir, memory_budget):
+    """
+    Main  function  of the extraction worker process : receives file names on
+    connection and sends back (True, record) or (False, error type, message)
+    """
+
+    if memory_budget is not None:
+        _limit_memory(memory_budget)
+    while True:
+        try:
+            filename = connection.recv()
+        except EOFError:
+            return
+        try:
+            result = (True, extract_file(filename, cache_dir))
+        except Exception as error:
+            result = (False, type(error).__name__, str(error))
+        connection.send(result)
+
+
+class BudgetedExtractor:
+    """
+    Description
+    -----------
+    
+    Runs  extract_file  on  each  file  and  falls  back  to  outline_record
+    when  the  extraction  fails,  takes  more  than  time_budget  seconds or
+    uses more than memory_budget bytes.
+    
+    When  a  budget  is  set,  the  extraction runs in a worker process that
+    is  killed  (and  restarted  for  the next file) when it exceeds its budget
+    or dies. Otherwise, it runs in the current process.
+    
+    Parameters
+    ----------
+    
+    cache_dir : str, optional
+        Directory of the parse cache (see extract_file)
+    
+    time_budget : float, optional
+        Maximum wall time of the extraction of a file in seconds
+    
+    memory_budget : int, optional
+        Maximum  address  space of the worker process in bytes. Ignored on
+        platforms without the resource module (Windows)
+    
+    keep_records : bool, optional
+        Keeps  the  records  in  memory  until  the  size  or the modification
+        time of their file changes, for the extractors that are used by
+        several builds (see run_daemon). Default is False
+    
+    """
+
+    def __init__(self, cache_dir=None, time_budget=None, memory_budget=None,
+                 keep_records=False):
+        self.cache_dir = cache_dir
+        self.time_budget = time_budget
+        self.memory_budget = memory_budget
+        self.worker = None  # (process, connection)
+        self.records = {} if keep_records else None  # {file : (stat, record)}
+
+    def extract(self, filename):
+        """
+        Returns  the  record  of  the  file (see extract_file). The record of
+        a degraded file has a 'degraded' field containing the reason
+        """
+
+        if self.records is None:
+            return self._extract(filename)
+        try:
+            stat = os.stat(filename)
+            stat = [stat.st_size, stat.st_mtime_ns]
+        except OSError:
+            return self._extract(filename)
+        kept = self.records.get(filename)
+        if kept is not None and kept[0] == stat:
+            return kept[1]
+        record = self._extract(filename)
+        if 'degraded' not in record:
+            self.records[filename] = (stat, record)
+        return record
+
+    def _extract(self, filename):
+        # Extraction of a file, with the budgets
+
+        if self.time_budget is None and self.memory_budget is None:
+            try:
+                return extract_file(filename, self.cache_dir)
+            except Exception as error:
+                return outline_record(filename, type(error).__name__ +
+                                      ' : ' + str(error))
+
+        import multiprocessing
+        from multiprocessing.connection import wait
+
+        if self.worker is None:
+            connection, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_extraction_worker, daemon=True,
+                args=(child, self.cache_dir, self.memory_budget))
+            process.start()
+            child.close()
+            self.worker = (process, connection)
+        process, connection = self.worker
+
+        # Waiting  for  the  record,  the  end  of  the time budget or the
+        # death  of  the  worker  (killed  by  the system, crash ...), which
+        # would never send anything
+        result = None
+        try:
+            connection.send(filename)
+            if wait([connection, process.sentinel], self.time_budget):
+                if connection.poll():
+                    result = connection.recv()
+        except (OSError, EOFError):
+            pass
+
+        if result is None:
+            timed_out = process.is_alive()
+            self.close()
+            if timed_out:
+                reason = 'time budget exceeded (' + str(self.time_budget) + \
+                         ' s)'
+            else:
+                reason = 'extraction worker died (exit code ' + \
+                         str(process.exitcode) + ')'
+        elif result[0]:
+            return result[1]
+        elif result[1] == 'MemoryError':
+            self.close()
+            reason = 'memory budget exceeded (' + \
+                     str(self.memory_budget) + ' bytes)'
+        else:
+            reason = result[1] + ' : ' + result[2]
+        return outline_record(filename, reason)
+
+    def close(self):
+        """
+        Stops the worker process
+        """
+
+        if self.worker is not None:
+            process, connection = self.worker
+            process.kill()
+            process.join()
+            connection.close()
+            self.worker = None
+
+
+def degraded_html(reason):
+    """
+    Description
+    -----------
+    
+    Generates the notice displayed at the top of a degraded page
+    
+    Parameters
+    ----------
+    
+    reason : str
+        Why the page is degraded (see outline_record)
+    
+    Returns
+    -------
+    
+    str
+        HTML block of the notice
+    
+    """
+
+    return '<div class="degraded">This page only contains an outline of ' \
+           'the file : its documentation could not be generated (' + \
+           escape_html(reason) + ').</div>'
+
+
+# Lazy-loaded sections _______________________________________________________
+
+# Script  added to split pages. It fetches the body of a <details> element the
+# first time it is expanded. Fragments are fetched with HTTP, so split pages
+# must be served by a web server (browsers block fetch() on file:// URLs).
+LAZY_SCRIPT = "<script>document.addEventListener('toggle',function(e){" \
+              "var d=e.target;if(!d.open||!d.dataset||!d.dataset.fragment)" \
+              "return;var u=d.dataset.fragment;delete d.dataset.fragment;" \
+              "fetch(u).then(function(r){return r.text();}).then(" \
+              "function(t){d.insertAdjacentHTML('beforeend',t);});},true);" \
+              "</script>"
+
+
+def split_lazy_sections(html, fragment_dir):
+    """
+    Description
+    -----------
+
+    Splits  the  documentation  HTML  of a file so that only the summaries of
+    the functions / classes are kept inline. The body of every <details> block
+    (docstring  and  nested  members)  is  moved  to a separate fragment that
+    LAZY_SCRIPT fetches when the <details> element is expanded.
+
+    Nested  members  are  split  as  well : the fragment of a class contains
+    only the summaries of its methods.
+
+    Parameters
+    ----------
+
+    html : str
+        HTML generated by generate_doc
+
+    fragment_dir : str
+        Directory  of  the  fragments,  relative  to the HTML page. It is used
+        to build the URLs of the fragments
+
+    Returns
+    -------
+
+    html : str
+        HTML with the bodies of the <details> elements removed
+
+    fragments : dict
+        {'<fragment file name>' : HTML of the fragment}
+
+    """
+
+    fragments = {}
+    stack = ['']  # HTML of the opened <details> elements, outermost first
+
+    for token in re.split(r'(<details>|</details>)', html):
+        if token == '<details>':
+            stack.append('')
+        elif token == '</details>' and len(stack) > 1:
+            block = stack.pop()
+            summary, _, body = block.partition('</summary>')
+            name = str(len(fragments)) + '.html'
+            fragments[name] = body
+            stack[-1] += '<details data-fragment="' + fragment_dir + '/' + \
+                         name + '">' + summary + '</summary></details>'
+        else:
+            stack[-1] += token
+
+    return ''.join(stack), fragments
+
+
+# Generate Navigation Menu ___________________________________________________
+
+def side_menu(files, file_):
+    """
+    Description
+    -----------
+    
+    Generates  the  HTML block for the side menu for navigation between docapy
+    files. The block is a div which class is "sideMenu". Folders are <details>
+    elements. Files are hyperlinks <a> elements.
+
+    Parameters
+    ----------
+    files : list of str
+        List of all the files of the project. Every element is the path to the
+        py file : "./<pathToTheFile>/file.py" where . is the project directory
+        List must be sorted in alphabetical order
+    
+    file_ : str
+        Path of the file for which you want to generate the menu block
+
+    Returns
+    -------
+    str
+        HTML block containing the side menu
+    """
+
+    pathback = '../' * (len(file_.split('/')) - 2)
+
+    # Creating HTML block
+    html = '<div class="sideMenu"><span class="browse">Browse Project ' \
+           'Files' + '</span>'
+
+    lastfile = ['.']
+    for file in files:
+
+        sub_dirs = file.split('/')[1:]
+
+        open_details = len(lastfile) - 1
+
+        # Checking similarities with the last file
+        details_to_open = []
+        for i_s, subdir in enumerate(sub_dirs[:-1]):
+            if subdir == lastfile[i_s]:
+                open_details -= 1
+            else:
+                details_to_open += sub_dirs[i_s:-1]
+                break
+
+        for _ in range(open_details):
+            html += "</details>"
+
+        for det in details_to_open:
+            html += '<details class="menuDetails"><summary class="menuSum' + \
+                    'mary">' + det + '</summary>'
+
+        if file_ == file:
+            html += '<span class="blue">'
+        html += '<a href="' + pathback + '/'.join(sub_dirs[:-1]) + \
+                ('/' if len(sub_dirs[:-1]) else '') + sub_dirs[-1][:-3] + \
+                '.html" class="menua">' + sub_dirs[-1] + '</a>'
+        if file == file_:
+            html += "</span>"
+
+        lastfile = sub_dirs
+
+    # Closing the remaining opened details
+    for _ in range(len(lastfile) - 1):
+        html += "</details>"
+
+    return html + "</div>"
+
+
+# Generate the html header ___________________________________________________
+
+def html_header(file, project_name, github, stylesheet='style.css',
+                prefetch=(), critical=None, last_change=None):
+    """
+    Description
+    -----------
+    
+    Generates the HTML header for the specified file and the specified project
+    
+    Parameters
+    ----------
+    
+    file : str
+        Path of the Python file corresponding to the HTML file
+    
+    project_name : str
+        Name of your project
+    
+    github : str
+        Github link of the project
+    
+    stylesheet : str, optional
+        Name of the CSS file in the docapy directory (see asset_files).
+        Default is "style.css"
+    
+    prefetch : list of str, optional
+        Python  files  of  the project ("./<pathToTheFile>/file.py") whose
+        page  the  browser  should prefetch because they are likely to be
+        opened next. Default is none
+    
+    critical : str, optional
+        CSS  rules  to  inline  in  the  header  (see  critical_css). The CSS
+        file  is  then  loaded  without  blocking  the  display  of the page.
+        None (default) loads the CSS file normally
+    
+    last_change : list, optional
+        [commit,  timestamp]  of  the  last  commit  that  changed  the  file
+        (see  git_last_changes).  Its  date  and  a  link  to  it  are  shown
+        in the navigation bar. None (default) shows nothing
+    
+    Returns
+    -------
+    
+    str
+        HTML block containing the header
+    
+    """
+
+    filename = file.split('/')[-1]
+
+    # Metadata
+    html = '<!doctype html><html lang="en"><head><meta charset="utf-8">' + \
+           '<title>' + project_name + ' Documentation - ' + filename + \
+           '</title>'
+    html += '<meta name="author" content="' + 'Docapy' + '">'
+
+    # CSS Link
+    href = '../' * (len(file.split('/')) - 2) + stylesheet
+    if critical is None:
+        html += '<link rel="stylesheet" href="' + href + '">'
+    else:
+        # The URLs of the CSS are relative to the docapy directory
+        critical = critical.replace('url("', 'url("' + '../' * (
+            len(file.split('/')) - 2))
+        html += '<style>' + critical + '</style><link rel="preload" href="' + \
+                href + '" as="style" onload="this.onload=null;this.rel=' \
+                '\'stylesheet\'"><noscript><link rel="stylesheet" href="' + \
+                href + '"></noscript>'
+
+    # Pages to prefetch
+    for target in prefetch:
+        html += '<link rel="prefetch" href="' + '../' * (
+                len(file.split('/')) - 2) + target[2:-3] + '.html">'
+    html += '</head><body>'
+
+    # Navigation Bar
+    html += '<div class="navbar"><a href="' + '../' * \
+            (len(file.split('/')) - 2) + \
+            'index.html" class="titla"><span class="title"><span ' \
+            'class="blue">' + project_name + '</span>' + \
+            ' Documentation</span></a><span class="links">'
+    if last_change is not None:
+        html += '<a' + (' href="' + github + '/commit/' + last_change[0] +
+                        '"' if github else '') + \
+                ' title="Last change of ' + filename + '">Changed ' + \
+                time.strftime('%Y-%m-%d', time.gmtime(last_change[1])) + \
+                ' (' + last_change[0][:7] + ')</a>'
+    html += '<a href="' + github + '">View Github</a><a href="' + \
+            'https://github.com/Teskann/Docapy">About Docapy</a></span>' \
+            '</div>'
+
+    return html
+
+
+# Generate index page ________________________________________________________
+
+def index_html(all_files, project_name, github, external_imports,
+               compact=False, stylesheet='style.css', service_worker=False,
+               critical=None):
+    """
+    Description
+    -----------
+    
+    Generates  the  HTML  of  the  index page containing the project overview
+    
+    Parameters
+    ----------
+    
+    all_files : list of str
+        List of all the files of the project
+    
+    project_name : str
+        Name of your project
+    
+    github : str
+        Github link of the project
+    
+    external_imports : list of str
+        Non-standard modules imported by the project
+    
+    compact : bool, optional
+        Minifies the HTML (see minify_html). Default is False
+    
+    stylesheet : str, optional
+        Name of the CSS file (see html_header)
+    
+    service_worker : bool, optional
+        Registers the service worker (see service_worker_js). Default is
+        False
+    
+    critical : str, optional
+        CSS rules inlined in the header (see html_header)
+    
+    Returns
+    -------
+    
+    str
+        HTML of the index page
+    
+    """
+
+    html = html_header('./index.py', project_name, github, stylesheet,
+                       critical=critical)
+    html += side_menu(all_files, './index.py')
+    html += "<h1>" + project_name.upper() + " DOCUMENTATION" + "</h1>"
+    html += '<div class="content"><h2>Welcome !</h2>'
+    html += '<p>Welcome to the documentation of the ' + \
+            project_name + ' project !<br><br>This website inventories ' \
+                           'all ' + \
+            'the documentation for all the Python files (*.py) of the ' \
+            'project'
+    html += '. There is one page per file. You can browse files' + \
+            ' now using the browser on the left.<br>This ' \
+            'website contains ' + \
+            'the documentation for all the functions and classes' \
+            ' of the ' + \
+            project_name + ' project.<br></p>'
+    html += '<h2>Getting Started</h2><h3>Get the Project</h3>' + \
+            '</p>First clone the git repository :<br>' \
+            '<div class="code">$ ' + \
+            '<span class="blue">git</span> <span class="def">' \
+            'clone</span> ' + \
+            '<a href="' + github + '">' + github + '</a></div>' \
+                                                   'Then move to the' + \
+            ' project folder :<br><div class="code">$ <span ' \
+            'class="blue">cd' + \
+            '</span> ./' + github.split('/')[-1] + '</div>'
+
+    # Adding imports
+    if external_imports:
+        html += '<h3>Install Modules</h3>This project uses' + \
+                ' the following non-standard modules :<ul>'
+        external_imports = sorted(set(external_imports),
+                                  key=lambda x: (x.casefold(), x))
+
+        for imp in external_imports:
+            link = 'https://pypi.org/project/' + imp.split('.')[0]
+            html += '<li>'
+            html += '<a href="' + link + '" class="import">' + imp + \
+                    '</a>'
+            html += '</li>'
+        html += '</ul>'
+
+        html += "If you don't have them, you can install these " \
+                "packages" + \
+                ' running <a href="https://pypi.org/project/pip/">' \
+                'pip</a> :' + \
+                '<br>'
+
+        for imp in external_imports:
+            html += '<div class="code">'
+            html += '$ <span class="blue">pip</span> install ' + imp + \
+                    '<br>'
+            html += '</div>'
+
+    else:
+        html += '<h3>Modules</h3>This project doesn\'t use any non ' + \
+                'standard Python modules.'
+
+    html += '<h3>Learn More</h3><p>For more details, check out ' + \
+            'the ' + project_name + ' repository here : <a href="' + \
+            github + '">' + github + '</a>'
+
+    html += '<h2>About the Documentation</h2><p>This website has ' \
+            'been ' + \
+            'automatically generated by Docapy. Docapy is a ' \
+            'documentation ' + \
+            'generator for Python projects. Check out the official ' + \
+            'repository' + \
+            'to learn more : <a href="https://github.com/Teskann/Docapy' \
+            '">' + \
+            'https://github.com/Teskann/Docapy</a></p></div>'
+    if service_worker:
+        html += sw_register_script('./index.py')
+    if compact:
+        html = minify_html(html)
+
+    return html
+
+
+# Copy CSS and font files ____________________________________________________
+
+# Accent colors of the documentation
+COLORS = {'blue': '#004bff',
+          'cyan': '#03c3f5',
+          'red': '#e50914',
+          'green': '#00991e',
+          'orange': '#ff5626',
+          'purple': '#ad0fc9'}
+
+
+def style_css(color):
+    """
+    Description
+    -----------
+    
+    Returns the content of style.css with the given accent color
+    
+    Parameters
+    ----------
+    
+    color : str
+        Accent color for the documentation (see html_for_project)
+    
+    Returns
+    -------
+    
+    str
+        CSS
+    
+    """
+
+    fdir = os.path.dirname(os.path.abspath(__file__))
+    with open(fdir + '/style.css', 'r', encoding='utf8') as f:
+        text = f.read()
+
+    col = color if color[0] == '#' else COLORS[color]
+    return text.replace("#03c3f5", col)
+
+
+def asset_files(color, optimize=False, glyphs='', reuse_dir=None):
+    """
+    Description
+    -----------
+    
+    Returns  the  CSS  and  font  files of the documentation. Their names
+    contain  a  hash  of  their  content  ("style.<hash>.css"),  so  they  can
+    be cached by browsers forever : a new content gets a new name.
+    
+    Parameters
+    ----------
+    
+    color : str
+        Accent color for the documentation (see html_for_project)
+    
+    optimize : bool, optional
+        Minifies  the CSS (see minify_css) and converts the font to a subset
+        in a web format (see optimize_font). Default is False
+    
+    glyphs : str, optional
+        Characters the font must contain when it is optimized (see
+        site_glyphs)
+    
+    reuse_dir : str, optional
+        Directory  of  a  previous  build.  If the optimized font of the same
+        inputs is in it, it is read instead of being generated again
+    
+    Returns
+    -------
+    
+    dict
+        {'style.css' : (name of the CSS file, content),
+         
+         'ModernSans-Light.otf' : (name of the font file, content)}
+    
+    """
+
+    def hashed_name(name, data):
+        root, ext = os.path.splitext(name)
+        return root + '.' + hashlib.sha256(data).hexdigest()[:12] + ext
+
+    fdir = os.path.dirname(os.path.abspath(__file__))
+    with open(fdir + '/ModernSans-Light.otf', 'rb') as f:
+        font = f.read()
+    font_name = hashed_name('ModernSans-Light.otf', font)
+    font_format = 'opentype'
+
+    if optimize:
+        font_name, font, font_format = optimize_font(font, glyphs, reuse_dir)
+
+    css = style_css(color).replace(
+        'url("ModernSans-Light.otf") format("opentype")',
+        'url("' + font_name + '") format("' + font_format + '")')
+    if optimize:
+        css = minify_css(css)
+    css = css.encode('utf8')
+
+    return {'style.css': (hashed_name('style.css', css), css),
+            'ModernSans-Light.otf': (font_name, font)}
+
+
+# Asset optimization _________________________________________________________
+
+# Selectors of the rules needed to display the top of a page (navigation bar,
+# title and side menu). They are inlined in the pages by critical_css
+CRITICAL_SELECTORS = frozenset(['@font-face', 'body', 'html', '.navbar',
+                                '.title', '.titla', '.titla:hover', '.blue',
+                                '.links', '.links a', 'h1', '.sideMenu',
+                                '.sideMenu a', '.browse', '.menuDetails',
+                                '.menuSummary', 'a', 'a:visited'])
+
+
+def minify_css(css):
+    """
+    Description
+    -----------
+    
+    Removes the comments and the useless whitespaces of a CSS file
+    
+    Parameters
+    ----------
+    
+    css : str
+        CSS code
+    
+    Returns
+    -------
+    
+    str
+        Minified CSS code
+    
+    """
+
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r' ?([{};,]) ?', r'\1', css)
+
+    # Spaces around ':' only in declarations (" :hover" is a selector)
+    css = re.sub(r'\{[^{}]*\}', lambda m: re.sub(r' ?: ?', ':', m.group()),
+                 css)
+    return css.replace(';}', '}').strip()
+
+
+def critical_css(css):
+    """
+    Description
+    -----------
+    
+    Extracts  the  rules  of  a  minified CSS (see minify_css) whose selectors
+    are all in CRITICAL_SELECTORS. Pages inline them so that their top is
+    displayed before the whole CSS file is loaded.
+    
+    Parameters
+    ----------
+    
+    css : str
+        Minified CSS code
+    
+    Returns
+    -------
+    
+    str
+        Critical rules
+    
+    """
+
+    return ''.join(m.group() for m in re.finditer(r'([^{}]+)\{[^{}]*\}', css)
+                   if all(x.strip() in CRITICAL_SELECTORS
+                          for x in m.group(1).split(',')))
+
+
+def site_glyphs(project_name, all_files):
+    """
+    Description
+    -----------
+    
+    Returns  the  characters  that  can  be  displayed  with  the font of the
+    documentation  :  printable  ASCII  characters,  the  characters  of the
+    project name and of the file names, and the printable non-ASCII characters
+    of  the  sources  (section titles, names of the functions / classes ...
+    are written as they are in the docstrings and in the code)
+    
+    Parameters
+    ----------
+    
+    project_name : str
+        Name of your project
+    
+    all_files : list of str
+        List of all the files of the project
+    
+    Returns
+    -------
+    
+    str
+        Sorted characters, without duplicates
+    
+    """
+
+    glyphs = set(chr(x) for x in range(32, 127))
+    glyphs.update(project_name + project_name.upper())
+    for file in all_files:
+        glyphs.update(file)
+        try:
+            with open(file, 'rb') as f:
+                data = f.read()
+        except OSError:
+            continue
+        if not data.isascii():
+            glyphs.update(x for x in data.decode('utf8', 'replace')
+                          if x.isprintable())
+    return ''.join(sorted(glyphs))
+
+
+def optimize_font(data, glyphs, reuse_dir=None):
+    """
+    Description
+    -----------
+    
+    Converts  a  font  to  a  subset  containing  only  the given characters,
+    in  the  WOFF2  format  (WOFF  if  brotli  is  not  installed). It needs
+    fontTools  :  if  it  is  not installed, the font is returned unchanged.
+    
+    The  name  of  the  result  contains a hash of the inputs, so a previous
+    result in reuse_dir is read instead of being generated again.
+    
+    Parameters
+    ----------
+    
+    data : bytes
+        Content of the OpenType font
+    
+    glyphs : str
+        Characters to keep
+    
+    reuse_dir : str, optional
+        Directory where a previous result may be
+    
+    Returns
+    -------
+    
+    name : str
+        Name of the font file ("ModernSans-Light.<hash>.woff2")
+    
+    data : bytes
+        Content of the font file
+    
+    format : str
+        Format of the font for CSS ("woff2", "woff" or "opentype")
+    
+    """
+
+    try:
+        import fontTools
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        print("fontTools is not installed : the font is not optimized")
+        return ('ModernSans-Light.' + hashlib.sha256(data).hexdigest()[:12] +
+                '.otf', data, 'opentype')
+    try:
+        import brotli  # noqa: F401 (needed by fontTools for WOFF2)
+        flavor = 'woff2'
+    except ImportError:
+        flavor = 'woff'
+
+    inputs = hashlib.sha256(data + glyphs.encode('utf8') + b'\n' +
+                            (flavor + fontTools.version).encode('utf8'))
+    name = 'ModernSans-Light.' + inputs.hexdigest()[:12] + '.' + flavor
+
+    if reuse_dir is not None and os.path.exists(os.path.join(reuse_dir,
+                                                             name)):
+        with open(os.path.join(reuse_dir, name), 'rb') as f:
+            return name, f.read(), flavor
+
+    import io
+
+    # The modification time of the font is kept : the same inputs give the
+    # same file
+    font = TTFont(io.BytesIO(data), recalcTimestamp=False)
+    options = subset.Options()
+    options.flavor = flavor
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=glyphs)
+    subsetter.subset(font)
+    result = io.BytesIO()
+    font.flavor = flavor
+    font.save(result)
+    return name, result.getvalue(), flavor
+
+
+# Output directory ___________________________________________________________
+
+# Checkpoint  of  an  unfinished  build, in the output directory (see
+# BuildCheckpoint)
+CHECKPOINT = '.checkpoint.jsonl'
+
+
+class OutputWriter:
+    """
+    Description
+    -----------
+    
+    Writes  the  files of a build in an output directory and lists them in
+    its  manifest.json.  A  file  whose  content  did not change since the
+    previous build is not written again, so its modification time stays the
+    same.  When  the  build  is  done,  finish  removes  the  files  of the
+    previous build that were not written and updates the manifest.
+    
+    The manifest contains :
+    
+    - files : {path : {'size' : size in bytes, 'sha256' : hash}} for every
+      file of the output directory (except the manifest)
+    
+    - added, changed, removed : sorted lists of the paths that were added,
+      changed and removed since the previous manifest
+    
+    Paths are relative to the output directory, with '/' separators.
+    
+    If  link  is  True,  a file with the same content as a file already
+    written  by  the  build  is  a  hard  link  to  it  (copied if the file
+    system  does  not  support  hard  links).  linked  counts  these  files
+    and  the  bytes  they  save.  A  file  whose content changes is always
+    replaced, so the other names of a hard link keep their content.
+    
+    Parameters
+    ----------
+    
+    root : str
+        Output directory. It is created if it does not exist
+    
+    link : bool, optional
+        Hard links the files with identical content. Default is False
+    
+    previous : dict, optional
+        Files  of  the  manifest  of the previous build, if they are already
+        known  (see  run_daemon).  Default  is  None  :  they  are  read from
+        the manifest
+    
+    """
+
+    MANIFEST = 'manifest.json'
+
+    def __init__(self, root, link=False, previous=None):
+        self.root = root
+        self.files = {}
+        self.log = []  # Written files, in order
+        self.link = link
+        self.names = {}  # First file of the build with each hash
+        self.linked = [0, 0]  # Number of hard linked files, bytes saved
+        os.makedirs(root, exist_ok=True)
+
+        # Files of the previous build
+        self.previous = {}
+        self.manifest_mtime = 0
+        manifest = os.path.join(root, self.MANIFEST)
+        try:
+            if previous is None:
+                with open(manifest, 'r', encoding='utf8') as f:
+                    previous = json.load(f)['files']
+            self.previous = previous
+            self.manifest_mtime = os.stat(manifest).st_mtime_ns
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def unchanged(self, name, path, data, digest):
+        """
+        Returns True if the file path already has the content data
+        """
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if stat.st_size != len(data):
+            return False
+
+        # The previous manifest is trusted for files that were not modified
+        # after it was written
+        entry = self.previous.get(name)
+        if entry is not None and stat.st_mtime_ns <= self.manifest_mtime:
+            return entry['sha256'] == digest
+        with open(path, 'rb') as f:
+            return f.read() == data
+
+    def write(self, name, data):
+        """
+        Description
+        -----------
+        
+        Writes a file of the build if its content changed
+        
+        Parameters
+        ----------
+        
+        name : str
+            Path of the file, relative to the output directory
+        
+        data : str or bytes
+            Content of the file (str is encoded in UTF-8)
+        
+        Returns
+        -------
+        
+        int
+            Size of the file in bytes
+        
+        """
+
+        if isinstance(data, str):
+            data = data.encode('utf8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = os.path.join(self.root, name)
+        source = self.names.get(digest) if self.link else None
+
+        if source is not None:
+            source = os.path.join(self.root, source)
+            if not (os.path.exists(path) and os.path.samefile(source, path)):
+                self.replace(path, data, source)
+            self.linked[0] += 1
+            self.linked[1] += len(data)
+        elif not self.unchanged(name, path, data, digest):
+            self.replace(path, data)
+        self.names.setdefault(digest, name)
+        self.files[name] = {'size': len(data), 'sha256': digest}
+        self.log.append(name)
+        return len(data)
+
+    def replace(self, path, data, source=None):
+        """
+        Replaces  the  file  path  by  a  new  file  containing  data,  or by a
+        hard link to source if it is given (a copy if hard links fail)
+        """
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            os.remove(path)  # Writing to it would change its hard links
+        except FileNotFoundError:
+            pass
+        if source is not None:
+            try:
+                os.link(source, path)
+                return
+            except OSError:
+                pass
+        with open(path, 'wb') as f:
+            f.write(data)
+
+    def keep(self, name, entry):
+        """
+        Registers a file written by an interrupted build (see BuildCheckpoint)
+        without writing it again. entry is its manifest entry. Returns False
+        if the file does not exist anymore or if its size changed
+        """
+
+        if not output_intact(self.root, name, entry):
+            return False
+        source = self.names.get(entry['sha256']) if self.link else None
+        if source is not None and os.path.samefile(
+                os.path.join(self.root, source),
+                os.path.join(self.root, name)):
+            self.linked[0] += 1
+            self.linked[1] += entry['size']
+        self.names.setdefault(entry['sha256'], name)
+        self.files[name] = entry
+        self.log.append(name)
+        return True
+
+    def finish(self, keep=()):
+        """
+        Description
+        -----------
+        
+        Removes the files that were not written by this build (and the
+        directories that become empty) and writes the manifest
+        
+        Parameters
+        ----------
+        
+        keep : list of str, optional
+            Paths  of  files  or directories given by the user (IR file,
+            parse  cache  ...)  that  are  never removed, even if they are
+            in the output directory. They are not listed in the manifest
+        
+        Returns
+        -------
+        
+        dict
+            The manifest
+        
+        """
+
+        keep = [os.path.abspath(x) for x in keep if x is not None]
+        removed = set(self.previous) - set(self.files)
+        for path, dirs, names in os.walk(self.root, topdown=False):
+            rel = os.path.relpath(path, self.root).replace('\\', '/')
+            rel = '' if rel == '.' else rel + '/'
+            for name in names:
+                full = os.path.abspath(os.path.join(path, name))
+                if any(full == x or full.startswith(x + os.sep)
+                       for x in keep):
+                    continue
+                if rel + name not in self.files and \
+                        rel + name not in (self.MANIFEST, CHECKPOINT, COSTS,
+                                           LAST_CHANGES):
+                    os.remove(os.path.join(path, name))
+                    removed.add(rel + name)
+            if rel and not os.listdir(path):
+                os.rmdir(path)
+
+        manifest = {'files': self.files,
+                    'added': sorted(set(self.files) - set(self.previous)),
+                    'changed': sorted(x for x in self.files
+                                      if x in self.previous and
+                                      self.previous[x] != self.files[x]),
+                    'removed': sorted(removed)}
+        with open(os.path.join(self.root, self.MANIFEST), 'w',
+                  encoding='utf8') as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        return manifest
+
+    def update(self, replaced):
+        """
+        Description
+        -----------
+        
+        Writes  the  manifest  of  a  build  that  only  wrote some pages (see
+        run_daemon)  :  the  other  files  of  the  previous  build are kept
+        without looking at the output directory. Only the files of replaced
+        that were not written again are removed
+        
+        Parameters
+        ----------
+        
+        replaced : list of str
+            Files  of  the  previous  build  replaced  by  this  one  (the
+            outputs of the pages it generated again)
+        
+        Returns
+        -------
+        
+        dict
+            The manifest
+        
+        """
+
+        files = dict(self.previous)
+        removed = []
+        for name in replaced:
+            if name in self.files or name not in files:
+                continue
+            del files[name]
+            removed.append(name)
+            path = os.path.join(self.root, name)
+            try:
+                os.remove(path)
+                path = os.path.dirname(path)
+                while path != self.root and not os.listdir(path):
+                    os.rmdir(path)
+                    path = os.path.dirname(path)
+            except OSError:
+                pass
+        files.update(self.files)
+
+        manifest = {'files': files,
+                    'added': sorted(set(self.files) - set(self.previous)),
+                    'changed': sorted(x for x in self.files
+                                      if x in self.previous and
+                                      self.previous[x] != self.files[x]),
+                    'removed': sorted(removed)}
+        with open(os.path.join(self.root, self.MANIFEST), 'w',
+                  encoding='utf8') as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        return manifest
+
+
+def output_intact(root, name, entry):
+    """
+    Returns  True  if  the  file name of the output directory root still has
+    the size of its manifest entry (see OutputWriter.keep)
+    """
+
+    try:
+        return os.path.getsize(os.path.join(root, name)) == entry['size']
+    except OSError:
+        return False
+
+
+# Git commands _______________________________________________________________
+
+class GitError(Exception):
+    """
+    Description
+    -----------
+    
+    Raised  by  git_command  when  git  is  not  installed  or  the command
+    fails (for example outside of a git repository).
+    """
+
+
+def git_command(*args):
+    """
+    Description
+    -----------
+    
+    Runs  a  git  command  in  the current directory. It is much cheaper than
+    importing GitPython, which is only used for the multi-version builds (see
+    html_for_revisions).
+    
+    Parameters
+    ----------
+    
+    *args : str
+        Arguments of the command, without "git"
+    
+    Raises
+    ------
+    
+    GitError
+        If git is not installed or the command fails
+    
+    Returns
+    -------
+    
+    str
+        Output of the command, without its trailing newline
+    
+    """
+
+    import subprocess
+    try:
+        result = subprocess.run(['git'] + list(args), capture_output=True)
+    except OSError as error:
+        raise GitError(str(error))
+    if result.returncode:
+        raise GitError(result.stderr.decode('utf8', 'replace').strip())
+    output = result.stdout.decode('utf8', 'surrogateescape')
+    return output[:-1] if output.endswith('\n') else output
+
+
+# Find project files _________________________________________________________
+
+# Directories that are never documented (version control, caches, virtual
+# environments and installed packages)
+DEFAULT_EXCLUDE = ('.git', '.hg', '.svn', '__pycache__', '.tox', '.nox',
+                   '.venv', 'venv', 'node_modules', '*.egg-info',
+                   '.mypy_cache', '.pytest_cache')
+
+
+def path_matches(path, patterns):
+    """
+    Description
+    -----------
+    
+    Checks  if  a  path  matches  one  of  the given glob patterns. A pattern
+    containing  a  '/'  is  matched  against  the whole path ("pkg/*_pb2.py"),
+    the others against the last name of the path only ("*_pb2.py")
+    
+    Parameters
+    ----------
+    
+    path : str
+        Path relative to the project directory : "pkg/sub/file.py"
+    
+    patterns : iterable of str
+        Glob patterns (see fnmatch)
+    
+    Returns
+    -------
+    
+    bool
+        True if one of the patterns matches
+    
+    """
+
+    name = path.rsplit('/', 1)[-1]
+    for pattern in patterns:
+        if '/' in pattern:
+            if fnmatch(path, pattern.lstrip('/')):
+                return True
+        elif fnmatch(name, pattern):
+            return True
+    return False
+
+
+def read_gitignore(directory):
+    """
+    Description
+    -----------
+    
+    Reads the .gitignore file of a directory
+    
+    Parameters
+    ----------
+    
+    directory : str
+        Directory, relative to the project directory ('' for the project
+        directory itself)
+    
+    Returns
+    -------
+    
+    list of tuple
+        (pattern, negated, directory only) for every rule, in order. The
+        patterns are relative to the directory
+    
+    """
+
+    rules = []
+    try:
+        with open(os.path.join(directory or '.', '.gitignore'), 'r',
+                  encoding='utf8') as f:
+            lines = f.read().split('\n')
+    except (OSError, UnicodeDecodeError):
+        return rules
+
+    for line in lines:
+        line = line.rstrip()
+        if not line or line[0] == '#':
+            continue
+        negated = line[0] == '!'
+        if negated:
+            line = line[1:]
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if '/' in line and not line.startswith('**/'):
+            line = '/' + line.lstrip('/')  # Relative to the directory
+        elif line.startswith('**/'):
+            line = line[3:]
+        if line:
+            rules.append((line, negated, dir_only))
+    return rules
+
+
+def gitignored(path, is_dir, gitignores):
+    """
+    Description
+    -----------
+    
+    Checks  if  a  path  is ignored by the .gitignore files of its parent
+    directories (the last matching rule wins, like git)
+    
+    Parameters
+    ----------
+    
+    path : str
+        Path relative to the project directory : "pkg/sub/file.py"
+    
+    is_dir : bool
+        True if the path is a directory
+    
+    gitignores : dict
+        Rules  of  the  .gitignore  file  of  every  directory (see
+        read_gitignore), by directory
+    
+    Returns
+    -------
+    
+    bool
+        True if the path is ignored
+    
+    """
+
+    ignored = False
+    parts = path.split('/')
+    for i in range(len(parts)):
+        directory = '/'.join(parts[:i])
+        rel = '/'.join(parts[i:])
+        for pattern, negated, dir_only in gitignores.get(directory, ()):
+            if dir_only and not is_dir:
+                continue
+            if path_matches(rel, [pattern]):
+                ignored = not negated
+    return ignored
+
+
+def find_python_files(include=None, exclude=None, max_file_size=None,
+                      gitignore=False, skipped=None):
+    """
+    Description
+    -----------
+    
+    Finds  all  the  *.py  files  of  the  project  in the current directory.
+    If  the  project  uses  git,  only  the  tracked  files are returned (given
+    by "git ls-files"). Otherwise, all the *.py files are returned.
+    
+    Without  git,  the  directories  that  are  excluded  are  never  entered.
+    
+    Parameters
+    ----------
+    
+    include : list of str, optional
+        Glob  patterns  of  the  files  to  document  (see  path_matches).
+        Default is ["*.py"]
+    
+    exclude : list of str, optional
+        Glob  patterns  of  the files and directories not to document (see
+        path_matches),  in  addition  to DEFAULT_EXCLUDE. A file in an
+        excluded directory is excluded. Default excludes nothing more
+    
+    max_file_size : int, optional
+        Files bigger than this size (in bytes) are skipped. None (default)
+        sets no limit
+    
+    gitignore : bool, optional
+        Skips the files ignored by the .gitignore files, even if they are
+        tracked. Default is False
+    
+    skipped : dict, optional
+        If  given,  the  number  of  skipped files is added in it for each
+        reason  :  "excluded",  "too big"  and  "gitignore",  and the number of
+        directories that were not entered in "pruned" (see skip_report)
+    
+    Returns
+    -------
+    
+    list of str
+        Path of every file : "./<pathToTheFile>/file.py"
+    
+    """
+
+    include = ['*.py'] if include is None else include
+    exclude = list(DEFAULT_EXCLUDE) + list(exclude or [])
+    if skipped is None:
+        skipped = {}
+
+    def skip(reason):
+        skipped[reason] = skipped.get(reason, 0) + 1
+
+    def keep(path):
+        # Checks a file that matches include, relative to the project
+        if path_matches(path, exclude):
+            skip('excluded')
+        elif max_file_size is not None and \
+                os.path.getsize(path) > max_file_size:
+            skip('too big')
+        else:
+            return True
+        return False
+
+    # Finding all *.py files if git  . . . . . . . . . . . . . . . . . . . . .
+
+    try:
+        files = git_command('ls-files').split('\n')
+        ignored = set()
+        if gitignore:
+            ignored = set(git_command('ls-files', '--cached', '--ignored',
+                                      '--exclude-standard').split('\n'))
+
+        excluded_dirs = {}  # Is each directory excluded (cache)
+
+        def excluded_dir(directory):
+            if directory not in excluded_dirs:
+                parent = directory.rsplit('/', 1)[0] if '/' in directory \
+                    else ''
+                excluded_dirs[directory] = \
+                    (parent and excluded_dir(parent)) or \
+                    path_matches(directory, exclude)
+            return excluded_dirs[directory]
+
+        all_files = []
+        for file in files:
+            file = file.replace('\\', '/')
+            if not file or not path_matches(file, include):
+                continue
+            if '/' in file and excluded_dir(file.rsplit('/', 1)[0]):
+                skip('excluded')
+            elif file in ignored:
+                skip('gitignore')
+            elif keep(file):
+                all_files.append("./" + file)
+
+    # Find all *.py files if no git  . . . . . . . . . . . . . . . . . . . . .
+    except GitError:
+        print("Git repository not found for the current project. "
+              "Trying to match all *.py files instead")
+
+        all_files = []
+        gitignores = {}  # Rules of the .gitignore file of each directory
+        for path, dirs, files in os.walk('.'):
+            rel = path[2:].replace('\\', '/')
+            prefix = rel + '/' if rel else ''
+            if gitignore:
+                gitignores[rel] = read_gitignore(rel)
+
+            # Pruning the excluded directories
+            kept = []
+            for name in dirs:
+                if path_matches(prefix + name, exclude) or (
+                        gitignore and
+                        gitignored(prefix + name, True, gitignores)):
+                    skip('pruned')
+                else:
+                    kept.append(name)
+            dirs[:] = kept
+
+            for name in files:
+                if not path_matches(prefix + name, include):
+                    continue
+                if gitignore and gitignored(prefix + name, False,
+                                            gitignores):
+                    skip('gitignore')
+                elif keep(prefix + name):
+                    all_files.append("./" + prefix + name)
+
+    # Same order with or without git (the side menu needs sorted files)
+    return sorted(all_files)
+
+
+def skip_report(skipped):
+    """
+    Description
+    -----------
+    
+    Summarizes the files skipped by find_python_files
+    
+    Parameters
+    ----------
+    
+    skipped : dict
+        Number of skipped files for each reason (see find_python_files)
+    
+    Returns
+    -------
+    
+    str
+        Summary of the skipped files ("" if nothing was skipped)
+    
+    """
+
+    reasons = [('excluded', " excluded"),
+               ('too big', " too big"),
+               ('gitignore', " ignored by .gitignore")]
+    report = ", ".join(str(skipped[key]) + text for key, text in reasons
+                       if skipped.get(key))
+    if report:
+        report = "Skipped files : " + report
+    if skipped.get('pruned'):
+        report += ("\n" if report else "") + str(skipped['pruned']) + \
+            " excluded directories were not entered"
+    return report
+
+
+# Git revisions ______________________________________________________________
+
+def git_revision():
+    """
+    Description
+    -----------
+    
+    Returns  the  commit  the current directory is checked out at, and the
+    tracked  files  that  differ  from  it  (modified  or  staged files).
+    Untracked files are ignored : they are not documented (see
+    find_python_files)
+    
+    Returns
+    -------
+    
+    commit : str
+        Hash of the HEAD commit (None if the project does not use git)
+    
+    dirty : list of str
+        Sorted paths of the uncommitted files : "./<pathToTheFile>/file.py"
+    
+    """
+
+    try:
+        commit = git_command('rev-parse', 'HEAD')
+        prefix = git_command('rev-parse', '--show-prefix')
+        status = git_command('status', '--porcelain', '-z', '--no-renames',
+                             '--untracked-files=no').split('\0')
+    except GitError:
+        return None, []
+
+    # Porcelain paths are relative to the root of the repository
+    dirty = ['./' + x[3 + len(prefix):] for x in status
+             if x[3:].startswith(prefix) and len(x) > 3 + len(prefix)]
+    return commit, sorted(dirty)
+
+
+def git_changed_files(commit, dirty=None):
+    """
+    Description
+    -----------
+    
+    Finds  the  files  changed  since  a  commit  :  the  files  changed by
+    the  following  commits  (both  paths  of a renamed file, deleted files)
+    and the uncommitted files (see git_revision)
+    
+    Parameters
+    ----------
+    
+    commit : str
+        Hash of the commit
+    
+    dirty : list of str, optional
+        Uncommitted  files,  if  git_revision  was  already  called. Default
+        calls it
+    
+    Returns
+    -------
+    
+    set of str
+        Paths of the changed files : "./<pathToTheFile>/file.py". None if
+        commit is not an ancestor of the HEAD commit
+    
+    """
+
+    try:
+        git_command('merge-base', '--is-ancestor', commit, 'HEAD')
+        prefix = git_command('rev-parse', '--show-prefix')
+        names = git_command('diff', '--name-only', '--no-renames', '-z',
+                            commit, 'HEAD').split('\0')
+    except GitError:
+        return None
+
+    changed = set(git_revision()[1] if dirty is None else dirty)
+    changed.update('./' + x[len(prefix):] for x in names
+                   if x.startswith(prefix) and len(x) > len(prefix))
+    return changed
+
+
+# Last change of every file, in the docapy directory (see git_last_changes)
+LAST_CHANGES = '.last_changes.json'
+
+
+def git_last_changes(files, previous=None):
+    """
+    Description
+    -----------
+    
+    Finds  the  last  commit  that  changed  each  file  in  a single "git
+    log"  pass  :  the  history  is  read  from  the  newest commit and the
+    pass stops as soon as every file was found.
+    
+    If  previous  (the  result  of  a  previous  call) is given, only the
+    commits  that  came  after  it  are  read  :  the other files did not
+    change  since  then.  The  history  is  only  read  again  for the files
+    previous does not know.
+    
+    Parameters
+    ----------
+    
+    files : list of str
+        Paths of the files : "./<pathToTheFile>/file.py"
+    
+    previous : dict, optional
+        Result of a previous call, for example in another build
+    
+    Returns
+    -------
+    
+    dict
+        {'commit'  :  HEAD  commit,  'files'  :  {file : [commit, timestamp]}}.
+        The  files  that  were  never  committed  are  None. None if the
+        project does not use git
+    
+    """
+
+    try:
+        head = git_command('rev-parse', 'HEAD')
+    except GitError:
+        return None
+
+    wanted = set(files)
+    found = {}
+    if previous and previous.get('commit') == head:
+        found = {x: previous['files'][x] for x in wanted
+                 if x in previous['files']}
+    elif previous and previous.get('commit'):
+        try:
+            git_command('merge-base', '--is-ancestor', previous['commit'],
+                        'HEAD')
+            found = git_log_files(previous['commit'] + '..HEAD', wanted)
+            found.update((x, previous['files'][x]) for x in wanted
+                         if x not in found and x in previous['files'])
+        except GitError:
+            pass
+    missing = wanted - set(found)
+    if missing:
+        found.update(git_log_files('HEAD', missing))
+        found.update((x, None) for x in missing if x not in found)
+    return {'commit': head, 'files': {x: found[x] for x in sorted(found)}}
+
+
+def git_log_files(revisions, files):
+    """
+    Description
+    -----------
+    
+    Reads  the  output  of  "git  log"  while  it  runs  and returns the most
+    recent  commit  of  revisions  that  changed  each  file.  git  is stopped
+    as soon as every file was found.
+    
+    Parameters
+    ----------
+    
+    revisions : str
+        Revision range of the commits ("HEAD", "<commit>..HEAD")
+    
+    files : set of str
+        Paths of the files : "./<pathToTheFile>/file.py"
+    
+    Returns
+    -------
+    
+    dict
+        {file : [commit, timestamp]} for the files that were found
+    
+    """
+
+    import subprocess
+
+    # Each commit is "\x01<hash> <timestamp>" followed by the paths it changed
+    # (relative to the current directory), all separated by \0
+    process = subprocess.Popen(
+        ['git', 'log', '-z', '--format=%x01%H %ct', '--name-only',
+         '--no-renames', '--relative', revisions],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    found = {}
+    commit = None
+    rest = b''
+    try:
+        for chunk in iter(lambda: process.stdout.read(65536), b''):
+            tokens = (rest + chunk).split(b'\0')
+            rest = tokens.pop()
+            for token in tokens:
+                token = token.lstrip(b'\n').decode('utf8', 'surrogateescape')
+                if token.startswith('\x01'):
+                    commit = token[1:].split(' ')
+                    commit = [commit[0], int(commit[1])]
+                elif commit is not None and './' + token in files:
+                    found.setdefault('./' + token, commit)
+            if len(found) == len(files):
+                break
+    finally:
+        process.kill()
+        process.wait()
+        process.stdout.close()
+    return found
+
+
+# Build costs ________________________________________________________________
+
+# Cost history of the builds, in the docapy directory (see read_costs)
+COSTS = '.costs.json'
+
+# Predicted cost (in seconds per byte of source) of the files without history
+# when no file has any
+DEFAULT_COST_RATE = 1e-6
+
+
+def read_costs(path):
+    """
+    Description
+    -----------
+    
+    Reads  the  cost  history  written  by  the  previous  builds.  Each file
+    whose  page  was  generated  has  its  measured  cost  :  extraction  and
+    rendering  time  in  seconds ('extract' and 'render'), bytes written
+    ('bytes') and size of its source ('source'). Files whose page was reused
+    keep the cost of the build that generated it.
+    
+    Parameters
+    ----------
+    
+    path : str
+        Path of the cost history file
+    
+    Returns
+    -------
+    
+    dict
+        {file : cost}. Empty if the file does not exist or is invalid
+    
+    """
+
+    try:
+        with open(path, 'r', encoding='utf8') as f:
+            costs = json.load(f)
+        return costs if isinstance(costs, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def predict_costs(files, history):
+    """
+    Description
+    -----------
+    
+    Predicts  the  time  it  takes  to  generate  the  page  of  each file :
+    its  measured  time  if it has a history (see read_costs). Otherwise, its
+    source  size  times  the  time  per  byte  of  the  files of the history
+    (DEFAULT_COST_RATE if the history is empty).
+    
+    Parameters
+    ----------
+    
+    files : list of str
+        Paths of the files, relative to the current directory
+    
+    history : dict
+        Cost history (see read_costs)
+    
+    Returns
+    -------
+    
+    dict
+        {file : predicted time in seconds}
+    
+    """
+
+    known = [x for x in history.values() if x.get('source')]
+    total_size = sum(x['source'] for x in known)
+    rate = sum(x['extract'] + x['render'] for x in known) / total_size \
+        if total_size else DEFAULT_COST_RATE
+
+    predicted = {}
+    for file in files:
+        cost = history.get(file)
+        if cost is not None:
+            predicted[file] = cost['extract'] + cost['render']
+        else:
+            try:
+                predicted[file] = os.path.getsize(file) * rate
+            except OSError:
+                predicted[file] = 0.
+    return predicted
+
+
+def plan_report(plan):
+    """
+    Description
+    -----------
+    
+    Summary  of  the  plan of a build (see html_for_project) : the number of
+    pages  to  generate,  the  predicted  time  and  the  most  expensive
+    pages first.
+    
+    Parameters
+    ----------
+    
+    plan : dict
+        {'files', 'generate', 'costs', 'shards'} (see html_for_project)
+    
+    Returns
+    -------
+    
+    str
+        The report
+    
+    """
+
+    costs = plan['costs']
+    generate = sorted(plan['generate'], key=lambda x: (-costs[x], x))
+    report = str(len(generate)) + " of " + str(len(plan['files'])) + \
+        " pages to generate, predicted time : " + \
+        "%.2f" % sum(costs[x] for x in generate) + " s"
+    for file in generate[:10]:
+        report += "\n    " + file + " : " + "%.3f" % costs[file] + " s"
+    if len(generate) > 10:
+        report += "\n    ..."
+    if plan['shards']:
+        report += "\nPredicted time of each shard (all pages) : " + \
+            ", ".join("%.2f" % x for x in plan['shards']) + " s"
+    return report
+
+
+# Sharded builds _____________________________________________________________
+
+def shard_files(files, shard, of, costs=None):
+    """
+    Description
+    -----------
+    
+    Returns  the  files  of a shard. Files are assigned to shards from a hash
+    of  their  path,  so  the  partition  is  the  same on every machine and
+    does not depend on the order of the files.
+    
+    If  costs  are  given,  the shards are balanced instead : the files are
+    assigned  longest  first  to  the  shard  with  the lowest total cost.
+    Every  shard  must  be  given the same costs to get the same partition.
+    
+    Parameters
+    ----------
+    
+    files : list of str
+        All the files of the project
+    
+    shard : int
+        Index of the shard (0 <= shard < of)
+    
+    of : int
+        Number of shards
+    
+    costs : dict, optional
+        Predicted cost of every file (see predict_costs)
+    
+    Returns
+    -------
+    
+    list of str
+        Files of the shard, in the same order as files
+    
+    """
+
+    if not 0 <= shard < of:
+        raise ValueError("Invalid shard " + str(shard) + " of " + str(of))
+
+    if costs is None:
+        return [file for file in files
+                if int(hashlib.sha1(file.encode('utf8')).hexdigest(), 16) %
+                of == shard]
+
+    loads = [0.] * of
+    assigned = set()
+    for file in sorted(set(files), key=lambda x: (-costs[x], x)):
+        lightest = loads.index(min(loads))
+        loads[lightest] += costs[file]
+        if lightest == shard:
+            assigned.add(file)
+    return [file for file in files if file in assigned]
+
+
+def definition_names(def_list):
+    """
+    Description
+    -----------
+    
+    Returns  the  qualified  names  of  the functions / classes of a file
+    ("Class.method" for a method)
+    
+    Parameters
+    ----------
+    
+    def_list : list of dict
+        Functions / classes of the file (see extract_definitions)
+    
+    Returns
+    -------
+    
+    list of str
+        Qualified names, in order of appearance
+    
+    """
+
+    names = []
+    parents = []  # (indentation, qualified name) of the enclosing objects
+    for fct in def_list:
+        while parents and parents[-1][0] >= fct['ind']:
+            parents.pop()
+        name = fct['def'].split('(')[0].strip()
+        if parents:
+            name = parents[-1][1] + '.' + name
+        names.append(name)
+        parents.append((fct['ind'], name))
+    return names
+
+
+def merge_shards(directory, project_name, github, shard_dirs, color='cyan'):
+    """
+    Description
+    -----------
+    
+    Merges  the  outputs  of  a  sharded  build  (see  html_for_project)  into
+    the  "docapy"  directory of the project and generates index.html and the
+    CSS  and  font  files.  No  source file is read : everything comes from
+    the shard outputs and their metadata files ("shard.json").
+    
+    Every  shard  knows  all  the  files of the project, so the side menu and
+    the links to the other files of the project are already correct in every
+    page.
+    
+    Parameters
+    ----------
+    
+    directory : str
+        Directory of your project
+    
+    project_name : str
+        Name of your project
+    
+    github : str
+        Github link of the project
+    
+    shard_dirs : list of str
+        Output directories of all the shards
+    
+    color : str, optional
+        Accent color for the documentation (see html_for_project)
+    
+    Returns
+    -------
+    
+    None
+    
+    """
+
+    shard_dirs = [os.path.abspath(x) for x in shard_dirs]
+    abspath = os.path.abspath(directory).replace('\\', '/')
+    output = os.path.join(abspath, 'docapy')
+
+    # Reading the metadata of the shards .....................................
+
+    metadata = []
+    for shard_dir in shard_dirs:
+        with open(os.path.join(shard_dir, 'shard.json'), 'r',
+                  encoding='utf8') as f:
+            metadata.append(json.load(f))
+
+    of = metadata[0]['of']
+    if sorted(x['shard'] for x in metadata) != list(range(of)) or \
+            any(x['of'] != of for x in metadata):
+        raise ValueError("Shards are missing or duplicated : expected " +
+                         str(of) + " different shards")
+    all_files = metadata[0]['all_files']
+    if any(x['all_files'] != all_files for x in metadata):
+        raise ValueError("The shards were built from different file lists")
+    if any(x.get('plan_costs') != metadata[0].get('plan_costs')
+           for x in metadata):
+        raise ValueError("The shards were balanced with different cost "
+                         "files (or some without cost file)")
+    sharded = sorted(file for x in metadata for file in x['files'])
+    if sharded != sorted(all_files):
+        from collections import Counter
+        duplicated = sorted(x for x, n in Counter(sharded).items() if n > 1)
+        missing = sorted(set(all_files) - set(sharded))
+        raise ValueError("The shards do not cover the files of the project "
+                         "(duplicated : " + str(duplicated) +
+                         ", missing : " + str(missing) + ")")
+    optimize_assets = bool(metadata[0].get('optimize_assets'))
+    assets = asset_files(color, optimize_assets,
+                         metadata[0].get('glyphs', ''), output)
+    stylesheet = assets['style.css'][0]
+    if any(x['stylesheet'] != stylesheet for x in metadata):
+        raise ValueError("The shards were built with another color or "
+                         "other asset options")
+    critical = None
+    if optimize_assets:
+        critical = critical_css(assets['style.css'][1].decode('utf8'))
+
+    # Copying the pages ......................................................
+
+    writer = OutputWriter(output)
+    costs = {}  # Cost history of the shards (see read_costs)
+    for shard_dir in shard_dirs:
+        costs.update(read_costs(os.path.join(shard_dir, COSTS)))
+        for path, dirs, names in os.walk(shard_dir):
+            rel = os.path.relpath(path, shard_dir).replace('\\', '/')
+            rel = '' if rel == '.' else rel + '/'
+            for name in names:
+                if rel + name in ('shard.json', OutputWriter.MANIFEST,
+                                  CHECKPOINT, COSTS, LAST_CHANGES):
+                    continue
+                with open(os.path.join(path, name), 'rb') as f:
+                    writer.write(rel + name, f.read())
+
+    # Creating index html and assets .........................................
+
+    external_imports = []
+    for x in metadata:
+        external_imports += x['external_imports']
+
+    service_worker = any(x.get('service_worker') for x in metadata)
+    writer.write('index.html', index_html(all_files, project_name, github,
+                                          external_imports,
+                                          stylesheet=stylesheet,
+                                          service_worker=service_worker,
+                                          critical=critical))
+    for name, data in assets.values():
+        writer.write(name, data)
+    if service_worker:
+        writer.write('sw.js', service_worker_js(
+            [x[0] for x in assets.values()]))
+    writer.finish()
+    with open(os.path.join(output, COSTS), 'w', encoding='utf8') as f:
+        json.dump({x: costs[x] for x in all_files if x in costs}, f,
+                  indent=1, sort_keys=True)
+    os.chdir(output)
+
+
+# Service worker _____________________________________________________________
+
+# Maximum number of pages kept by the service worker (the least recently
+# fetched ones are removed)
+SW_PAGES = 100
+
+
+def service_worker_js(assets):
+    """
+    Description
+    -----------
+    
+    Generates  the  service  worker  of  the  documentation  (sw.js). It
+    precaches  the  index  page,  the  CSS and the font when it is installed.
+    Assets  are  always  read  from  the cache (their name changes with their
+    content,  see  asset_files).  Pages  are  read  from  the  cache  if  they
+    were  visited  before  and  updated  in the background, so navigation is
+    instant and works offline. At most SW_PAGES pages are kept.
+    
+    Like split pages, it only works if the documentation is served over HTTP.
+    
+    Parameters
+    ----------
+    
+    assets : list of str
+        Names of the assets (see asset_files)
+    
+    Returns
+    -------
+    
+    str
+        JavaScript code of the service worker
+    
+    """
+
+    cache = 'docapy-' + hashlib.sha256(
+        json.dumps(sorted(assets)).encode('utf8')).hexdigest()[:12]
+    return "var CACHE=" + json.dumps(cache) + ",ASSETS=" + \
+        json.dumps(sorted(assets)) + ",PAGES=" + str(SW_PAGES) + ";\n" \
+        "function isAsset(u){return ASSETS.indexOf(new URL(u).pathname" \
+        ".split('/').pop())>=0;}\n" \
+        "self.addEventListener('install',function(e){e.waitUntil(" \
+        "caches.open(CACHE).then(function(c){return c.addAll(" \
+        "ASSETS.concat(['index.html']));}).then(function(){" \
+        "return self.skipWaiting();}));});\n" \
+        "self.addEventListener('activate',function(e){e.waitUntil(" \
+        "caches.keys().then(function(k){return Promise.all(k.filter(" \
+        "function(n){return n.indexOf('docapy-')===0&&n!==CACHE;}).map(" \
+        "function(n){return caches.delete(n);}));}).then(function(){" \
+        "return self.clients.claim();}));});\n" \
+        "function trim(c){return c.keys().then(function(k){k=k.filter(" \
+        "function(r){return !isAsset(r.url);});return Promise.all(" \
+        "k.slice(0,Math.max(k.length-PAGES,0)).map(function(r){" \
+        "return c.delete(r);}));});}\n" \
+        "self.addEventListener('fetch',function(e){var r=e.request;" \
+        "if(r.method!=='GET'||new URL(r.url).origin!==location.origin)" \
+        "return;e.respondWith(caches.open(CACHE).then(function(c){" \
+        "return c.match(r).then(function(hit){if(hit&&isAsset(r.url))" \
+        "return hit;var net=fetch(r).then(function(res){if(res.ok){" \
+        "var copy=res.clone();c.delete(r).then(function(){" \
+        "return c.put(r,copy);})" \
+        ".then(function(){return trim(c);});}return res;});" \
+        "if(hit){e.waitUntil(net.catch(function(){}));return hit;}" \
+        "return net;});}));});\n"
+
+
+def sw_register_script(file):
+    """
+    Description
+    -----------
+    
+    Generates  the  script  registering  the  service  worker  (see
+    service_worker_js) in the page of a file
+    
+    Parameters
+    ----------
+    
+    file : str
+        Path of the Python file : "./<pathToTheFile>/file.py"
+    
+    Returns
+    -------
+    
+    str
+        HTML <script> element
+    
+    """
+
+    return "<script>if('serviceWorker' in navigator)navigator." \
+           "serviceWorker.register('" + '../' * (len(file.split('/')) - 2) + \
+           "sw.js');</script>"
+
+
+# Render a page ______________________________________________________________
+
+def page_content(file, record, all_files, compact=False, definitions=None,
+                 parallel_threshold=PARALLEL_THRESHOLD):
+    """
+    Description
+    -----------
+    
+    Generates  the  content  division of the page of a file : file description,
+    imports and functions / classes
+    
+    Parameters
+    ----------
+    
+    file : str
+        Path of the Python file : "./<pathToTheFile>/file.py"
+    
+    record : dict
+        Extracted documentation of the file (see extract_file)
+    
+    all_files : list of str
+        List of all the files of the project
+    
+    compact : bool, optional
+        Generates compact HTML (see html_for_project). Default is False
+    
+    definitions : str, optional
+        Result  of  definitions_to_html  for  this  record,  if  it is already
+        known (file with the same source as another one)
+    
+    parallel_threshold : int, optional
+        Size above which the functions / classes are rendered on several
+        processes (see definitions_to_html). Default is PARALLEL_THRESHOLD
+    
+    Returns
+    -------
+    
+    html : str
+        HTML of the content division
+    
+    imports : dict of lists
+        Imports of the file (see classify_imports)
+    
+    """
+
+    html = definitions if definitions is not None else \
+        definitions_to_html(record['definitions'], record['docstring'],
+                            compact, parallel_threshold)
+
+    # Detecting imports
+    imports = classify_imports(record['imports'], all_files)
+    imphtml = imports_to_html(all_files, file, imports)
+
+    # Adding imports in the middle of the documentation
+    ht = html.split('<h2>Functions & Classes</h2>')
+    if len(ht) > 1:
+        html = ht[0] + imphtml + '<h2>Functions & Classes</h2>' + \
+               '<h2>Functions & Classes</h2>'.join(ht[1:])
+    else:
+        html = ht[0][:-6] + imphtml + "</div>"
+
+    if 'degraded' in record:
+        html = html.replace('<div class="content">',
+                            '<div class="content">' +
+                            degraded_html(record['degraded']), 1)
+
+    if compact:
+        html = minify_html(html)
+
+    return html, imports
+
+
+def page_html(file, content, all_files, project_name, github,
+              body_end="</body></html>", stylesheet='style.css',
+              prefetch=(), critical=None, last_change=None):
+    """
+    Description
+    -----------
+    
+    Generates  the  whole  page of a file : header, title, side menu and
+    content
+    
+    Parameters
+    ----------
+    
+    file : str
+        Path of the Python file : "./<pathToTheFile>/file.py"
+    
+    content : str
+        Content division of the page (see page_content)
+    
+    all_files : list of str
+        List of all the files of the project
+    
+    project_name : str
+        Name of your project
+    
+    github : str
+        Github link of the project
+    
+    body_end : str, optional
+        End of the page (default "</body></html>")
+    
+    stylesheet : str, optional
+        Name of the CSS file (see html_header)
+    
+    prefetch : list of str, optional
+        Files whose page is prefetched (see html_header)
+    
+    critical : str, optional
+        CSS rules inlined in the header (see html_header)
+    
+    last_change : list, optional
+        Last commit that changed the file (see html_header)
+    
+    Returns
+    -------
+    
+    str
+        HTML of the page
+    
+    """
+
+    html = html_header(file, project_name, github, stylesheet, prefetch,
+                       critical, last_change)
+    html += "<h1>" + file.split('/')[-1] + "</h1>"
+    html += side_menu(all_files, file)
+    return html + content + body_end
+
+
+def render_page(path, all_files, project_name, github, compact=False,
+                extractor=None, stylesheet='style.css'):
+    """
+    Description
+    -----------
+    
+    Generates the documentation page of a single file, without writing it
+    
+    Parameters
+    ----------
+    
+    path : str
+        Path  of  the  Python  file  relative  to  the  current  directory :
+        "./<pathToTheFile>/file.py"
+    
+    all_files : list of str
+        List of all the files of the project (used for the side menu and the
+        links to the imported files)
+    
+    project_name : str
+        Name of your project
+    
+    github : str
+        Github link of the project
+    
+    compact : bool, optional
+        Generates compact HTML (see html_for_project). Default is False
+    
+    extractor : BudgetedExtractor, optional
+        Extractor used to read the file. Default extracts it in the current
+        process, without cache
+    
+    stylesheet : str, optional
+        Name of the CSS file (see html_header)
+    
+    Returns
+    -------
+    
+    str
+        HTML of the page
+    
+    """
+
+    if extractor is None:
+        extractor = BudgetedExtractor()
+    content, _ = page_content(path, extractor.extract(path), all_files,
+                              compact)
+    return page_html(path, content, all_files, project_name, github,
+                     stylesheet=stylesheet)
+
+
+def write_page(writer, file, record, all_files, project_name, github,
+               compact=False, lazy_threshold=None, stylesheet='style.css',
+               content=None, prefix='', prefetch=False,
+               service_worker=False, critical=None, last_change=None):
+    """
+    Description
+    -----------
+    
+    Writes  the  page of a file (and its fragments if it is split, see
+    split_lazy_sections) from its extracted documentation
+    
+    Parameters
+    ----------
+    
+    writer : OutputWriter
+        Output directory
+    
+    file : str
+        Path of the Python file : "./<pathToTheFile>/file.py"
+    
+    record : dict
+        Extracted documentation of the file (see extract_file)
+    
+    all_files : list of str
+        List of all the files of the project
+    
+    project_name : str
+        Name of your project
+    
+    github : str
+        Github link of the project
+    
+    compact : bool, optional
+        Generates compact HTML (see html_for_project). Default is False
+    
+    lazy_threshold : int, optional
+        Size (in bytes) above which the page is split (see html_for_project)
+    
+    stylesheet : str, optional
+        Name of the CSS file (see html_header)
+    
+    content : tuple, optional
+        Result of page_content for this file, if it is already known
+    
+    prefix : str, optional
+        Directory of the documentation in the output directory ("v1.0/").
+        Default is the output directory itself
+    
+    prefetch : bool, optional
+        Adds  prefetch hints for the pages of the imported project files and
+        of the previous and next files of the side menu. Default is False
+    
+    service_worker : bool, optional
+        Registers the service worker (see service_worker_js). Default is
+        False
+    
+    critical : str, optional
+        CSS rules inlined in the header (see html_header)
+    
+    last_change : list, optional
+        Last commit that changed the file (see html_header)
+    
+    Returns
+    -------
+    
+    size : int
+        Size of the page in bytes
+    
+    imports : dict of lists
+        Imports of the file (see classify_imports)
+    
+    """
+
+    if content is None:
+        content = page_content(file, record, all_files, compact)
+    html, imports = content
+    page = prefix + file[2:-3] + '.html'
+
+    # Splitting huge pages
+    body_end = "</body></html>"
+    # The threshold is in bytes (UTF-8). A page is never smaller in bytes
+    # than in characters, so it is encoded only when it could be under it
+    if lazy_threshold is not None and \
+            (len(html) > lazy_threshold or
+             len(html.encode('utf8')) > lazy_threshold):
+        fragment_dir = file.split('/')[-1][:-3] + '.fragments'
+        html, fragments = split_lazy_sections(html, fragment_dir)
+        for name, fragment in fragments.items():
+            writer.write(page[:-5] + '.fragments/' + name, fragment)
+        body_end = LAZY_SCRIPT + body_end
+    if service_worker:
+        body_end = sw_register_script(file) + body_end
+
+    # Pages that are likely to be opened next
+    targets = []
+    if prefetch:
+        module_names = [x.split('/')[-1][:-3] for x in all_files]
+        targets = [all_files[module_names.index(x)]
+                   for x in imports['internal']]
+        if file in all_files:
+            index = all_files.index(file)
+            targets += all_files[max(index - 1, 0):index] + \
+                all_files[index + 1:index + 2]
+        targets = sorted(set(targets) - {file})
+
+    html = page_html(file, html, all_files, project_name, github, body_end,
+                     stylesheet, targets, critical, last_change)
+    return writer.write(page, html), imports
+
+
+# Identical sources __________________________________________________________
+
+def duplicate_sources(files):
+    """
+    Description
+    -----------
+    
+    Finds  the  files  whose  source  is identical to the source of another
+    file  (empty  __init__.py  files,  generated  or  copied  modules ...).
+    Only the files that have the same size as another file are read.
+    
+    Parameters
+    ----------
+    
+    files : list of str
+        Paths of the files, relative to the current directory
+    
+    Returns
+    -------
+    
+    dict
+        {file : SHA-256 of its source} for every file that has the same
+        source as another one
+    
+    """
+
+    sizes = {}
+    for file in files:
+        try:
+            sizes.setdefault(os.path.getsize(file), []).append(file)
+        except OSError:
+            pass
+
+    digests = {}
+    for same_size in sizes.values():
+        if len(same_size) < 2:
+            continue
+        for file in same_size:
+            try:
+                with open(file, 'rb') as f:
+                    digests[file] = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                pass
+
+    counts = {}
+    for digest in digests.values():
+        counts[digest] = counts.get(digest, 0) + 1
+    return {x: digests[x] for x in digests if counts[digests[x]] > 1}
+
+
+# Checkpoints ________________________________________________________________
+
+class BuildCheckpoint:
+    """
+    Description
+    -----------
+    
+    Records  the  files  whose  page  is  done  while  a  build runs, in a
+    JSON  Lines  file  that  is flushed after every file. The next build with
+    the  same  key  reads  it  back (done) and only generates the pages that
+    are  missing  or  whose  source changed : the checkpoint makes interrupted
+    and failed builds resumable, and the following builds incremental.
+    
+    The  first line is a header : the key, the git commit the sources were
+    at  ('commit')  and  their  uncommitted  files  ('dirty',  see
+    git_revision).  Each  other  line  is  a  dict  :  the  path  of  the file
+    ('file'),  the  size  and  modification  time  of  the source ('source'),
+    the  manifest  entries  of  the  written  files  ('outputs',  see
+    OutputWriter) and what the end of the build needs (page size, symbols,
+    external imports ...).
+    
+    The  file  is  rewritten  when  it  is  opened  :  the entries of the
+    previous  build  are  only  in  done  until  they  are added again (see
+    add).  With  append,  the  new entries are added after them instead : a
+    later entry of a file replaces the earlier ones (see read_checkpoint).
+    
+    Parameters
+    ----------
+    
+    path : str
+        Path of the checkpoint file
+    
+    key : str
+        Hash  of  everything  the  pages  depend  on besides their source :
+        the entries of a checkpoint with another key are ignored
+    
+    commit : str, optional
+        Git commit of the sources (see git_revision)
+    
+    dirty : list of str, optional
+        Uncommitted files of the sources (see git_revision)
+    
+    append : bool, optional
+        Keeps  the  header and the entries of the previous build, which must
+        have the same key (see run_daemon). Default is False
+    
+    """
+
+    def __init__(self, path, key, commit=None, dirty=(), append=False):
+        self.path = path
+        if append:
+            self.previous, self.done = {}, {}
+            self.f = open(path, 'a', encoding='utf8')
+            return
+
+        # Header and entries of the previous build
+        self.previous, self.done = read_checkpoint(path, key)
+
+        self.f = open(path, 'w', encoding='utf8')
+        self.f.write(json.dumps({'key': key, 'commit': commit,
+                                 'dirty': list(dirty)}) + '\n')
+        self.f.flush()
+
+    def add(self, entry):
+        """
+        Records a file whose page is done
+        """
+
+        self.f.write(json.dumps(entry) + '\n')
+        self.f.flush()
+
+    def close(self):
+        """
+        Closes the checkpoint file
+        """
+
+        if not self.f.closed:
+            self.f.close()
+
+
+def read_checkpoint(path, key):
+    """
+    Description
+    -----------
+    
+    Reads  the  checkpoint  file  of  the  previous  build  (see
+    BuildCheckpoint) without modifying it.
+    
+    Parameters
+    ----------
+    
+    path : str
+        Path of the checkpoint file
+    
+    key : str
+        Key of the build (see BuildCheckpoint)
+    
+    Returns
+    -------
+    
+    previous : dict
+        Header of the previous build. Empty if its key is not key
+    
+    done : dict
+        {file : entry} of the pages of the previous build
+    
+    """
+
+    previous = {}
+    done = {}
+    try:
+        with open(path, 'r', encoding='utf8') as f:
+            lines = f.read().split('\n')
+        header = json.loads(lines[0])
+        if header.get('key') == key:
+            previous = header
+            for line in lines[1:]:
+                try:
+                    entry = json.loads(line)
+                except ValueError:  # Line of an interrupted write
+                    break
+                done[entry['file']] = entry
+    except (OSError, ValueError, AttributeError):
+        pass
+    return previous, done
+
+
+# Generate HTML file for an entire project ___________________________________
+
+def html_for_project(directory, project_name, github, color='cyan',
+                     lazy_threshold=None, cache_dir=None,
+                     cache_size=256 * 2 ** 20, shard=None, of=1,
+                     compact=False, page_budget=None, time_budget=None,
+                     memory_budget=None, ir_file=None, include=None,
+                     exclude=None, max_file_size=None, gitignore=False,
+                     prefetch=False, service_worker=False,
+                     optimize_assets=False, cost_file=None, plan=False,
+                     dedupe=False, rebuild=None, extractor=None,
+                     last_changed=False,
+                     parallel_threshold=PARALLEL_THRESHOLD, state=None):
+    """
+    Description
+    -----------
+    
+    Generates  many  HTML files for all the *.py files in the given directory.
+    Saves  every  HTML  file  in  a  directory  named  "docapy". The file tree
+    structure  of the project is copied in this folder. Every *py file has his
+    own HTML file containing all its documentation and references to the other
+    HTML files of the project.
+    
+    This  function  also  creates  an  index.html  file containing the project
+    overview.
+    
+    If  docapy  documentation  already  exists  for  this  project, it will be
+    overwritten.
+    
+    Parameters
+    ----------
+    
+    directory : str
+        Directory of your project
+    
+    project_name : str
+        Name of your project
+    
+    github : str
+        Github link of the project
+    
+    color : str, optional
+        Accent color for the documentation. It can be one of these values :
+            - "blue"
+            - "cyan" (default)
+            - "red"
+            - "green"
+            - "orange"
+            - "purple"
+            - "#XXXXXX" where XXXXXX is a hexadecimal color value (custom)
+    
+    lazy_threshold : int, optional
+        Size  (in  bytes)  above which the documentation of a file is split :
+        the  page  only contains the summaries of its functions / classes and
+        their bodies are written in a "<file>.fragments" directory. They  are
+        fetched  when  they  are  expanded  (see split_lazy_sections). Split
+        pages must be served over HTTP. None (default) never splits pages
+    
+    cache_dir : str, optional
+        Directory  of  the  parse  cache (see extract_file). The extraction of
+        unchanged  files  is  read  from  it,  even  if  the  other  options
+        (color,  project  name  ...)  changed.  None  (default)  disables  the
+        cache
+    
+    cache_size : int, optional
+        Maximum  size  of  the  parse cache in bytes (default 256 MiB). The
+        least recently used entries are removed at the end of the build
+    
+    shard : int, optional
+        Index  of  the  shard  to build (0 <= shard < of). Only the pages of
+        the  files  of  this shard are generated (see shard_files), and the
+        "docapy/shard.json"  metadata  file  is  written  instead of index.html
+        and  the  CSS  and  font  files. The shards are then combined with
+        merge_shards. None (default) builds the whole project
+    
+    of : int, optional
+        Number of shards (default 1)
+    
+    compact : bool, optional
+        Generates  compact  HTML  :  code  parts  are  <pre> elements and the
+        whitespaces  that  are  not displayed are removed (see minify_html).
+        The pages look the same. Default is False
+    
+    page_budget : int, optional
+        Maximum  size  of  a  page  in  bytes. The pages that are bigger are
+        listed  at  the  end  of  the build, after the summary of the page
+        sizes. None (default) sets no budget
+    
+    time_budget : float, optional
+        Maximum  time  (in  seconds)  to  extract  the  documentation of a
+        file.  Files  that  exceed  it  get an outline page instead : the
+        functions  and  classes  without  their  docstrings. The same happens
+        to the files whose extraction fails. None (default) sets no limit
+    
+    memory_budget : int, optional
+        Maximum  memory  (in  bytes) to extract the documentation of a file
+        (see BudgetedExtractor). None (default) sets no limit
+    
+    ir_file : str, optional
+        Path  of  a  JSON  Lines  file  in  which  the  extracted documentation
+        of  every  file  is  exported  (see ir_line). html_from_ir generates
+        the HTML from it without the sources. None (default) exports nothing
+    
+    include : list of str, optional
+        Glob  patterns  of  the  files  to  document  (see find_python_files).
+        Default is ["*.py"]
+    
+    exclude : list of str, optional
+        Glob  patterns  of  the  files  and  directories not to document, in
+        addition  to  DEFAULT_EXCLUDE  (see  find_python_files). For example
+        ["*_pb2.py", "vendor"]
+    
+    max_file_size : int, optional
+        Files  bigger  than  this  size (in bytes) are not documented. None
+        (default) sets no limit
+    
+    gitignore : bool, optional
+        Does  not  document  the  files ignored by the .gitignore files, even
+        if they are tracked. Default is False
+    
+    prefetch : bool, optional
+        Adds  prefetch hints to the pages : the browser downloads the pages
+        of  the  imported  project  files  and of the neighbouring files of
+        the side menu in the background. Default is False
+    
+    service_worker : bool, optional
+        Writes a service worker (sw.js, see service_worker_js) registered by
+        every  page.  It  caches  the  assets  and  the  visited pages so that
+        navigation is instant and works offline. Default is False
+    
+    optimize_assets : bool, optional
+        Minifies  the  CSS,  inlines  its  critical  rules  in  the  pages (see
+        critical_css)  and  converts  the  font  to  a  WOFF2  subset  of  the
+        characters  the  documentation  can  display  (see  optimize_font,
+        needs fontTools). Default is False
+    
+    cost_file : str, optional
+        Cost  history  (see  read_costs)  used  to balance the shards : they
+        get  about  the  same  predicted  time  instead  of the files being
+        assigned  from  a  hash  of  their  path  (see shard_files). Every
+        shard  must  be  given  the  same  file,  for  example  the
+        "docapy/.costs.json"  file  of the previous merged build. Files
+        without  history  are  predicted  from  their  size.  None  (default)
+        reads  the  history  of  the  previous build in "docapy" and does not
+        balance the shards
+    
+    plan : bool, optional
+        Only  prints  the  plan  of  the  build  (see  plan_report) : the pages
+        that  would  be  generated  (the  other  ones  are  reused) and the
+        predicted  time  from  the  cost  of  each  page  in  the previous
+        builds. Nothing is written. Default is False
+    
+    dedupe : bool, optional
+        Hard  links  the  output  files  that  have  the  same content (see
+        OutputWriter). Files with identical sources are always extracted and
+        rendered once (see duplicate_sources). Default is False
+    
+    parallel_threshold : int, optional
+        Size  (in  bytes)  of  the  signatures  and  docstrings of a file above
+        which  its  functions  /  classes  are  rendered on a pool of worker
+        processes  (see  definitions_to_html).  The  pages  are identical.
+        Default is PARALLEL_THRESHOLD. None never uses workers
+    
+    rebuild : list of str, optional
+        Paths  of  files  ("./<pathToTheFile>/file.py") whose page is generated
+        again even if their source did not change. Default is None
+    
+    extractor : BudgetedExtractor, optional
+        Extractor  kept  between  builds  (see  run_daemon).  Its budgets are
+        used instead of time_budget and memory_budget, and it is not closed
+        at the end of the build. None (default) creates one
+    
+    state : dict, optional
+        State  of  the  previous  build  with the same arguments, kept between
+        builds  by  run_daemon  (files  of  the  project,  assets,  checkpoint
+        entries,  manifest  ...).  The  build  fills it. If the files of
+        rebuild  are  files  of  the  previous  build that still exist, only
+        their  pages  are  generated  :  the  project  is  not  searched  for
+        files,  the  other  pages  are  not  checked  and  index.html is only
+        written  again  if  the  external  imports  changed.  Otherwise,  the
+        whole project is built. None (default) keeps no state
+    
+    last_changed : bool, optional
+        Shows  the  date  of  the  last  commit  that  changed  each file in
+        the  navigation  bar  of  its  page,  with  a  link  to  the commit.
+        The  commits  are  found  in  a  single  "git log" pass that only
+        reads  the  commits  made  since  the  previous build (see
+        git_last_changes). Ignored without git. Default is False
+    
+    Returns
+    -------
+    
+    None, or the plan if plan is True : {'files', 'generate', 'costs',
+    'shards'} (files of the build, files whose page would be generated,
+    predicted time of every file of the project in seconds and predicted
+    time of each shard if the build is sharded)
+    
+    """
+
+    # File management ........................................................
+
+    # Moving to the project directory
+    abspath = os.path.abspath(directory).replace('\\', '/')
+    if cache_dir is not None:
+        cache_dir = os.path.abspath(cache_dir)
+    if ir_file is not None:
+        ir_file = os.path.abspath(ir_file)
+    if cost_file is not None:
+        cost_file = os.path.abspath(cost_file)
+    os.chdir(directory)
+    output = abspath + "/docapy"
+
+    # State of the previous build (see run_daemon). It is emptied until this
+    # build succeeds
+    kept = dict(state or {})
+    if state is not None:
+        state.clear()
+    rebuild = set(rebuild or ())
+    fast = bool(kept and rebuild) and shard is None and ir_file is None and \
+        not plan and all(x in kept['all_files'] and os.path.isfile(
+            abspath + x[1:]) for x in rebuild)
+
+    # Finding all *.py files
+    skipped = {}  # Number of skipped files for each reason
+    if fast:
+        all_files = kept['all_files']
+    else:
+        all_files = find_python_files(include, exclude, max_file_size,
+                                      gitignore, skipped)
+
+    # Predicted cost of every file (see predict_costs)
+    costs = {}
+    if not fast:
+        history = read_costs(cost_file if cost_file is not None else
+                             output + '/' + COSTS)
+        costs = predict_costs(all_files, history)
+
+    # Keeping only the files of this shard
+    plan_costs = None  # Hash of the costs that balanced the shards
+    if fast:
+        files = [x for x in all_files if x in rebuild]
+    elif shard is None:
+        files = all_files
+    else:
+        files = shard_files(all_files, shard, of,
+                            costs if cost_file is not None else None)
+        if cost_file is not None:
+            plan_costs = hashlib.sha256(json.dumps(
+                costs, sort_keys=True).encode('utf8')).hexdigest()
+
+    # CSS and font (see asset_files)
+    if fast:
+        assets, critical = kept['assets'], kept['critical']
+    else:
+        glyphs = ''
+        if optimize_assets:
+            glyphs = site_glyphs(project_name, all_files)
+        assets = asset_files(color, optimize_assets, glyphs, output)
+        critical = None
+        if optimize_assets:
+            critical = critical_css(assets['style.css'][1].decode('utf8'))
+    stylesheet = assets['style.css'][0]
+
+    # Writing the HTML files .................................................
+
+    external_imports = []
+
+    symbols = {}  # Qualified names of the functions / classes of each file
+    page_sizes = {}  # Size of the page of each file (bytes)
+    degraded = {}  # Reason of the degradation of each degraded file
+    measured = {}  # Cost of each generated page (see read_costs)
+
+    # Pages of the previous build (finished or not) with the same options
+    if fast:
+        key, commit, dirty = kept['key'], None, ()
+        previous, done = {}, dict(kept['done'])
+    else:
+        fdir = os.path.dirname(os.path.abspath(__file__))
+        with open(fdir + '/docapy.py', 'rb') as f:
+            key = [hashlib.sha256(f.read()).hexdigest(), all_files, shard,
+                   of, project_name, github, stylesheet, compact,
+                   lazy_threshold, time_budget, memory_budget,
+                   ir_file is not None, prefetch, service_worker,
+                   last_changed]
+        key = hashlib.sha256(json.dumps(key).encode('utf8')).hexdigest()
+        commit, dirty = git_revision()
+        previous, done = read_checkpoint(output + '/' + CHECKPOINT, key)
+
+    # Last commit that changed each file (see git_last_changes)
+    last_changes = kept['last_changes'] if fast else {}
+    if last_changed and commit is not None:
+        try:
+            with open(output + '/' + LAST_CHANGES, 'r', encoding='utf8') as f:
+                changes = json.load(f)
+        except (OSError, ValueError):
+            changes = None
+        changes = git_last_changes(files, changes)
+        last_changes = changes['files']
+
+    # Files changed since the commit of the previous build. Without git, the
+    # size and modification time of the sources are compared instead. If
+    # the commit is not an ancestor of the current one, all the pages are
+    # generated again
+    changed = None
+    if commit is not None and previous.get('commit'):
+        changed = git_changed_files(previous['commit'], dirty)
+        if changed is None:
+            done = {}
+        else:
+            changed.update(previous['dirty'])
+
+    def unchanged(file, entry):
+        # Can the page of the previous build be reused ? Its outputs must
+        # also still exist (see OutputWriter.keep)
+        if entry.get('last_change') != last_changes.get(file):
+            return False
+        if changed is not None:
+            return file not in changed
+        try:
+            stat = os.stat(abspath + file[1:])
+        except OSError:
+            return False
+        return entry['source'] == [stat.st_size, stat.st_mtime_ns]
+
+    # Planning the build .....................................................
+
+    if plan:
+        generate = []
+        for file in files:
+            entry = done.get(file)
+            if entry is None or file in rebuild or \
+                    not unchanged(file, entry) or not all(
+                    output_intact(output, x, entry['outputs'][x])
+                    for x in entry['outputs']):
+                generate.append(file)
+        loads = []
+        if shard is not None or of > 1:
+            balance = costs if cost_file is not None else None
+            loads = [sum(costs[x] for x in shard_files(all_files, i, of,
+                                                       balance))
+                     for i in range(of)]
+        planned = {'files': files, 'generate': generate, 'costs': costs,
+                   'shards': loads}
+        print(plan_report(planned))
+        return planned
+
+    # Creates the docapy directory. The files of the previous build are
+    # removed at the end (see OutputWriter)
+    writer = OutputWriter(output, dedupe,
+                          kept['manifest'] if fast else None)
+    checkpoint = BuildCheckpoint(output + '/' + CHECKPOINT, key, commit,
+                                 dirty, append=fast)
+    own_extractor = extractor is None
+    if own_extractor:
+        extractor = BudgetedExtractor(cache_dir, time_budget, memory_budget)
+
+    # Intermediate representation (see ir_line)
+    ir = None
+    if ir_file is not None:
+        ir = open(ir_file, 'w', encoding='utf8')
+        ir.write(json.dumps({'docapy_ir': IR_VERSION,
+                             'all_files': all_files}) + '\n')
+
+    failed = {}  # Error of each file whose page could not be generated
+
+    # Files with the same source as another file : their documentation is
+    # extracted and rendered once (see duplicate_sources)
+    duplicates = duplicate_sources(files)
+    remaining = {}  # Number of files left for each duplicated source
+    for digest in duplicates.values():
+        remaining[digest] = remaining.get(digest, 0) + 1
+    shared = {}  # {hash : (record, definitions HTML, time to generate them)}
+    reused = [0, 0.]  # Number of files that used shared, time saved
+
+    skipped_api = [0]  # Number of pages reused from their fingerprint
+    entries = {}  # Checkpoint entry of each page of the build
+
+    def build_page(file, path, previous_entry=None):
+        # Generates the page of a file and returns its checkpoint entry
+        # (None if it failed). The page of previous_entry is reused if the
+        # documentation of the file did not change (see api_fingerprint)
+        start = len(writer.log)
+        try:
+            stat = os.stat(path)
+            digest = duplicates.get(file)
+            started = time.perf_counter()
+            if digest in shared:
+                record, definitions, cost = shared[digest]
+                reused[0] += 1
+                reused[1] += cost
+            else:
+                record = extractor.extract(path)
+                definitions = None
+            extracted = time.perf_counter()
+            fingerprint = api_fingerprint(record)
+            if previous_entry is not None and file not in rebuild and \
+                    previous_entry.get('fingerprint') == fingerprint and \
+                    previous_entry.get('last_change') == \
+                    last_changes.get(file) and \
+                    all(writer.keep(x, previous_entry['outputs'][x])
+                        for x in previous_entry['outputs']):
+                entry = dict(previous_entry,
+                             source=[stat.st_size, stat.st_mtime_ns])
+                skipped_api[0] += 1
+                checkpoint.add(entry)
+                return entry
+            if digest is not None and digest not in shared:
+                definitions = definitions_to_html(record['definitions'],
+                                                  record['docstring'],
+                                                  compact, parallel_threshold)
+                shared[digest] = (record, definitions,
+                                  time.perf_counter() - started)
+            content = page_content(file, record, all_files, compact,
+                                   definitions, parallel_threshold)
+            size, imports = write_page(writer, file, record, all_files,
+                                       project_name, github, compact,
+                                       lazy_threshold, stylesheet,
+                                       content=content, prefetch=prefetch,
+                                       service_worker=service_worker,
+                                       critical=critical,
+                                       last_change=last_changes.get(file))
+            measured[file] = {
+                'extract': round(extracted - started, 6),
+                'render': round(time.perf_counter() - extracted, 6),
+                'bytes': sum(writer.files[x]['size']
+                             for x in writer.log[start:]),
+                'source': stat.st_size}
+            entry = {'file': file,
+                     'source': [stat.st_size, stat.st_mtime_ns],
+                     'outputs': {x: writer.files[x]
+                                 for x in writer.log[start:]},
+                     'size': size,
+                     'fingerprint': fingerprint,
+                     'symbols': definition_names(record['definitions']),
+                     'external': sorted(set(x.split('.')[0]
+                                            for x in imports['external']
+                                            if x not in STDLIB))}
+            if 'degraded' in record:
+                entry['degraded'] = record['degraded']
+            if last_changes.get(file) is not None:
+                entry['last_change'] = last_changes[file]
+            if ir is not None:
+                entry['ir'] = ir_line(file, record)
+        except Exception as error:
+            # The page only contains the error
+            failed[file] = type(error).__name__ + ' : ' + str(error)
+            record = {'definitions': [], 'docstring': '', 'imports': [],
+                      'degraded': failed[file]}
+            try:
+                write_page(writer, file, record, all_files, project_name,
+                           github, compact, lazy_threshold, stylesheet,
+                           service_worker=service_worker, critical=critical)
+            except Exception:
+                pass
+            return None
+        checkpoint.add(entry)
+        return entry
+
+    try:
+        for file in files:
+            print(file)
+            path = abspath + file[1:]
+
+            # Reusing the page of the previous build if its source did not
+            # change, generating it otherwise
+            entry = previous_entry = done.get(file)
+            if entry is not None:
+                if file not in rebuild and unchanged(file, entry) and all(
+                        writer.keep(x, entry['outputs'][x])
+                        for x in entry['outputs']):
+                    checkpoint.add(entry)
+                else:
+                    entry = None
+            if entry is None:
+                entry = build_page(file, path, previous_entry)
+
+            # The shared documentation of a source is kept until its last file
+            if file in duplicates:
+                remaining[duplicates[file]] -= 1
+                if not remaining[duplicates[file]]:
+                    shared.pop(duplicates[file], None)
+            if entry is None:
+                continue
+            entries[file] = entry
+
+            if 'degraded' in entry:
+                degraded[file] = entry['degraded']
+            symbols[file] = entry['symbols']
+            page_sizes[file] = entry['size']
+            if ir is not None:
+                ir.write(entry['ir'] + '\n')
+
+            # Listing the non-standard imports
+            for imp in entry['external']:
+                if imp not in external_imports:
+                    external_imports.append(imp)
+    finally:
+        if own_extractor:
+            extractor.close()
+        checkpoint.close()
+        if ir is not None:
+            ir.close()
+
+    # Creating index html and assets .........................................
+
+    if fast:
+        # The pages that were not generated again keep their entries, and
+        # the pages that failed are generated again by the next full build
+        for file in files:
+            done.pop(file, None)
+        done.update(entries)
+        entries = done
+        external_imports = []
+        for file in all_files:
+            for imp in entries.get(file, {}).get('external', ()):
+                if imp not in external_imports:
+                    external_imports.append(imp)
+
+    if shard is None and (not fast or
+                          external_imports != kept['external_imports']):
+        writer.write('index.html', index_html(all_files, project_name, github,
+                                              external_imports, compact,
+                                              stylesheet, service_worker,
+                                              critical))
+    if shard is None and not fast:
+        for name, data in assets.values():
+            writer.write(name, data)
+        if service_worker:
+            writer.write('sw.js', service_worker_js(
+                [x[0] for x in assets.values()]))
+
+    # Writing the metadata of the shard ......................................
+
+    if shard is not None:
+        metadata = {'shard': shard,
+                    'of': of,
+                    'all_files': all_files,
+                    'files': files,
+                    'plan_costs': plan_costs,
+                    'stylesheet': stylesheet,
+                    'service_worker': service_worker,
+                    'optimize_assets': optimize_assets,
+                    'glyphs': glyphs,
+                    'external_imports': sorted(set(external_imports)),
+                    'symbols': symbols}
+        writer.write('shard.json', json.dumps(metadata, indent=1))
+
+    # Removing the files of the previous build and writing the manifest
+    if fast:
+        manifest = writer.update([x for file in files
+                                  for x in kept['done'].get(file, {}).get(
+                                      'outputs', ())])
+    else:
+        manifest = writer.finish([ir_file, cost_file, cache_dir])
+    os.chdir(output)
+
+    if state is not None:
+        state.update(all_files=all_files, assets=assets, critical=critical,
+                     key=key, last_changes=last_changes, done=entries,
+                     manifest=manifest['files'],
+                     external_imports=external_imports)
+
+    # Cost of the pages generated by this build, and of the previous builds
+    # for the reused pages (see read_costs). The costs, the last changes and
+    # the parse cache are left to the next full build
+    if not fast:
+        own = read_costs(output + '/' + COSTS)
+        own.update(measured)
+        with open(output + '/' + COSTS, 'w', encoding='utf8') as f:
+            json.dump({x: own[x] for x in files if x in own}, f, indent=1,
+                      sort_keys=True)
+    if last_changed and commit is not None:
+        with open(output + '/' + LAST_CHANGES, 'w', encoding='utf8') as f:
+            json.dump(changes, f, indent=1, sort_keys=True)
+
+    # Limiting the size of the parse cache ...................................
+
+    if cache_dir is not None and not fast:
+        cache_evict(cache_dir, cache_size)
+
+    print(size_report(page_sizes, page_budget))
+    if skipped:
+        print(skip_report(skipped))
+    print(str(len(manifest['added'])) + " files added, " +
+          str(len(manifest['changed'])) + " changed, " +
+          str(len(manifest['removed'])) + " removed")
+    if skipped_api[0]:
+        print(str(skipped_api[0]) + " pages reused : the documentation of "
+              "their source did not change")
+    if reused[0]:
+        print(str(reused[0]) + " pages have the same source as another page "
+              ": extracted and rendered once (" + "%.2f" % reused[1] +
+              " s saved)")
+    if writer.linked[0]:
+        print(str(writer.linked[0]) + " identical files hard linked (" +
+              str(writer.linked[1]) + " bytes saved)")
+    if degraded:
+        print(str(len(degraded)) + " files only have an outline :")
+        for file in sorted(degraded):
+            print("    " + file + " : " + degraded[file])
+    if failed:
+        print(str(len(failed)) + " files failed :")
+        for file in sorted(failed):
+            print("    " + file + " : " + failed[file])
+
+
+# Intermediate representation ________________________________________________
+
+# Version of the format of the IR files. It changes when a field is renamed
+# or removed
+IR_VERSION = 1
+
+
+def ir_line(file, record):
+    """
+    Description
+    -----------
+    
+    Converts  the  extracted documentation of a file to a line of an IR file.
+    An IR file is a JSON Lines file : its first line is a header
+    {"docapy_ir" : IR_VERSION, "all_files" : files of the project} and each
+    following line describes a file :
+    
+    - file : path of the file ("./<pathToTheFile>/file.py")
+    
+    - docstring : docstring of the file (or null)
+    
+    - imports : names of the imported modules
+    
+    - definitions : functions and classes of the file. Each one has a name,
+      a qualified name ("Class.method"), a kind ("def" or "class"), a
+      signature ("name(args)"), a docstring (or null), its indentation
+      (indent), the lowest indentation since the previous definition
+      (last_indent) and the functions / classes defined in its body
+      (children)
+    
+    - degraded : reason why only the outline was extracted, if it was (see
+      outline_record)
+    
+    Parameters
+    ----------
+    
+    file : str
+        Path of the file : "./<pathToTheFile>/file.py"
+    
+    record : dict
+        Extracted documentation of the file (see extract_file)
+    
+    Returns
+    -------
+    
+    str
+        Compact JSON line (without the newline character)
+    
+    """
+
+    definitions = []
+    parents = []  # (indentation, node) of the enclosing objects
+    names = definition_names(record['definitions'])
+    for fct, qualname in zip(record['definitions'], names):
+        while parents and parents[-1][0] >= fct['ind']:
+            parents.pop()
+        node = {'name': fct['def'].split('(')[0].strip(),
+                'qualname': qualname,
+                'kind': fct['type'],
+                'signature': fct['def'],
+                'docstring': fct['docstring'],
+                'indent': fct['ind'],
+                'last_indent': fct['last_ind'],
+                'children': []}
+        if parents:
+            parents[-1][1]['children'].append(node)
+        else:
+            definitions.append(node)
+        parents.append((fct['ind'], node))
+
+    line = {'file': file,
+            'docstring': record['docstring'],
+            'imports': record['imports'],
+            'definitions': definitions}
+    if 'degraded' in record:
+        line['degraded'] = record['degraded']
+    return json.dumps(line, ensure_ascii=False, separators=(',', ':'))
+
+
+def record_from_ir(line):
+    """
+    Description
+    -----------
+    
+    Converts a line of an IR file back to the extracted documentation of the
+    file (see ir_line)
+    
+    Parameters
+    ----------
+    
+    line : dict
+        Decoded line of the IR file
+    
+    Returns
+    -------
+    
+    dict
+        Extracted documentation of the file (see extract_file)
+    
+    """
+
+    def_list = []
+    stack = list(reversed(line['definitions']))
+    while stack:
+        node = stack.pop()
+        def_list.append({'def': node['signature'],
+                         'docstring': node['docstring'],
+                         'last_ind': node['last_indent'],
+                         'ind': node['indent'],
+                         'type': node['kind']})
+        stack += reversed(node['children'])
+
+    record = {'definitions': def_list,
+              'docstring': line['docstring'],
+              'imports': line['imports']}
+    if 'degraded' in line:
+        record['degraded'] = line['degraded']
+    return record
+
+
+def read_ir(ir_file):
+    """
+    Description
+    -----------
+    
+    Reads an IR file (see ir_line) one line at a time
+    
+    Parameters
+    ----------
+    
+    ir_file : str
+        Path of the IR file
+    
+    Returns
+    -------
+    
+    all_files : list of str
+        List of all the files of the project
+    
+    records : generator
+        Yields (file, extracted documentation of the file) tuples
+    
+    """
+
+    f = open(ir_file, 'r', encoding='utf8')
+    header = json.loads(f.readline() or 'null')
+    if not isinstance(header, dict) or \
+            header.get('docapy_ir') != IR_VERSION:
+        f.close()
+        raise ValueError(ir_file + " is not a Docapy IR file (version " +
+                         str(IR_VERSION) + ")")
+
+    def records():
+        with f:
+            for line in f:
+                if line.strip():
+                    line = json.loads(line)
+                    yield line['file'], record_from_ir(line)
+
+    return header['all_files'], records()
+
+
+def html_from_ir(ir_files, output, project_name, github, color='cyan',
+                 lazy_threshold=None, compact=False):
+    """
+    Description
+    -----------
+    
+    Generates  the  documentation  of  a  project  from  IR files (see
+    ir_line) instead of its sources
+    
+    Parameters
+    ----------
+    
+    ir_files : str or list of str
+        IR  file(s)  of  the  project. One file per shard can be given if the
+        project was built in shards
+    
+    output : str
+        Output directory (the "docapy" directory of html_for_project)
+    
+    project_name : str
+        Name of your project
+    
+    github : str
+        Github link of the project
+    
+    color : str, optional
+        Accent color for the documentation (see html_for_project)
+    
+    lazy_threshold : int, optional
+        Size above which the pages are split (see html_for_project)
+    
+    compact : bool, optional
+        Generates compact HTML (see html_for_project). Default is False
+    
+    Returns
+    -------
+    
+    None
+    
+    """
+
+    if isinstance(ir_files, str):
+        ir_files = [ir_files]
+    writer = OutputWriter(os.path.abspath(output))
+    stylesheet = asset_files(color)['style.css'][0]
+
+    external_imports = []
+    for ir_file in ir_files:
+        all_files, records = read_ir(ir_file)
+        for file, record in records:
+            _, imports = write_page(writer, file, record, all_files,
+                                    project_name, github, compact,
+                                    lazy_threshold, stylesheet)
+            for imp in imports['external']:
+                if imp not in STDLIB and imp.split('.')[0] not in \
+                        external_imports:
+                    external_imports.append(imp.split('.')[0])
+
+    writer.write('index.html', index_html(all_files, project_name, github,
+                                          external_imports, compact,
+                                          stylesheet))
+    for name, data in asset_files(color).values():
+        writer.write(name, data)
+    writer.finish(ir_files)
+
+
+# Multi-version documentation ________________________________________________
+
+def html_for_revisions(directory, project_name, github, revisions,
+                       output=None, color='cyan', lazy_threshold=None,
+                       cache_dir=None, compact=False, include=None,
+                       exclude=None, dedupe=False):
+    """
+    Description
+    -----------
+    
+    Generates  the  documentation  of  several  git  revisions  of a project
+    (release  tags  for  example),  in  one  directory per revision. The
+    sources  are  read  from  the  git  object  store  through  a single
+    "git cat-file --batch" process : the worktree is never checked out.
+    
+    The  revisions  are  built  in  the  given order. A file that is identical
+    in  the  previous  revision  is  not  parsed  again,  and  the content of
+    its  page  is  not  generated  again  if  its  imports  still link to the
+    same  files.  Only  the  header  and  the  side  menu  of  the  page are.
+    With cache_dir, the parse cache is shared with html_for_project.
+    
+    Like  html_for_project,  unchanged  files  are  not  written  again and a
+    manifest.json  is written (see OutputWriter). A versions.json file lists
+    the revisions and their directories.
+    
+    Parameters
+    ----------
+    
+    directory : str
+        Directory of your project (in a git repository)
+    
+    project_name : str
+        Name of your project
+    
+    github : str
+        Github link of the project
+    
+    revisions : list of str
+        Git revisions to document ("v1.0", "main", commit hashes ...). The
+        documentation of a revision is written in a directory named after it
+        ('/' are replaced with '-')
+    
+    output : str, optional
+        Output directory. Default is "docapy-versions" in the project
+        directory
+    
+    color : str, optional
+        Accent color for the documentation (see html_for_project)
+    
+    lazy_threshold : int, optional
+        Size above which the pages are split (see html_for_project)
+    
+    cache_dir : str, optional
+        Directory of the parse cache (see extract_file)
+    
+    compact : bool, optional
+        Generates compact HTML (see html_for_project). Default is False
+    
+    include : list of str, optional
+        Glob patterns of the files to document (see find_python_files)
+    
+    exclude : list of str, optional
+        Glob patterns of the files and directories not to document (see
+        find_python_files)
+    
+    dedupe : bool, optional
+        Hard  links  the  identical  files  of  the  revisions  (pages of the
+        files  that  did  not  change,  CSS and font) instead of writing a
+        copy in each directory (see OutputWriter). Default is False
+    
+    Returns
+    -------
+    
+    None
+    
+    """
+
+    abspath = os.path.abspath(directory).replace('\\', '/')
+    output = os.path.abspath(output) if output is not None else \
+        abspath + '/docapy-versions'
+    if cache_dir is not None:
+        cache_dir = os.path.abspath(cache_dir)
+    os.chdir(directory)
+
+    include = ['*.py'] if include is None else include
+    exclude = list(DEFAULT_EXCLUDE) + list(exclude or [])
+    import git  # Only needed here, for its persistent "git cat-file" process
+    g = git.cmd.Git(".")
+    writer = OutputWriter(output, dedupe)
+    assets = asset_files(color)
+    stylesheet = assets['style.css'][0]
+
+    records = {}  # Extraction of the blobs of the previous revision
+    contents = {}  # Page contents of the previous revision (see page_content)
+    versions = []
+
+    for revision in revisions:
+        commit = g.rev_parse(revision + '^{commit}')
+        label = revision.replace('/', '-')
+        print(revision + " (" + commit[:12] + ")")
+
+        # Python files of the revision : {path : blob hash}
+        blobs = {}
+        for line in g.ls_tree('-r', '-z', commit).split('\0'):
+            if not line:
+                continue
+            info, path = line.split('\t', 1)
+            _, type_, sha = info.split()
+            parents = path.split('/')[:-1]
+            if type_ == 'blob' and path_matches(path, include) and not any(
+                    path_matches('/'.join(parents[:i + 1]), exclude)
+                    for i in range(len(parents))) and \
+                    not path_matches(path, exclude):
+                blobs['./' + path] = sha
+        all_files = sorted(blobs)
+        module_names = [x.split('/')[-1][:-3] for x in all_files]
+
+        new_records = {}
+        new_contents = {}
+        external_imports = []
+        for file in all_files:
+            sha = blobs[file]
+
+            # Parsing the blob if it was not in the previous revision
+            record = new_records.get(sha) or records.get(sha)
+            if record is None:
+                try:
+                    record = extract_data(g.get_object_data(sha)[3],
+                                          cache_dir)
+                except Exception as error:
+                    record = {'definitions': [], 'docstring': '',
+                              'imports': [],
+                              'degraded': type(error).__name__ + ' : ' +
+                              str(error)}
+            new_records[sha] = record
+
+            # Content of the page, if the file and the files it imports did
+            # not change
+            imports = classify_imports(record['imports'], all_files)
+            targets = [all_files[module_names.index(x)]
+                       for x in imports['internal']]
+            key = json.dumps([sha, file, imports, targets])
+            content = contents.get(key) or new_contents.get(key)
+            if content is None:
+                content = page_content(file, record, all_files, compact)
+            new_contents[key] = content
+
+            write_page(writer, file, record, all_files, project_name, github,
+                       compact, lazy_threshold, stylesheet, content,
+                       label + '/')
+            for imp in imports['external']:
+                if imp not in STDLIB and imp.split('.')[0] not in \
+                        external_imports:
+                    external_imports.append(imp.split('.')[0])
+
+        records, contents = new_records, new_contents
+
+        writer.write(label + '/index.html',
+                     index_html(all_files, project_name, github,
+                                external_imports, compact, stylesheet))
+        for name, data in assets.values():
+            writer.write(label + '/' + name, data)
+        versions.append({'revision': revision, 'commit': commit,
+                         'directory': label})
+
+    writer.write('versions.json', json.dumps(versions, indent=1))
+    manifest = writer.finish([cache_dir])
+    print(str(len(manifest['added'])) + " files added, " +
+          str(len(manifest['changed'])) + " changed, " +
+          str(len(manifest['removed'])) + " removed")
+    if writer.linked[0]:
+        print(str(writer.linked[0]) + " identical files hard linked (" +
+              str(writer.linked[1]) + " bytes saved)")
+
+
+# Documentation server _______________________________________________________
+
+class PageCache:
+    """
+    Description
+    -----------
+    
+    Thread-safe  LRU  cache  of  rendered  pages. Its total size is bounded
+    and every entry is only valid for the modification time of its source.
+    
+    Parameters
+    ----------
+    
+    max_size : int
+        Maximum total size of the cached pages in bytes
+    
+    """
+
+    def __init__(self, max_size):
+        import threading
+        from collections import OrderedDict
+
+        self.max_size = max_size
+        self.size = 0
+        self.pages = OrderedDict()  # key : (mtime, bytes)
+        self.lock = threading.Lock()
+
+    def get(self, key, mtime):
+        """
+        Returns  the  cached  page  of  key  or  None  if  it is not cached or
+        was rendered from another version of the source (other mtime)
+        """
+
+        with self.lock:
+            entry = self.pages.get(key)
+            if entry is None or entry[0] != mtime:
+                return None
+            self.pages.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, mtime, data):
+        """
+        Caches a page and removes the least recently used ones if the cache
+        is too big
+        """
+
+        with self.lock:
+            if key in self.pages:
+                self.size -= len(self.pages.pop(key)[1])
+            if len(data) > self.max_size:
+                return
+            self.pages[key] = (mtime, data)
+            self.size += len(data)
+            while self.size > self.max_size:
+                _, (_, old) = self.pages.popitem(last=False)
+                self.size -= len(old)
+
+
+class DocServer:
+    """
+    Description
+    -----------
+    
+    Renders  the  documentation  of  a  project  on  demand. The files of the
+    project  are  discovered  when  the  server  is created. Each page is
+    rendered  the  first  time  it  is  requested  and kept in a PageCache
+    until its source file changes.
+    
+    The  current  directory  is  changed to the project directory (like
+    html_for_project).
+    
+    Parameters
+    ----------
+    
+    directory : str
+        Directory of your project
+    
+    project_name : str
+        Name of your project
+    
+    github : str
+        Github link of the project
+    
+    color : str, optional
+        Accent color for the documentation (see html_for_project)
+    
+    compact : bool, optional
+        Generates compact HTML (see html_for_project). Default is False
+    
+    cache_dir : str, optional
+        Directory of the parse cache (see extract_file)
+    
+    page_cache_size : int, optional
+        Maximum size of the rendered pages kept in memory (default 64 MiB)
+    
+    """
+
+    def __init__(self, directory, project_name, github, color='cyan',
+                 compact=False, cache_dir=None, page_cache_size=64 * 2 ** 20):
+        if cache_dir is not None:
+            cache_dir = os.path.abspath(cache_dir)
+        os.chdir(directory)
+
+        self.project_name = project_name
+        self.github = github
+        self.color = color
+        self.compact = compact
+        self.all_files = find_python_files()
+        self.urls = {file[2:-3] + '.html': file for file in self.all_files}
+        self.cache = PageCache(page_cache_size)
+        self.extractor = BudgetedExtractor(cache_dir)
+        self.external_imports = None
+
+        # Content-hashed assets (see asset_files) : {name : (type, content)}
+        assets = asset_files(color)
+        self.stylesheet = assets['style.css'][0]
+        self.assets = {assets['style.css'][0]: ('text/css; charset=utf-8',
+                                                assets['style.css'][1]),
+                       assets['ModernSans-Light.otf'][0]:
+                           ('font/otf', assets['ModernSans-Light.otf'][1])}
+
+    def render_page(self, path):
+        """
+        Returns  the HTML of the page of the Python file path (a path of
+        the project : "./<pathToTheFile>/file.py")
+        """
+
+        return render_page(path, self.all_files, self.project_name,
+                           self.github, self.compact, self.extractor,
+                           self.stylesheet)
+
+    def render_index(self):
+        """
+        Returns  the  HTML  of  the  index  page.  The  non-standard  imports
+        of the project are found the first time it is requested
+        """
+
+        if self.external_imports is None:
+            external_imports = set()
+            for file in self.all_files:
+                try:
+                    with open(file, 'r', encoding='utf8') as f:
+                        names = find_imports(f.read())
+                except (OSError, UnicodeDecodeError):
+                    continue
+                imports = classify_imports(names, self.all_files)
+                external_imports.update(x.split('.')[0]
+                                        for x in imports['external']
+                                        if x not in STDLIB)
+            self.external_imports = sorted(external_imports)
+        return index_html(self.all_files, self.project_name, self.github,
+                          list(self.external_imports), self.compact,
+                          self.stylesheet)
+
+    def get(self, url):
+        """
+        Description
+        -----------
+        
+        Answers  a  request.  A  page  whose  source  file no longer exists is
+        a 404 error, and a page that could not be rendered is a 500 error
+        
+        Parameters
+        ----------
+        
+        url : str
+            Requested URL path ("/pkg/module.html")
+        
+        Returns
+        -------
+        
+        status : int
+            HTTP status
+        
+        content_type : str
+            Type of the content
+        
+        body : bytes
+            Content of the response
+        
+        """
+
+        from urllib.parse import unquote, urlsplit
+
+        path = unquote(urlsplit(url).path).lstrip('/') or 'index.html'
+        html = 'text/html; charset=utf-8'
+
+        if path in self.assets:
+            return 200, self.assets[path][0], self.assets[path][1]
+        elif path == 'index.html':
+            key, source = path, None
+        elif path in self.urls:
+            key, source = path, self.urls[path]
+        else:
+            return 404, html, b'<h1>404 Not Found</h1>'
+
+        # The source file may have been removed since the server started, and
+        # an error while rendering a page must not stop the server
+        try:
+            mtime = os.stat(source).st_mtime_ns if source is not None else 0
+            body = self.cache.get(key, mtime)
+            if body is None:
+                if path == 'index.html':
+                    body = self.render_index()
+                else:
+                    body = self.render_page(source)
+                body = body.encode('utf8')
+                self.cache.put(key, mtime, body)
+        except OSError:
+            return 404, html, b'<h1>404 Not Found</h1>'
+        except Exception as error:
+            return 500, html, ('<h1>500 Internal Server Error</h1>' +
+                               escape_html(type(error).__name__ + ' : ' +
+                                           str(error))).encode('utf8')
+
+        return 200, html, body
+
+
+def serve_project(directory, project_name, github, color='cyan', port=8000,
+                  host='127.0.0.1', compact=False, cache_dir=None,
+                  page_cache_size=64 * 2 ** 20):
+    """
+    Description
+    -----------
+    
+    Serves  the  documentation  of  a  project  over HTTP without generating
+    it  beforehand  :  pages  are  rendered  when  they  are first requested
+    (see  DocServer).  This is useful for huge projects. Only the standard
+    library is used. Stop the server with Ctrl+C.
+    
+    Parameters
+    ----------
+    
+    directory : str
+        Directory of your project
+    
+    project_name : str
+        Name of your project
+    
+    github : str
+        Github link of the project
+    
+    color : str, optional
+        Accent color for the documentation (see html_for_project)
+    
+    port : int, optional
+        Port of the server (default 8000)
+    
+    host : str, optional
+        Address of the server (default "127.0.0.1")
+    
+    compact : bool, optional
+        Generates compact HTML (see html_for_project). Default is False
+    
+    cache_dir : str, optional
+        Directory of the parse cache (see extract_file)
+    
+    page_cache_size : int, optional
+        Maximum size of the rendered pages kept in memory (default 64 MiB)
+    
+    Returns
+    -------
+    
+    None
+    
+    """
+
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import unquote, urlsplit
+
+    doc_server = DocServer(directory, project_name, github, color, compact,
+                           cache_dir, page_cache_size)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status, content_type, body = doc_server.get(self.path)
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            path = unquote(urlsplit(self.path).path).lstrip('/')
+            if status == 200 and path in doc_server.assets:
+                # Hashed names never change content
+                self.send_header('Cache-Control',
+                                 'max-age=31536000, immutable')
+            self.end_headers()
+            self.wfile.write(body)
+
+    httpd = ThreadingHTTPServer((host, port), Handler)
+    print("Serving the documentation of " + project_name + " on http://" +
+          host + ":" + str(httpd.server_address[1]) + "/")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+
+
+# Build daemon _______________________________________________________________
+
+def daemon_socket(directory):
+    """
+    Returns  the  default  path  of  the  Unix  domain  socket of the daemon of
+    a  project  (see  run_daemon)  :  a file of the temporary directory named
+    from a hash of the path of the project
+    """
+
+    import tempfile
+    abspath = os.path.abspath(directory).replace('\\', '/')
+    return os.path.join(tempfile.gettempdir(), 'docapy-' + hashlib.sha256(
+        abspath.encode('utf8')).hexdigest()[:16] + '.sock')
+
+
+def run_daemon(directory, project_name, github, socket_path=None,
+               idle_timeout=600., **options):
+    """
+    Description
+    -----------
+    
+    Runs  a  build  daemon  :  a  long-lived  process  that  listens  on a
+    Unix  domain  socket  and  builds  the  documentation  of  a  project  (see
+    html_for_project)  each  time  a  client asks for it (see request_build).
+    The  imported  modules,  the  extraction  worker  and  the  records  of
+    the  unchanged  files  (see  BudgetedExtractor)  are  kept in memory
+    between  the  builds,  with  the  state  of the last build (files of the
+    project, assets, checkpoint entries and manifest, see html_for_project).
+    
+    A  request  without  paths  builds  the project incrementally (see
+    BuildCheckpoint).  A  request  with  paths  of  files  of  the previous
+    build  only  generates  their  pages  again  :  its  cost  does  not
+    depend  on  the  size  of  the  project.  If  one  of  the  paths was
+    added or removed since the previous build, the whole project is built.
+    
+    Requests  are  handled  one  at  a time. The daemon stops when a client
+    asks  it  to,  or  when  it  received  no  request  for  idle_timeout
+    seconds.  Unix  domain  sockets  are  not  available  on  every  platform
+    (Windows).
+    
+    Parameters
+    ----------
+    
+    directory : str
+        Directory of your project
+    
+    project_name : str
+        Name of your project
+    
+    github : str
+        Github link of the project
+    
+    socket_path : str, optional
+        Path of the socket. Default is daemon_socket(directory)
+    
+    idle_timeout : float, optional
+        Time  (in  seconds)  without  request  after  which  the daemon stops
+        (default 10 minutes)
+    
+    **options
+        Other arguments of html_for_project (color, compact ...)
+    
+    Returns
+    -------
+    
+    None
+    
+    """
+
+    import io
+    import socket
+    from contextlib import redirect_stdout
+
+    if not hasattr(socket, 'AF_UNIX'):
+        raise OSError("Unix domain sockets are not supported on this "
+                      "platform")
+    directory = os.path.abspath(directory)
+    if socket_path is None:
+        socket_path = daemon_socket(directory)
+
+    # The builds change the current directory
+    for name in ('cache_dir', 'ir_file', 'cost_file'):
+        if options.get(name) is not None:
+            options[name] = os.path.abspath(options[name])
+    extractor = BudgetedExtractor(options.get('cache_dir'),
+                                  options.get('time_budget'),
+                                  options.get('memory_budget'),
+                                  keep_records=True)
+    state = {}  # State of the last build (see html_for_project)
+
+    # Removing the socket of a daemon that did not stop properly
+    if os.path.exists(socket_path):
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(socket_path)
+            raise OSError("A daemon is already running on " + socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.remove(socket_path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(socket_path)
+        server.listen()
+        server.settimeout(idle_timeout)
+        print("Docapy daemon of " + project_name + " listening on " +
+              socket_path)
+
+        while True:
+            try:
+                connection, _ = server.accept()
+            except socket.timeout:
+                print("No request for " + str(idle_timeout) + " s : stopping")
+                break
+
+            with connection:
+                connection.settimeout(60)
+                try:
+                    with connection.makefile('rb') as f:
+                        request = json.loads(f.readline())
+                except (OSError, ValueError):
+                    continue
+                if request.get('stop'):
+                    connection.sendall(json.dumps(
+                        {'ok': True, 'output': "Daemon stopped\n",
+                         'time': 0.}).encode('utf8') + b'\n')
+                    break
+
+                # Building with the paths of the request given relative to
+                # the project
+                rebuild = ['./' + os.path.relpath(x, directory).replace(
+                    '\\', '/') for x in request.get('paths', [])]
+                output = io.StringIO()
+                start = time.perf_counter()
+                try:
+                    with redirect_stdout(output):
+                        html_for_project(directory, project_name, github,
+                                         rebuild=rebuild, extractor=extractor,
+                                         state=state, **options)
+                    ok = True
+                except Exception as error:
+                    output.write(type(error).__name__ + " : " + str(error) +
+                                 "\n")
+                    ok = False
+                response = {'ok': ok, 'output': output.getvalue(),
+                            'time': time.perf_counter() - start}
+                try:
+                    connection.sendall(json.dumps(response).encode('utf8') +
+                                       b'\n')
+                except OSError:
+                    pass
+    finally:
+        server.close()
+        extractor.close()
+        try:
+            os.remove(socket_path)
+        except OSError:
+            pass
+
+
+def request_build(directory, paths=(), socket_path=None, stop=False):
+    """
+    Description
+    -----------
+    
+    Asks  the  daemon  of  a  project  (see run_daemon) to build its
+    documentation and waits for the end of the build.
+    
+    Parameters
+    ----------
+    
+    directory : str
+        Directory of the project
+    
+    paths : list of str, optional
+        Paths  of  files  whose  page  is  generated again even if their
+        source  did not change. Only these pages are generated (see
+        run_daemon). Default is () : the changed files are found and their
+        pages generated
+    
+    socket_path : str, optional
+        Path of the socket of the daemon. Default is daemon_socket(directory)
+    
+    stop : bool, optional
+        Stops the daemon instead of building. Default is False
+    
+    Raises
+    ------
+    
+    OSError
+        If no daemon listens on the socket
+    
+    Returns
+    -------
+    
+    dict
+        {'ok' : False if the build failed, 'output' : what the build
+        printed, 'time' : duration of the build in seconds}
+    
+    """
+
+    import socket
+
+    if socket_path is None:
+        socket_path = daemon_socket(directory)
+    request = {'stop': True} if stop else \
+        {'paths': [os.path.abspath(x) for x in paths]}
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(json.dumps(request).encode('utf8') + b'\n')
+        with client.makefile('rb') as f:
+            response = f.readline()
+    if not response:
+        raise ConnectionError("The daemon closed the connection")
+    return json.loads(response)
+
+
+# Command line _______________________________________________________________
+
+def main(argv=None):
+    """
+    Description
+    -----------
+    
+    Command  line  interface  of  Docapy  :  builds  the  documentation of a
+    project (see html_for_project), serves it (--serve, see serve_project),
+    builds  several  git  revisions  (--revisions,  see html_for_revisions),
+    merges  shards  (--merge,  see  merge_shards) or runs a build daemon and
+    sends  it  requests  (--daemon,  --request,  --stop,  see run_daemon). Run
+    "docapy  --help"  (once  installed  with pip) or "python docapy.py --help"
+    for the list of the options.
+    
+    Only  the  standard  library  is  imported  before  the first file is
+    processed : GitPython is only imported by html_for_revisions.
+    
+    Parameters
+    ----------
+    
+    argv : list of str, optional
+        Arguments of the command. Default is sys.argv[1:]
+    
+    Returns
+    -------
+    
+    None
+    
+    """
+
+    import argparse
+
+    def threshold(text):
+        # Size option that can be disabled with 0 or "none"
+        if text.lower() == 'none':
+            return None
+        return int(text) or None
+
+    parser = argparse.ArgumentParser(
+        prog='docapy', description="Generates the HTML documentation of a "
+                                   "Python project")
+    parser.add_argument('directory', help="directory of the project")
+    parser.add_argument('--name', help="name of the project (default : name "
+                                       "of its directory)")
+    parser.add_argument('--github', default='',
+                        help="link of the repository of the project")
+    parser.add_argument('--color', default='cyan',
+                        help="accent color : blue, cyan (default), red, "
+                             "green, orange, purple or #XXXXXX")
+    parser.add_argument('--compact', action='store_true',
+                        help="generate compact HTML")
+    parser.add_argument('--lazy-threshold', type=int,
+                        help="split the pages bigger than this size (bytes)")
+    parser.add_argument('--cache-dir', help="directory of the parse cache")
+    parser.add_argument('--include', action='append',
+                        help="glob pattern of the files to document "
+                             "(repeatable, default : *.py)")
+    parser.add_argument('--exclude', action='append',
+                        help="glob pattern of the files and directories not "
+                             "to document (repeatable)")
+
+    build = parser.add_argument_group('build options')
+    build.add_argument('--max-file-size', type=int,
+                       help="skip the files bigger than this size (bytes)")
+    build.add_argument('--gitignore', action='store_true',
+                       help="skip the files ignored by the .gitignore files")
+    build.add_argument('--page-budget', type=int,
+                       help="list the pages bigger than this size (bytes)")
+    build.add_argument('--time-budget', type=float,
+                       help="maximum extraction time of a file (seconds)")
+    build.add_argument('--memory-budget', type=int,
+                       help="maximum extraction memory of a file (bytes)")
+    build.add_argument('--shard', type=int, help="index of the shard to build")
+    build.add_argument('--of', type=int, default=1, help="number of shards")
+    build.add_argument('--cost-file',
+                       help="cost history used to balance the shards")
+    build.add_argument('--last-changed', action='store_true',
+                       help="show the last commit that changed each file")
+    build.add_argument('--dedupe', action='store_true',
+                       help="hard link the identical output files")
+    build.add_argument('--parallel-threshold', type=threshold,
+                       default=PARALLEL_THRESHOLD,
+                       help="render the files bigger than this size on "
+                            "several processes (bytes, default %d, 0 or "
+                            "none never does)" % PARALLEL_THRESHOLD)
+    build.add_argument('--plan', action='store_true',
+                       help="only print the pages to generate and the "
+                            "predicted time")
+    build.add_argument('--ir-file',
+                       help="export the extracted documentation in this file")
+    build.add_argument('--prefetch', action='store_true',
+                       help="add prefetch hints to the pages")
+    build.add_argument('--service-worker', action='store_true',
+                       help="write a caching service worker")
+    build.add_argument('--optimize-assets', action='store_true',
+                       help="minify the CSS and subset the font")
+
+    modes = parser.add_mutually_exclusive_group()
+    modes.add_argument('--serve', action='store_true',
+                       help="serve the documentation instead of building it")
+    modes.add_argument('--revisions', nargs='+', metavar='REVISION',
+                       help="build these git revisions")
+    modes.add_argument('--merge', nargs='+', metavar='SHARD_DIR',
+                       help="merge these shard directories")
+    modes.add_argument('--daemon', action='store_true',
+                       help="run a build daemon for the project")
+    modes.add_argument('--request', nargs='*', metavar='PATH',
+                       help="ask the daemon to build (only the pages of "
+                            "these files if they are given)")
+    modes.add_argument('--stop', action='store_true',
+                       help="stop the daemon")
+    parser.add_argument('--idle-timeout', type=float, default=600.,
+                        help="stop the daemon after this time without "
+                             "request (seconds, default 600)")
+    parser.add_argument('--output', help="output directory of --revisions")
+    parser.add_argument('--port', type=int, default=8000,
+                        help="port of --serve (default 8000)")
+    parser.add_argument('--host', default='127.0.0.1',
+                        help="address of --serve (default 127.0.0.1)")
+    args = parser.parse_args(argv)
+
+    name = args.name or os.path.basename(os.path.abspath(args.directory))
+    if args.serve:
+        serve_project(args.directory, name, args.github, args.color,
+                      port=args.port, host=args.host, compact=args.compact,
+                      cache_dir=args.cache_dir)
+    elif args.revisions:
+        html_for_revisions(args.directory, name, args.github, args.revisions,
+                           output=args.output, color=args.color,
+                           lazy_threshold=args.lazy_threshold,
+                           cache_dir=args.cache_dir, compact=args.compact,
+                           include=args.include, exclude=args.exclude,
+                           dedupe=args.dedupe)
+    elif args.merge:
+        merge_shards(args.directory, name, args.github, args.merge,
+                     color=args.color)
+    elif args.request is not None or args.stop:
+        try:
+            response = request_build(args.directory, args.request or (),
+                                     stop=args.stop)
+        except OSError:
+            raise SystemExit("No Docapy daemon is running for " +
+                             args.directory + " (start it with --daemon)")
+        print(response['output'], end='')
+        if not response['ok']:
+            raise SystemExit(1)
+    else:
+        options = dict(color=args.color, lazy_threshold=args.lazy_threshold,
+                       cache_dir=args.cache_dir, shard=args.shard,
+                       of=args.of, compact=args.compact,
+                       page_budget=args.page_budget,
+                       time_budget=args.time_budget,
+                       memory_budget=args.memory_budget,
+                       ir_file=args.ir_file, include=args.include,
+                       exclude=args.exclude,
+                       max_file_size=args.max_file_size,
+                       gitignore=args.gitignore, prefetch=args.prefetch,
+                       service_worker=args.service_worker,
+                       optimize_assets=args.optimize_assets,
+                       cost_file=args.cost_file, plan=args.plan,
+                       dedupe=args.dedupe, last_changed=args.last_changed,
+                       parallel_threshold=args.parallel_threshold)
+        if args.daemon:
+            run_daemon(args.directory, name, args.github,
+                       idle_timeout=args.idle_timeout, **options)
+        else:
+            html_for_project(args.directory, name, args.github, **options)
 
 
 # Main _______________________________________________________________________
 
 if __name__ == "__main__":
-    print("This file should not be run. To run Docapy, edit and run"
-          " 'edit_and_run_me.py' instead.\nFor more details, refer to the"
-          " documentation : https://teskann.github.io/docapy/")
+    main()
@@ -4,6 +4,11 @@ Created on Thu Oct  8 18:14:01 2020
 Author : Teskann
 
 Edit and run this file to run Docapy on your project !
+
+The  "docapy"  command  (installed  by  "pip install .", run "docapy --help")
+takes the same settings as command line options :
+
+    docapy path/to/project --name "Project" --github <link> --color cyan
 """
 
 if __name__ == "__main__":